@@ -0,0 +1,48 @@
+"""
+In-process token-bucket rate limiting.
+
+Used to bound how often expensive operations (such as launching a login
+browser) can be triggered for a single account.
+"""
+
+from __future__ import annotations
+
+import time
+from threading import Lock
+
+
+class TokenBucket:
+    """
+    A token bucket that refills lazily on each consume.
+
+    Args:
+        capacity: Maximum number of tokens the bucket can hold
+        rate_per_sec: Tokens added back per second
+    """
+
+    __slots__ = ("capacity", "rate_per_sec", "tokens", "last_refill", "_lock")
+
+    def __init__(self, capacity: float, rate_per_sec: float) -> None:
+        self.capacity = capacity
+        self.rate_per_sec = rate_per_sec
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = Lock()
+
+    def consume(self, tokens: float = 1) -> bool:
+        """Take tokens from the bucket, returning False if not enough remain."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.last_refill
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_per_sec)
+            self.last_refill = now
+            if self.tokens < tokens:
+                return False
+            self.tokens -= tokens
+            return True
+
+    def is_full(self) -> bool:
+        """Whether the bucket has refilled to capacity, i.e. is as good as new."""
+        with self._lock:
+            elapsed = time.monotonic() - self.last_refill
+            return self.tokens + elapsed * self.rate_per_sec >= self.capacity
@@ -0,0 +1,42 @@
+"""
+Process-wide runtime configuration for the API server.
+
+The CLI hands settings to the app through environment variables. They are
+read once into RuntimeConfig, and updated there when the server itself
+changes them (e.g. after a web login), so request handlers read plain
+attributes instead of os.environ.
+"""
+
+import os
+
+from ghinbox.auth import DEFAULT_ACCOUNT
+
+
+class RuntimeConfig:
+    """Module-level singleton holding server settings."""
+
+    test_mode: bool = False
+    needs_auth: bool = False
+    account: str = DEFAULT_ACCOUNT
+
+    @classmethod
+    def load_from_env(cls) -> None:
+        """Populate settings from the environment."""
+        cls.test_mode = os.environ.get("GHINBOX_TEST_MODE") == "1"
+        cls.needs_auth = os.environ.get("GHINBOX_NEEDS_AUTH") == "1"
+        cls.account = os.environ.get("GHSIM_ACCOUNT", DEFAULT_ACCOUNT)
+
+    @classmethod
+    def mark_authenticated(cls, account: str) -> None:
+        """Record a completed login for account.
+
+        The environment is updated too, so child processes and code that
+        still reads it directly see the same values.
+        """
+        cls.needs_auth = False
+        cls.account = account
+        os.environ.pop("GHINBOX_NEEDS_AUTH", None)
+        os.environ["GHSIM_ACCOUNT"] = account
+
+
+RuntimeConfig.load_from_env()
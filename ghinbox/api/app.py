@@ -10,15 +10,21 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
+from ghinbox.api._runtime_config import RuntimeConfig
 from ghinbox.api.routes import router as notifications_router
 from ghinbox.api.github_proxy import router as github_proxy_router
-from ghinbox.api.login_routes import router as login_router
+from ghinbox.api.login_routes import (
+    router as login_router,
+    shutdown_provision_executor,
+)
+from ghinbox.api.login_fetcher import (
+    prewarm_pool as prewarm_login_browser_pool,
+    shutdown_pool as shutdown_login_browser_pool,
+)
 from ghinbox.api.fetcher import (
-    NotificationsFetcher,
-    set_fetcher,
-    get_fetcher,
-    run_fetcher_call,
-    shutdown_fetcher_executor,
+    NotificationsFetcherPool,
+    set_fetcher_pool,
+    get_fetcher_pool,
 )
 
 
@@ -44,21 +50,28 @@ def _get_webapp_dir() -> Path | None:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize fetcher on startup if account is configured."""
+    # Pick up the settings the CLI placed in the environment
+    RuntimeConfig.load_from_env()
     account = os.environ.get("GHSIM_ACCOUNT")
     if account:
         headless = os.environ.get("GHSIM_HEADLESS", "1") == "1"
-        fetcher = NotificationsFetcher(account=account, headless=headless)
-        set_fetcher(fetcher)
+        set_fetcher_pool(NotificationsFetcherPool(account=account, headless=headless))
+
+    # The web login page will be needed right away, so have browser
+    # contexts parked on GitHub's login form before the first request
+    if os.environ.get("GHINBOX_NEEDS_AUTH") == "1":
+        prewarm_login_browser_pool()
 
     yield
 
-    # Cleanup on shutdown - must run in thread pool because Playwright's
-    # sync API cannot be called from a different thread than it started in
-    fetcher = get_fetcher()
-    if fetcher:
-        await run_fetcher_call(fetcher.stop)
-        set_fetcher(None)
-    shutdown_fetcher_executor()
+    # Cleanup on shutdown - each fetcher stops on the thread it started in,
+    # since Playwright's sync API cannot be called from any other
+    pool = get_fetcher_pool()
+    if pool:
+        await pool.stop()
+        set_fetcher_pool(None)
+    shutdown_provision_executor()
+    await shutdown_login_browser_pool()
 
 
 # Static files directory for the webapp
@@ -114,14 +127,14 @@ async def root():
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    from ghinbox.api.fetcher import get_fetcher
+    from ghinbox.api.fetcher import get_fetcher_pool
 
-    fetcher = get_fetcher()
+    pool = get_fetcher_pool()
     return {
         "status": "ok",
         "test_mode": os.environ.get("GHINBOX_TEST_MODE") == "1",
-        "live_fetching": fetcher is not None,
-        "account": fetcher.account if fetcher else None,
+        "live_fetching": pool is not None,
+        "account": pool.account if pool else None,
     }
 
 
@@ -5,17 +5,101 @@ Fetches notifications HTML from GitHub using an authenticated browser session.
 """
 
 import asyncio
+import functools
 import html
 import time
 import urllib.parse
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Concatenate, ParamSpec, TypeVar
 
-from playwright.sync_api import sync_playwright, BrowserContext
+from playwright.sync_api import BrowserContext, Error, Page, Route, sync_playwright
 
 from ghinbox.auth import create_authenticated_context
 
+# Requests a page never needs when only its HTML is read
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+_MEDIA_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+_BLOCKED_HOSTS = frozenset({"collector.github.com"})  # Analytics beacons
+
+
+# Chromium switches for long-running fetch browsers: keep memory flat and
+# don't throttle pages that are never shown
+BROWSER_LAUNCH_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-backgrounding-occluded-windows",
+    "--renderer-process-limit=2",
+]
+
+
+def block_non_essential_requests(route: Route) -> None:
+    """Route handler that aborts images, media, fonts, CSS and analytics."""
+    request = route.request
+    if (
+        request.resource_type in _BLOCKED_RESOURCE_TYPES
+        or urllib.parse.urlsplit(request.url).hostname in _BLOCKED_HOSTS
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def block_media_requests(route: Route) -> None:
+    """Route handler that aborts images, media, fonts and analytics, keeping CSS.
+
+    For pages that are clicked through, which need layout but not pixels.
+    """
+    request = route.request
+    if (
+        request.resource_type in _MEDIA_RESOURCE_TYPES
+        or urllib.parse.urlsplit(request.url).hostname in _BLOCKED_HOSTS
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+# The <main> element holds everything the parser reads (items, pagination and
+# the action forms' tokens) at about half the size of the full document
+MAIN_HTML_JS = (
+    "() => (document.querySelector('main') || document.documentElement).outerHTML"
+)
+
+
+# True once the HTML parser has moved past </main>, i.e. some node follows
+# <main> or one of its ancestors, or once parsing has finished outright.
+# Lets a fetch read <main> without waiting for DOMContentLoaded, which
+# GitHub's deferred scripts hold back.
+MAIN_PARSED_JS = """
+() => {
+    if (document.readyState !== "loading") return true;
+    const main = document.querySelector("main");
+    for (let node = main; node && node !== document.body; node = node.parentNode) {
+        if (node.nextSibling) return true;
+    }
+    return false;
+}
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def _repo_notifications_base_url(owner: str, repo: str) -> str:
+    query = urllib.parse.quote(f"repo:{owner}/{repo}")
+    return f"https://github.com/notifications?query={query}"
+
+
+def build_notifications_url(
+    owner: str, repo: str, before: str | None = None, after: str | None = None
+) -> str:
+    """Return the notifications page URL for a repository and page cursors."""
+    base = _repo_notifications_base_url(owner, repo)
+    params = urllib.parse.urlencode(
+        {key: value for key, value in (("before", before), ("after", after)) if value}
+    )
+    return f"{base}&{params}" if params else base
+
 
 @dataclass
 class FetchResult:
@@ -43,20 +127,27 @@ class NotificationsFetcher:
 
     This class manages a persistent browser context for an authenticated
     GitHub session, allowing multiple fetches without re-authenticating.
+    Pages are kept open between fetches and reused, up to max_idle_pages.
     """
 
-    def __init__(self, account: str, headless: bool = True):
+    max_idle_pages = 4
+
+    def __init__(self, account: str, headless: bool = True, full_page: bool = False):
         """
         Initialize the fetcher.
 
         Args:
             account: The ghinbox account name (must have valid auth state)
             headless: Whether to run browser in headless mode
+            full_page: Return the whole document rather than its <main>
+                element, e.g. when saving pages for inspection
         """
         self.account = account
         self.headless = headless
+        self.full_page = full_page
         self._playwright: Any = None
         self._context: BrowserContext | None = None
+        self._idle_pages: list[Page] = []
 
     def start(self) -> None:
         """Start the browser and create authenticated context."""
@@ -65,7 +156,10 @@ class NotificationsFetcher:
 
         self._playwright = sync_playwright().start()
         self._context = create_authenticated_context(
-            self._playwright, self.account, headless=self.headless
+            self._playwright,
+            self.account,
+            headless=self.headless,
+            launch_args=BROWSER_LAUNCH_ARGS,
         )
 
         if self._context is None:
@@ -73,16 +167,73 @@ class NotificationsFetcher:
                 f"Failed to create authenticated context for '{self.account}'. "
                 f"Run: python -m ghinbox.auth {self.account}"
             )
+        # Fetches only read the HTML; form POSTs go through context.request,
+        # which isn't routed
+        self._context.route("**/*", block_non_essential_requests)
 
     def stop(self) -> None:
         """Stop the browser and clean up."""
-        if self._context and self._context.browser:
-            self._context.browser.close()
+        self._idle_pages.clear()
+        if self._context is not None:
+            browser = self._context.browser
+            # Close pages and the context explicitly so no renderer outlives
+            # the fetcher, then the browser itself
+            try:
+                for page in list(self._context.pages):
+                    page.close()
+                self._context.close()
+            except Error:
+                pass  # Already gone with a crashed browser
+            if browser:
+                browser.close()
         if self._playwright:
             self._playwright.stop()
         self._context = None
         self._playwright = None
 
+    def _acquire_page(self) -> tuple[Page, bool]:
+        """Take an idle page from the pool, or open a new one.
+
+        Returns:
+            The page, and whether it was reused from the pool
+        """
+        assert self._context is not None
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            # Pages can be closed under us (crash, or by hand when headed)
+            if not page.is_closed():
+                return page, True
+        return self._context.new_page(), False
+
+    def _release_page(self, page: Page) -> None:
+        """Return a page to the pool, closing it if the pool is full."""
+        if len(self._idle_pages) < self.max_idle_pages:
+            self._idle_pages.append(page)
+        else:
+            page.close()
+
+    def fetch_many(
+        self, requests: list[tuple[str, str, str | None, str | None]]
+    ) -> list[FetchResult]:
+        """
+        Fetch notifications for several repositories.
+
+        Playwright's sync API can only be driven from the thread that started
+        it, so requests run one after another on the calling thread; the
+        saving comes from reusing pooled pages rather than opening a tab each.
+
+        Args:
+            requests: (owner, repo, before, after) tuples, as for
+                fetch_repo_notifications
+
+        Returns:
+            One FetchResult per request, in order
+        """
+        return [
+            self.fetch_repo_notifications(owner, repo, before=before, after=after)
+            for owner, repo, before, after in requests
+        ]
+
     def fetch_repo_notifications(
         self,
         owner: str,
@@ -107,29 +258,37 @@ class NotificationsFetcher:
 
         assert self._context is not None
 
-        # Build URL
-        query = f"repo:{owner}/{repo}"
-        url = f"https://github.com/notifications?query={urllib.parse.quote(query)}"
-
-        if before:
-            url += f"&before={urllib.parse.quote(before)}"
-        if after:
-            url += f"&after={urllib.parse.quote(after)}"
+        url = build_notifications_url(owner, repo, before=before, after=after)
 
-        timing: dict[str, int] = {}
+        timing: dict[str, int | bool] = {}
         page = None
 
         try:
             t0 = time.perf_counter()
-            page = self._context.new_page()
-            timing["new_page_ms"] = int((time.perf_counter() - t0) * 1000)
-
+            page, reused = self._acquire_page()
+            if reused:
+                timing["reused"] = True
+            else:
+                timing["new_page_ms"] = int((time.perf_counter() - t0) * 1000)
+
+            # A full page is only complete at DOMContentLoaded; <main> alone
+            # can be read as soon as it has been parsed
+            wait_until = "domcontentloaded" if self.full_page else "commit"
             t0 = time.perf_counter()
-            page.goto(url, wait_until="domcontentloaded")
+            try:
+                page.goto(url, wait_until=wait_until)
+            except Error:
+                if not (reused and page.is_closed()):
+                    raise
+                # The pooled page died while idle; retry once on a fresh one
+                page = self._context.new_page()
+                page.goto(url, wait_until=wait_until)
             timing["goto_ms"] = int((time.perf_counter() - t0) * 1000)
 
             # Wait for either notifications or empty state to be in DOM
             t0 = time.perf_counter()
+            if not self.full_page:
+                page.wait_for_function(MAIN_PARSED_JS, timeout=10000)
             page.locator(".notifications-list-item, .blankslate").first.wait_for(
                 state="attached",
                 timeout=10000,
@@ -137,11 +296,11 @@ class NotificationsFetcher:
             timing["wait_for_ms"] = int((time.perf_counter() - t0) * 1000)
 
             t0 = time.perf_counter()
-            html = page.content()
+            html = page.content() if self.full_page else page.evaluate(MAIN_HTML_JS)
             timing["content_ms"] = int((time.perf_counter() - t0) * 1000)
 
             t0 = time.perf_counter()
-            page.close()
+            self._release_page(page)
             timing["close_ms"] = int((time.perf_counter() - t0) * 1000)
 
             return FetchResult(html=html, url=url, timing=timing)
@@ -266,29 +425,86 @@ class NotificationsFetcher:
         self.stop()
 
 
-# Single-thread executor to keep Playwright sync API on one thread.
-_fetch_executor = ThreadPoolExecutor(max_workers=1)
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+@dataclass
+class _PoolMember:
+    """A pooled fetcher and the one thread allowed to drive it."""
+
+    fetcher: NotificationsFetcher
+    executor: ThreadPoolExecutor
+
+
+class NotificationsFetcherPool:
+    """
+    A fixed number of NotificationsFetchers for one account.
+
+    Playwright's sync API is bound to the thread that started it, so each
+    fetcher gets its own single-thread executor and every call to it runs
+    there.  That also means each fetcher drives its own Chromium process
+    (a sync-API browser cannot be shared with another thread), costing
+    typically 100-300 MB of memory apiece once started, so keep size small.
+    Fetchers start their browser on first use; idle ones are handed out
+    most-recently-used first, so light traffic keeps one browser warm and
+    only concurrent requests start more.
+    """
 
+    def __init__(self, account: str, size: int = 2, headless: bool = True):
+        self.account = account
+        self.headless = headless
+        self._members = [
+            _PoolMember(
+                NotificationsFetcher(account=account, headless=headless),
+                ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"fetcher{i}"),
+            )
+            for i in range(size)
+        ]
+        self._idle: asyncio.LifoQueue[_PoolMember] = asyncio.LifoQueue()
+        for member in reversed(self._members):
+            self._idle.put_nowait(member)
 
-async def run_fetcher_call(func, *args, **kwargs):
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(_fetch_executor, lambda: func(*args, **kwargs))
+    async def run(
+        self,
+        func: Callable[Concatenate[NotificationsFetcher, _P], _T],
+        *args: _P.args,
+        **kwargs: _P.kwargs,
+    ) -> _T:
+        """
+        Call func(fetcher, *args, **kwargs) on an idle fetcher's thread.
 
+        func is typically an unbound method, e.g.
+        NotificationsFetcher.fetch_repo_notifications.  Waits for a fetcher
+        if all of them are busy.
+        """
+        member = await self._idle.get()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                member.executor, lambda: func(member.fetcher, *args, **kwargs)
+            )
+        finally:
+            self._idle.put_nowait(member)
 
-def shutdown_fetcher_executor() -> None:
-    _fetch_executor.shutdown(wait=False)
+    async def stop(self) -> None:
+        """Stop every fetcher on its own thread and shut the threads down."""
+        loop = asyncio.get_running_loop()
+        for member in self._members:
+            await loop.run_in_executor(member.executor, member.fetcher.stop)
+            member.executor.shutdown(wait=False)
 
 
-# Global fetcher instance (set by server on startup)
-_global_fetcher: NotificationsFetcher | None = None
+# Global fetcher pool (set by server on startup)
+_global_fetcher_pool: NotificationsFetcherPool | None = None
 
 
-def get_fetcher() -> NotificationsFetcher | None:
-    """Get the global fetcher instance."""
-    return _global_fetcher
+def get_fetcher_pool() -> NotificationsFetcherPool | None:
+    """Get the global fetcher pool."""
+    return _global_fetcher_pool
 
 
-def set_fetcher(fetcher: NotificationsFetcher | None) -> None:
-    """Set the global fetcher instance."""
-    global _global_fetcher
-    _global_fetcher = fetcher
+def set_fetcher_pool(pool: NotificationsFetcherPool | None) -> None:
+    """Set the global fetcher pool."""
+    global _global_fetcher_pool
+    _global_fetcher_pool = pool
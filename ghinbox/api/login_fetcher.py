@@ -9,11 +9,25 @@ Uses Playwright's async API to work properly with FastAPI's asyncio event loop.
 
 import asyncio
 import logging
+import os
+import re
+import tempfile
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Error as PlaywrightError,
+    Locator,
+    Page,
+    Playwright,
+    Route,
+    StorageState,
+    TimeoutError as PlaywrightTimeoutError,
+)
 
 from ghinbox.auth import (
     AUTH_STATE_DIR,
@@ -23,6 +37,116 @@ from ghinbox.auth import (
 
 logger = logging.getLogger(__name__)
 
+LOGIN_URL = "https://github.com/login"
+
+# Resolved once; tempfile.gettempdir() probes the filesystem on first call
+_SCREENSHOT_DIR = tempfile.gettempdir()
+_DEBUG_SCREENSHOTS = os.environ.get("GHINBOX_DEBUG_SCREENSHOTS") == "1"
+
+# Selectors probed by LoginFetcher.detect_page_state.  They are checked in a
+# single page.evaluate() call rather than one count() round-trip apiece.
+USER_MENU_SELECTOR = 'button[aria-label="Open user navigation menu"]'
+CAPTCHA_SELECTORS = (
+    'iframe[src*="captcha"]',
+    'iframe[src*="recaptcha"]',
+    'div[class*="captcha"]',
+    "#captcha-container",
+)
+MOBILE_2FA_SELECTORS = (
+    "[data-target='sudo-credential-options.mobileOption']",
+    "button[data-action*='mobile']",
+    ".js-mobile-credential-option",
+)
+MOBILE_LINK_SELECTOR = "a[href*='two-factor/mobile']"
+SECURITY_KEY_SELECTOR = 'button[data-action="click:webauthn-get#start"]'
+APP_OTP_SELECTOR = 'input[name="app_otp"], input[id="app_totp"]'
+SMS_OTP_SELECTOR = 'input[name="sms_otp"]'
+GENERIC_OTP_SELECTOR = 'input[type="text"][autocomplete="one-time-code"]'
+FLASH_ERROR_SELECTOR = ".flash-error"
+# A flash error with actual text; 2FA pages may carry an empty one
+MOBILE_FAILURE_SELECTOR = FLASH_ERROR_SELECTOR + ':text-matches("\\S")'
+ERROR_SELECTORS = (
+    ".js-flash-alert",
+    "#js-flash-container .flash",
+)
+OTP_SELECTORS = (APP_OTP_SELECTOR, SMS_OTP_SELECTOR, GENERIC_OTP_SELECTOR)
+LOGIN_INPUT_SELECTOR = 'input[name="login"], input#login_field'
+PASSWORD_INPUT_SELECTOR = 'input[name="password"], input#password'
+USER_LOGIN_META_SELECTOR = 'meta[name="user-login"]'
+
+# Username hints available on any logged-in GitHub page
+_USERNAME_PROBE_JS = """() => {
+    const img = document.querySelector(
+        'button[aria-label="Open user navigation menu"] img'
+    );
+    const meta = document.querySelector('meta[name="user-login"]');
+    return {
+        alt: img ? img.getAttribute("alt") : null,
+        meta: meta ? meta.getAttribute("content") : null,
+    };
+}"""
+
+# Elements that may hold the GitHub Mobile verification digits, joined into
+# one compound selector so they can be read with a single call.
+VERIFICATION_CODE_SELECTOR = ", ".join(
+    (
+        ".js-verification-code",
+        "[data-target='device-verification.number']",
+        ".verification-code",
+        ".auth-form-body strong",
+        ".Box-body strong",
+        # Large numbers that look like verification codes
+        "div.text-center strong",
+        ".flash strong",
+    )
+)
+_TWO_DIGIT_RE = re.compile(r"\b(\d{2})\b")
+
+DETECTION_SELECTORS = (
+    USER_MENU_SELECTOR,
+    *CAPTCHA_SELECTORS,
+    *MOBILE_2FA_SELECTORS,
+    MOBILE_LINK_SELECTOR,
+    SECURITY_KEY_SELECTOR,
+    APP_OTP_SELECTOR,
+    SMS_OTP_SELECTOR,
+    GENERIC_OTP_SELECTOR,
+    FLASH_ERROR_SELECTOR,
+    *ERROR_SELECTORS,
+    LOGIN_INPUT_SELECTOR,
+    PASSWORD_INPUT_SELECTOR,
+)
+
+# Matches as soon as the page shows anything detect_page_state can classify
+_ANY_STATE_SELECTOR = ", ".join(DETECTION_SELECTORS)
+# Matches once the page shows anything other than a pending mobile 2FA
+# prompt: approval, rejection, captcha, another 2FA method or the login form.
+# The pending page may carry an empty flash error, so only a non-empty one
+# counts.
+_MOBILE_RESOLVED_SELECTOR = (
+    ", ".join(
+        selector
+        for selector in DETECTION_SELECTORS
+        if selector not in MOBILE_2FA_SELECTORS
+        and selector not in (MOBILE_LINK_SELECTOR, FLASH_ERROR_SELECTOR)
+    )
+    + f", {MOBILE_FAILURE_SELECTOR}"
+)
+SETTLE_TIMEOUT_MS = 2000
+
+# For each selector, the first match's textContent ("" if empty), or null if
+# nothing matches.
+_PROBE_SELECTORS_JS = """(selectors) => selectors.map((s) => {
+    const el = document.querySelector(s);
+    return el === null ? null : (el.textContent || "");
+})"""
+
+# Checks the rendered text for 2FA wording without shipping the page HTML back.
+_HAS_2FA_TEXT_JS = """() => {
+    const text = (document.body ? document.body.innerText : "").toLowerCase();
+    return text.includes("two-factor") || text.includes("authentication code");
+}"""
+
 
 class PageState(Enum):
     """Detected state of the current page."""
@@ -46,6 +170,27 @@ class PageStateResult:
     error_message: str | None = None
     twofa_method: str | None = None  # 'app', 'sms', or 'mobile'
     verification_code: str | None = None  # Digits to confirm on mobile device
+    verification_selector: str | None = None  # Selector of the 2FA code input
+
+
+async def _first_attr(locator: Locator, name: str) -> str | None:
+    """Return an attribute of the first match, or None, in one round-trip.
+
+    Unlike locator.first.get_attribute(), this doesn't wait for a match, so
+    no separate count() check is needed.
+    """
+    return await locator.evaluate_all(
+        "(els, name) => (els.length ? els[0].getAttribute(name) : null)", name
+    )
+
+
+async def _username_from_current_page(page: Page) -> str | None:
+    """Read the username from the user menu or meta tag without navigating."""
+    found = await page.evaluate(_USERNAME_PROBE_JS)
+    alt = found["alt"]
+    if alt and alt.startswith("@"):
+        return alt[1:]  # Remove the @ prefix
+    return found["meta"] or None
 
 
 async def extract_username_async(page: Page) -> str | None:
@@ -58,38 +203,176 @@ async def extract_username_async(page: Page) -> str | None:
     Returns:
         The username or None if it couldn't be extracted
     """
-    # Method 1: Look for the username in the user menu button
-    user_button = page.locator('button[aria-label="Open user navigation menu"]')
-    if await user_button.count() > 0:
-        # The username is often in the image alt or nearby elements
-        img = user_button.locator("img")
-        if await img.count() > 0:
-            alt = await img.get_attribute("alt")
-            if alt and alt.startswith("@"):
-                return alt[1:]  # Remove the @ prefix
-
-    # Method 2: Navigate to profile and extract from URL
-    await page.goto("https://github.com/settings/profile")
-    await page.wait_for_load_state("domcontentloaded")
-
-    # Method 3: Get it from the meta tag or page content
-    # GitHub has a meta tag with the user login
-    meta = page.locator('meta[name="user-login"]')
-    if await meta.count() > 0:
-        content = await meta.get_attribute("content")
-        if content:
-            return content
+    # Methods 1 and 2: the user menu avatar alt text and the user-login meta
+    # tag, read from the current page
+    username = await _username_from_current_page(page)
+    if username:
+        return username
+
+    # Method 3: Navigate to the profile settings page and read the meta tag
+    await page.goto("https://github.com/settings/profile", wait_until="commit")
+    try:
+        await page.wait_for_selector(
+            USER_LOGIN_META_SELECTOR, state="attached", timeout=10000
+        )
+    except PlaywrightTimeoutError:
+        # Fall through to the profile-link method once the DOM is ready
+        await page.wait_for_load_state("domcontentloaded")
+
+    content = await _first_attr(page.locator(USER_LOGIN_META_SELECTOR), "content")
+    if content:
+        return content
 
     # Method 4: Parse from the profile URL link
-    profile_link = page.locator('a[href^="/"]:has-text("Your profile")')
-    if await profile_link.count() > 0:
-        href = await profile_link.get_attribute("href")
-        if href and href.startswith("/"):
-            return href[1:]  # Remove the leading /
+    href = await _first_attr(
+        page.locator('a[href^="/"]:has-text("Your profile")'), "href"
+    )
+    if href and href.startswith("/"):
+        return href[1:]  # Remove the leading /
 
     return None
 
 
+# Shared Playwright driver and browser.  Launching Chromium dominates the
+# latency of a login, so every LoginFetcher opens its own (cheap, isolated)
+# BrowserContext on one long-lived browser instead.
+_pw_singleton: Playwright | None = None
+_browser_singleton: Browser | None = None
+_pool_lock = asyncio.Lock()
+
+
+async def _get_shared_browser() -> Browser:
+    """Return the shared headless browser, launching it on first use."""
+    global _pw_singleton, _browser_singleton
+    async with _pool_lock:
+        if _browser_singleton is not None and _browser_singleton.is_connected():
+            return _browser_singleton
+        if _pw_singleton is None:
+            _pw_singleton = await async_playwright().start()
+        logger.info("Starting headless browser for GitHub login")
+        _browser_singleton = await _pw_singleton.chromium.launch(headless=True)
+        return _browser_singleton
+
+
+# The login, 2FA and user-menu checks only need the HTML and scripts, so
+# skip images, fonts, media and analytics beacons.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_BLOCKED_URL_MARKERS = ("collector.github.com",)
+
+
+async def _block_nonessential_requests(route: Route) -> None:
+    """Route handler that aborts requests the login flow doesn't need."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+        marker in request.url for marker in _BLOCKED_URL_MARKERS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _open_login_page() -> tuple[BrowserContext, Page]:
+    """Open a fresh context on the shared browser, parked on the login form."""
+    browser = await _get_shared_browser()
+    context = await browser.new_context(viewport={"width": 1280, "height": 800})
+    try:
+        await context.route("**/*", _block_nonessential_requests)
+        page = await context.new_page()
+        logger.info("Navigating to %s", LOGIN_URL)
+        # Only the login form matters, so don't wait for the rest of the page
+        await page.goto(LOGIN_URL, wait_until="commit")
+        await page.wait_for_selector(LOGIN_INPUT_SELECTOR, timeout=10000)
+    except Exception:
+        await context.close()
+        raise
+    return context, page
+
+
+# Contexts that have already loaded the login page, so a new login can skip
+# the navigation entirely.  Entries older than WARM_PAGE_MAX_AGE are dropped
+# because GitHub's login form carries a CSRF token that eventually expires.
+WARM_POOL_SIZE = 2
+WARM_PAGE_MAX_AGE = 600.0  # seconds
+_warm_pool: asyncio.Queue[tuple[float, BrowserContext, Page]] = asyncio.Queue(
+    maxsize=WARM_POOL_SIZE
+)
+_warm_refill_task: asyncio.Task[None] | None = None
+
+
+async def _refill_warm_pool() -> None:
+    """Top up the warm pool in the background."""
+    while not _warm_pool.full():
+        try:
+            context, page = await _open_login_page()
+        except Exception as e:
+            logger.warning("Failed to pre-warm login page: %s", e)
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            _warm_pool.put_nowait((loop.time(), context, page))
+        except asyncio.QueueFull:
+            await context.close()
+            return
+
+
+def _schedule_warm_pool_refill() -> None:
+    """Start a refill task unless one is already running."""
+    global _warm_refill_task
+    if _warm_refill_task is None or _warm_refill_task.done():
+        _warm_refill_task = asyncio.create_task(_refill_warm_pool())
+
+
+def prewarm_pool() -> None:
+    """Start filling the warm pool so the first login skips browser startup.
+
+    Must be called from a running event loop (e.g. an app lifespan).
+    """
+    _schedule_warm_pool_refill()
+
+
+async def _acquire_login_page() -> tuple[BrowserContext, Page]:
+    """Take a warm login page from the pool, or open one inline if none is ready."""
+    now = asyncio.get_running_loop().time()
+    try:
+        while True:
+            created_at, context, page = _warm_pool.get_nowait()
+            if now - created_at <= WARM_PAGE_MAX_AGE and not page.is_closed():
+                logger.debug("Using pre-warmed login page")
+                break
+            await context.close()
+    except asyncio.QueueEmpty:
+        context, page = await _open_login_page()
+    _schedule_warm_pool_refill()
+    return context, page
+
+
+async def shutdown_pool() -> None:
+    """Close the shared browser and Playwright driver (call at process exit)."""
+    global _pw_singleton, _browser_singleton, _warm_refill_task
+    if _warm_refill_task is not None:
+        _warm_refill_task.cancel()
+        _warm_refill_task = None
+    while not _warm_pool.empty():
+        _, context, _ = _warm_pool.get_nowait()
+        try:
+            await context.close()
+        except Exception:
+            pass
+    async with _pool_lock:
+        if _browser_singleton is not None:
+            try:
+                await _browser_singleton.close()
+            except Exception:
+                pass
+            _browser_singleton = None
+        if _pw_singleton is not None:
+            try:
+                await _pw_singleton.stop()
+            except Exception:
+                pass
+            _pw_singleton = None
+
+
 class LoginFetcher:
     """
     Handles headless GitHub login using Playwright (async version).
@@ -100,54 +383,67 @@ class LoginFetcher:
 
     def __init__(self):
         """Initialize the login fetcher."""
-        self._playwright: Any = None
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
         self._page: Page | None = None
+        # Locators keyed by selector string, reused across detection polls.
+        # Cleared whenever the page navigates to a new document.
+        self._loc_cache: dict[str, Locator] = {}
+        # Most recent detect_page_state() result
+        self._last_state: PageStateResult | None = None
+
+    def _loc(self, selector: str) -> Locator:
+        """Return a cached locator for selector on the current page."""
+        assert self._page is not None
+        locator = self._loc_cache.get(selector)
+        if locator is None:
+            locator = self._page.locator(selector)
+            self._loc_cache[selector] = locator
+        return locator
 
     async def start(self) -> None:
-        """Start the browser and navigate to GitHub login."""
-        if self._playwright is not None:
+        """Open a context on the shared browser and navigate to GitHub login."""
+        if self._context is not None:
             logger.debug("Browser already started, skipping")
             return
 
-        logger.info("Starting headless browser for GitHub login")
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(headless=True)
-        self._context = await self._browser.new_context(
-            viewport={"width": 1280, "height": 800},
-        )
-        self._page = await self._context.new_page()
-        logger.info("Navigating to https://github.com/login")
-        await self._page.goto("https://github.com/login", wait_until="domcontentloaded")
+        self._browser = await _get_shared_browser()
+        self._context, self._page = await _acquire_login_page()
+        self._loc_cache.clear()
         logger.info("GitHub login page loaded, current URL: %s", self._page.url)
 
     async def close(self) -> None:
-        """Close the browser and clean up."""
+        """Close this fetcher's page and context.
+
+        The shared browser stays up for other fetchers; see shutdown_pool().
+        """
         if self._page:
             try:
                 await self._page.close()
             except Exception:
                 pass
             self._page = None
+            self._loc_cache.clear()
         if self._context:
             try:
                 await self._context.close()
             except Exception:
                 pass
             self._context = None
-        if self._browser:
-            try:
-                await self._browser.close()
-            except Exception:
-                pass
-            self._browser = None
-        if self._playwright:
-            try:
-                await self._playwright.stop()
-            except Exception:
-                pass
-            self._playwright = None
+        self._browser = None
+
+    async def _wait_for_settle(self, page: Page) -> None:
+        """Wait (bounded) for any element detect_page_state looks for.
+
+        Replaces a fixed sleep after navigation: returns as soon as the page
+        is classifiable, and gives up quietly after SETTLE_TIMEOUT_MS.
+        """
+        try:
+            await page.wait_for_selector(
+                _ANY_STATE_SELECTOR, state="attached", timeout=SETTLE_TIMEOUT_MS
+            )
+        except PlaywrightTimeoutError:
+            logger.debug("No state element appeared within %dms", SETTLE_TIMEOUT_MS)
 
     async def save_debug_screenshot(self, name: str = "debug") -> str | None:
         """Save a screenshot for debugging purposes.
@@ -155,17 +451,18 @@ class LoginFetcher:
         Args:
             name: Name prefix for the screenshot file
 
+        Screenshots are only taken when GHINBOX_DEBUG_SCREENSHOTS=1 or debug
+        logging is enabled, since encoding a PNG is expensive.
+
         Returns:
-            Path to the saved screenshot, or None if failed
+            Path to the saved screenshot, or None if skipped or failed
         """
         if self._page is None:
             return None
+        if not _DEBUG_SCREENSHOTS and not logger.isEnabledFor(logging.DEBUG):
+            return None
         try:
-            import os
-            import tempfile
-
-            screenshot_dir = tempfile.gettempdir()
-            screenshot_path = os.path.join(screenshot_dir, f"ghinbox_login_{name}.png")
+            screenshot_path = os.path.join(_SCREENSHOT_DIR, f"ghinbox_login_{name}.png")
             await self._page.screenshot(path=screenshot_path)
             logger.warning("Saved debug screenshot to: %s", screenshot_path)
             return screenshot_path
@@ -182,48 +479,28 @@ class LoginFetcher:
             The verification code string, or None if not found
         """
         try:
-            # GitHub shows the verification digits in various ways
-            # Try common selectors for the verification code
-            code_selectors = [
-                ".js-verification-code",
-                "[data-target='device-verification.number']",
-                ".verification-code",
-                ".auth-form-body strong",
-                ".Box-body strong",
-                # Try finding large numbers that look like verification codes
-                "div.text-center strong",
-                ".flash strong",
-            ]
-
-            for selector in code_selectors:
-                element = page.locator(selector)
-                count = await element.count()
-                if count > 0:
-                    text = await element.first.text_content()
-                    if text:
-                        # Extract just the digits
-                        digits = "".join(c for c in text if c.isdigit())
-                        if len(digits) >= 2:
-                            logger.debug(
-                                "Found verification code '%s' using selector: %s",
-                                digits,
-                                selector,
-                            )
-                            return digits
+            # GitHub shows the verification digits in various ways; fetch the
+            # text of every candidate element in one round-trip
+            texts = await self._loc(VERIFICATION_CODE_SELECTOR).all_text_contents()
+            for text in texts:
+                # Extract just the digits
+                digits = "".join(c for c in text if c.isdigit())
+                if len(digits) >= 2:
+                    logger.debug("Found verification code '%s'", digits)
+                    return digits
 
             # Fallback: try to find any prominent number on the page
             # Look for text containing just digits (2-3 digits typical)
-            body_text = await page.locator("body").text_content() or ""
-            import re
+            body_text = await self._loc("body").text_content() or ""
 
-            # Find standalone 2-digit numbers (typical for GitHub Mobile)
-            matches = re.findall(r"\b(\d{2})\b", body_text)
-            if matches:
-                # Return the first match (most likely the verification code)
+            # Find the first standalone 2-digit number (typical for GitHub
+            # Mobile); it is most likely the verification code
+            match = _TWO_DIGIT_RE.search(body_text)
+            if match:
                 logger.debug(
-                    "Found potential verification code via regex: %s", matches[0]
+                    "Found potential verification code via regex: %s", match.group(1)
                 )
-                return matches[0]
+                return match.group(1)
 
             logger.warning("Could not find verification code on mobile 2FA page")
             return None
@@ -239,33 +516,37 @@ class LoginFetcher:
         Returns:
             PageStateResult with the detected state and any error message
         """
+        result = await self._detect_page_state()
+        self._last_state = result
+        return result
+
+    async def _detect_page_state(self) -> PageStateResult:
+        """Classify the current page; see detect_page_state()."""
         if self._page is None:
             logger.warning("detect_page_state called but page is None")
             return PageStateResult(state=PageState.UNKNOWN)
 
         page = self._page
         current_url = page.url
-        logger.warning("Detecting page state, current URL: %s", current_url)
+        logger.debug("Detecting page state, current URL: %s", current_url)
 
         try:
+            # The selector probe and the 2FA text check are independent, so
+            # run both browser round-trips concurrently
+            probes, has_2fa_text = await asyncio.gather(
+                page.evaluate(_PROBE_SELECTORS_JS, list(DETECTION_SELECTORS)),
+                page.evaluate(_HAS_2FA_TEXT_JS),
+            )
+            hits: dict[str, str | None] = dict(zip(DETECTION_SELECTORS, probes))
+
             # Check if logged in (user menu button present)
-            user_menu = page.locator('button[aria-label="Open user navigation menu"]')
-            user_menu_count = await user_menu.count()
-            logger.debug("User menu button count: %d", user_menu_count)
-            if user_menu_count > 0:
+            if hits[USER_MENU_SELECTOR] is not None:
                 logger.info("Detected LOGGED_IN state (user menu found)")
                 return PageStateResult(state=PageState.LOGGED_IN)
 
             # Check for CAPTCHA
-            captcha_indicators = [
-                'iframe[src*="captcha"]',
-                'iframe[src*="recaptcha"]',
-                'div[class*="captcha"]',
-                "#captcha-container",
-            ]
-            for selector in captcha_indicators:
-                count = await page.locator(selector).count()
-                if count > 0:
+            for selector in CAPTCHA_SELECTORS:
+                if hits[selector] is not None:
                     logger.warning("Detected CAPTCHA (selector: %s)", selector)
                     return PageStateResult(
                         state=PageState.CAPTCHA,
@@ -277,11 +558,11 @@ class LoginFetcher:
 
             # GitHub Mobile 2FA - check by URL or page elements
             if "two-factor/mobile" in current_url:
-                logger.warning("Detected TWOFA_MOBILE via URL")
+                logger.info("Detected TWOFA_MOBILE via URL")
                 # Extract the verification code (digits to confirm on device)
                 verification_code = await self._extract_mobile_verification_code(page)
                 if verification_code:
-                    logger.warning("Mobile verification code: %s", verification_code)
+                    logger.info("Mobile verification code: %s", verification_code)
                 return PageStateResult(
                     state=PageState.TWOFA_MOBILE,
                     twofa_method="mobile",
@@ -290,14 +571,8 @@ class LoginFetcher:
 
             # Also check for mobile 2FA by looking for specific elements
             # GitHub mobile auth page typically has "Check your device" or similar text
-            mobile_indicators = [
-                "[data-target='sudo-credential-options.mobileOption']",
-                "button[data-action*='mobile']",
-                ".js-mobile-credential-option",
-            ]
-            for selector in mobile_indicators:
-                count = await page.locator(selector).count()
-                if count > 0:
+            for selector in MOBILE_2FA_SELECTORS:
+                if hits[selector] is not None:
                     logger.warning(
                         "Detected TWOFA_MOBILE via element selector: %s", selector
                     )
@@ -313,11 +588,9 @@ class LoginFetcher:
                 or "two-factor/security" in current_url
             ):
                 # Check if there's a link to use mobile instead
-                mobile_link = page.locator("a[href*='two-factor/mobile']")
-                mobile_link_count = await mobile_link.count()
-                if mobile_link_count > 0:
+                if hits[MOBILE_LINK_SELECTOR] is not None:
                     # Get the href and navigate directly (more reliable than clicking)
-                    href = await mobile_link.first.get_attribute("href")
+                    href = await _first_attr(self._loc(MOBILE_LINK_SELECTOR), "href")
                     if href:
                         # Build full URL if it's relative
                         if href.startswith("/"):
@@ -326,9 +599,21 @@ class LoginFetcher:
                             "On security key page, navigating to mobile 2FA: %s", href
                         )
                         await page.goto(href, wait_until="domcontentloaded")
-                        await asyncio.sleep(0.5)
-                        # Re-detect the page state
-                        return await self.detect_page_state()
+                        self._loc_cache.clear()
+                        await self._wait_for_settle(page)
+                        # We know where we landed; no need to re-run detection
+                        verification_code = (
+                            await self._extract_mobile_verification_code(page)
+                        )
+                        if verification_code:
+                            logger.info(
+                                "Mobile verification code: %s", verification_code
+                            )
+                        return PageStateResult(
+                            state=PageState.TWOFA_MOBILE,
+                            twofa_method="mobile",
+                            verification_code=verification_code,
+                        )
 
                 logger.warning("Detected TWOFA_SECURITY_KEY via URL (not supported)")
                 await self.save_debug_screenshot("security_key_2fa")
@@ -339,12 +624,7 @@ class LoginFetcher:
                 )
 
             # Also check by button selector
-            security_key_btn = page.locator(
-                'button[data-action="click:webauthn-get#start"]'
-            )
-            security_key_count = await security_key_btn.count()
-            logger.debug("Security key button count: %d", security_key_count)
-            if security_key_count > 0:
+            if hits[SECURITY_KEY_SELECTOR] is not None:
                 logger.warning("Detected TWOFA_SECURITY_KEY via button (not supported)")
                 return PageStateResult(
                     state=PageState.TWOFA_SECURITY_KEY,
@@ -354,59 +634,49 @@ class LoginFetcher:
 
             # Check for authenticator app 2FA
             # Look for OTP input or TOTP-related elements
-            otp_input = page.locator('input[name="app_otp"], input[id="app_totp"]')
-            otp_input_count = await otp_input.count()
-            logger.debug("OTP input (app_otp/app_totp) count: %d", otp_input_count)
-            if otp_input_count > 0:
+            if hits[APP_OTP_SELECTOR] is not None:
                 logger.info("Detected TWOFA_APP state")
                 return PageStateResult(
                     state=PageState.TWOFA_APP,
                     twofa_method="app",
+                    verification_selector=APP_OTP_SELECTOR,
                 )
 
             # Alternative 2FA detection via page content
-            page_text = (await page.content()).lower()
-            has_2fa_text = (
-                "two-factor" in page_text or "authentication code" in page_text
-            )
             logger.debug("Page contains 2FA text: %s", has_2fa_text)
             if has_2fa_text:
                 # Check for SMS option
-                sms_input = page.locator('input[name="sms_otp"]')
-                sms_count = await sms_input.count()
-                logger.debug("SMS OTP input count: %d", sms_count)
-                if sms_count > 0:
+                if hits[SMS_OTP_SELECTOR] is not None:
                     logger.info("Detected TWOFA_SMS state")
                     return PageStateResult(
                         state=PageState.TWOFA_SMS,
                         twofa_method="sms",
+                        verification_selector=SMS_OTP_SELECTOR,
                     )
 
                 # Generic 2FA input
-                otp_inputs = page.locator(
-                    'input[type="text"][autocomplete="one-time-code"]'
-                )
-                generic_otp_count = await otp_inputs.count()
-                logger.debug("Generic OTP input count: %d", generic_otp_count)
-                if generic_otp_count > 0:
+                if hits[GENERIC_OTP_SELECTOR] is not None:
                     logger.info("Detected TWOFA_APP state (via generic OTP input)")
                     return PageStateResult(
                         state=PageState.TWOFA_APP,
                         twofa_method="app",
+                        verification_selector=GENERIC_OTP_SELECTOR,
                     )
 
             # Check for login error (flash error message)
             # Only treat as error if there's actual error text
-            flash_error = page.locator(".flash-error")
-            flash_error_count = await flash_error.count()
-            logger.debug("Flash error count: %d", flash_error_count)
-            if flash_error_count > 0:
-                error_text = await flash_error.first.text_content()
-                error_msg = (error_text or "").strip()
+            error_text = hits[FLASH_ERROR_SELECTOR]
+            if error_text is not None:
+                error_msg = error_text.strip()
                 # Only treat as error if there's actual text content
                 if error_msg:
-                    error_html = await flash_error.first.inner_html()
-                    logger.warning("Flash error HTML: %s", error_html)
+                    # The text already came back with the selector probe; the
+                    # markup is only worth another round-trip when debugging
+                    if logger.isEnabledFor(logging.DEBUG):
+                        error_html = await self._loc(
+                            FLASH_ERROR_SELECTOR
+                        ).first.inner_html()
+                        logger.debug("Flash error HTML: %s", error_html)
                     logger.warning("Flash error text: '%s'", error_text)
                     await self.save_debug_screenshot("login_error")
                     logger.warning("Detected LOGIN_ERROR: %s", error_msg)
@@ -419,48 +689,37 @@ class LoginFetcher:
 
             # Also check for other error patterns on GitHub login page
             # Sometimes errors appear in different elements
-            error_selectors = [
-                ".js-flash-alert",
-                "#js-flash-container .flash",
-            ]
-            for selector in error_selectors:
-                error_el = page.locator(selector)
-                count = await error_el.count()
-                if count > 0:
-                    error_text = await error_el.first.text_content()
-                    if error_text and error_text.strip():
-                        logger.warning(
-                            "Detected error via selector '%s': %s",
-                            selector,
-                            error_text.strip(),
-                        )
-                        return PageStateResult(
-                            state=PageState.LOGIN_ERROR,
-                            error_message=error_text.strip(),
-                        )
+            for selector in ERROR_SELECTORS:
+                error_text = hits[selector]
+                if error_text and error_text.strip():
+                    logger.warning(
+                        "Detected error via selector '%s': %s",
+                        selector,
+                        error_text.strip(),
+                    )
+                    return PageStateResult(
+                        state=PageState.LOGIN_ERROR,
+                        error_message=error_text.strip(),
+                    )
 
             # Check if on login form
-            login_input = page.locator('input[name="login"], input#login_field')
-            password_input = page.locator('input[name="password"], input#password')
-            login_count = await login_input.count()
-            password_count = await password_input.count()
-            logger.debug(
-                "Login form inputs - login: %d, password: %d",
-                login_count,
-                password_count,
-            )
-            if login_count > 0 and password_count > 0:
+            if (
+                hits[LOGIN_INPUT_SELECTOR] is not None
+                and hits[PASSWORD_INPUT_SELECTOR] is not None
+            ):
                 logger.info("Detected LOGIN_FORM state")
                 return PageStateResult(state=PageState.LOGIN_FORM)
 
             # Unknown state - log page content for debugging
-            logger.warning(
-                "UNKNOWN page state. URL: %s, Title: %s",
-                page.url,
-                await page.title(),
-            )
+            # The body text is only logged at debug level, so only fetch it then
+            if logger.isEnabledFor(logging.DEBUG):
+                title, body_text = await asyncio.gather(
+                    page.title(), self._loc("body").text_content()
+                )
+            else:
+                title, body_text = await page.title(), None
+            logger.warning("UNKNOWN page state. URL: %s, Title: %s", page.url, title)
             # Log a snippet of the page content for debugging
-            body_text = await page.locator("body").text_content()
             if body_text:
                 logger.debug("Page body text (first 500 chars): %s", body_text[:500])
             await self.save_debug_screenshot("unknown_state")
@@ -498,14 +757,10 @@ class LoginFetcher:
         try:
             # Wait for and fill login form
             logger.debug("Waiting for login input field...")
-            await page.wait_for_selector(
-                'input[name="login"], input#login_field', timeout=10000
-            )
+            await page.wait_for_selector(LOGIN_INPUT_SELECTOR, timeout=10000)
 
-            login_input = page.locator('input[name="login"], input#login_field').first
-            password_input = page.locator(
-                'input[name="password"], input#password'
-            ).first
+            login_input = self._loc(LOGIN_INPUT_SELECTOR).first
+            password_input = self._loc(PASSWORD_INPUT_SELECTOR).first
 
             logger.debug("Filling username field")
             await login_input.fill(username)
@@ -513,7 +768,7 @@ class LoginFetcher:
             await password_input.fill(password)
 
             # Submit the form
-            submit_button = page.locator(
+            submit_button = self._loc(
                 'input[type="submit"][value="Sign in"], button[type="submit"]'
             ).first
             logger.debug("Clicking submit button")
@@ -524,8 +779,8 @@ class LoginFetcher:
             await page.wait_for_load_state("domcontentloaded", timeout=30000)
             logger.debug("Page loaded, URL after submission: %s", page.url)
 
-            # Give the page a moment to settle
-            await asyncio.sleep(0.5)
+            # Wait until the page shows something we can classify
+            await self._wait_for_settle(page)
 
             # Detect the resulting state
             logger.debug("Detecting resulting page state...")
@@ -544,12 +799,17 @@ class LoginFetcher:
                 error_message=f"Error submitting credentials: {e}",
             )
 
-    async def submit_2fa_code(self, code: str) -> PageStateResult:
+    async def submit_2fa_code(
+        self, code: str, state: PageStateResult | None = None
+    ) -> PageStateResult:
         """
         Submit a 2FA code (authenticator app or SMS).
 
         Args:
             code: The 6-8 digit 2FA code
+            state: Page state that identified the 2FA page; defaults to the
+                most recent detect_page_state() result.  Its
+                verification_selector saves re-scanning for the input.
 
         Returns:
             PageStateResult with the resulting state after submission
@@ -567,25 +827,17 @@ class LoginFetcher:
 
         try:
             # Find the OTP input field
-            otp_selectors = [
-                'input[name="app_otp"]',
-                'input[id="app_totp"]',
-                'input[name="sms_otp"]',
-                'input[type="text"][autocomplete="one-time-code"]',
-            ]
-
-            otp_input = None
-            found_selector = None
-            for selector in otp_selectors:
-                locator = page.locator(selector)
-                count = await locator.count()
-                logger.debug("OTP selector '%s' count: %d", selector, count)
-                if count > 0:
-                    otp_input = locator.first
-                    found_selector = selector
-                    break
-
-            if otp_input is None:
+            if state is None:
+                state = self._last_state
+            found_selector = state.verification_selector if state else None
+            if found_selector is None:
+                probes = await page.evaluate(_PROBE_SELECTORS_JS, list(OTP_SELECTORS))
+                found_selector = next(
+                    (sel for sel, hit in zip(OTP_SELECTORS, probes) if hit is not None),
+                    None,
+                )
+
+            if found_selector is None:
                 logger.error("Could not find any 2FA input field")
                 return PageStateResult(
                     state=PageState.UNKNOWN,
@@ -593,13 +845,14 @@ class LoginFetcher:
                 )
 
             logger.debug("Found 2FA input using selector: %s", found_selector)
+            otp_input = self._loc(found_selector).first
 
             # Fill and submit
             await otp_input.fill(code)
             logger.debug("Filled 2FA code")
 
             # Look for verify/submit button
-            submit_button = page.locator(
+            submit_button = self._loc(
                 'button[type="submit"], input[type="submit"]'
             ).first
             logger.debug("Clicking 2FA submit button")
@@ -610,8 +863,8 @@ class LoginFetcher:
             await page.wait_for_load_state("domcontentloaded", timeout=30000)
             logger.debug("Page loaded, URL after 2FA: %s", page.url)
 
-            # Give the page a moment to settle
-            await asyncio.sleep(0.5)
+            # Wait until the page shows something we can classify
+            await self._wait_for_settle(page)
 
             # Detect the resulting state
             result = await self.detect_page_state()
@@ -629,73 +882,53 @@ class LoginFetcher:
                 error_message=f"Error submitting 2FA code: {e}",
             )
 
-    async def wait_for_mobile_approval(
-        self, timeout_seconds: int = 120, poll_interval: float = 2.0
-    ) -> PageStateResult:
+    async def poll_mobile_approval(self) -> PageStateResult:
         """
-        Wait for GitHub Mobile 2FA approval.
+        Check once, without waiting, whether mobile 2FA has been resolved.
 
-        Polls the page state until login is successful or timeout.
-
-        Args:
-            timeout_seconds: Maximum time to wait for approval (default 2 minutes)
-            poll_interval: Time between polls in seconds
+        A single locator count covers the common still-pending case; the
+        full page classification only runs once the page shows something
+        else. A page that cannot be classified yet (e.g. mid-navigation)
+        counts as still pending.
 
         Returns:
-            PageStateResult with the final state
+            PageStateResult with TWOFA_MOBILE while still pending
         """
-        logger.info(
-            "Waiting for mobile 2FA approval (timeout: %ds, poll interval: %.1fs)",
-            timeout_seconds,
-            poll_interval,
-        )
-
         if self._page is None:
-            logger.error("Browser not started, cannot wait for mobile approval")
             return PageStateResult(
                 state=PageState.UNKNOWN,
                 error_message="Browser not started",
             )
 
-        start_time = asyncio.get_event_loop().time()
-        poll_count = 0
-
-        while True:
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > timeout_seconds:
-                logger.warning(
-                    "Mobile 2FA approval timed out after %ds", timeout_seconds
-                )
-                await self.save_debug_screenshot("mobile_2fa_timeout")
-                return PageStateResult(
-                    state=PageState.TWOFA_MOBILE,
-                    error_message=f"Mobile approval timed out after {timeout_seconds} seconds. Please try again.",
-                    twofa_method="mobile",
-                )
-
-            poll_count += 1
-            logger.debug("Mobile 2FA poll #%d (elapsed: %.1fs)", poll_count, elapsed)
-
-            # Check current page state
+        try:
+            resolved = await self._loc(_MOBILE_RESOLVED_SELECTOR).count()
+        except PlaywrightError as e:
+            # Approval navigates the page, which can destroy the execution
+            # context mid-count; the next poll sees the new page
+            logger.debug("Mobile approval check interrupted: %s", e)
+            resolved = 0
+        if resolved:
             result = await self.detect_page_state()
-
-            if result.state == PageState.LOGGED_IN:
-                logger.info("Mobile 2FA approved - now logged in!")
+            if result.state != PageState.UNKNOWN:
                 return result
+        return PageStateResult(state=PageState.TWOFA_MOBILE, twofa_method="mobile")
 
-            if result.state == PageState.LOGIN_ERROR:
-                logger.warning("Mobile 2FA failed with error: %s", result.error_message)
-                return result
+    async def _scrape_username(self, storage_state: StorageState) -> str | None:
+        """Extract the username from a throwaway JavaScript-disabled context.
 
-            if result.state not in (PageState.TWOFA_MOBILE, PageState.UNKNOWN):
-                # Unexpected state change
-                logger.warning(
-                    "Unexpected state during mobile 2FA wait: %s", result.state.value
-                )
-                return result
-
-            # Wait before next poll
-            await asyncio.sleep(poll_interval)
+        The profile page's user-login meta tag is server-rendered, so there
+        is no need to download and run GitHub's scripts just to read it.
+        """
+        assert self._browser is not None
+        context = await self._browser.new_context(
+            storage_state=storage_state, java_script_enabled=False
+        )
+        try:
+            await context.route("**/*", _block_nonessential_requests)
+            page = await context.new_page()
+            return await extract_username_async(page)
+        finally:
+            await context.close()
 
     async def save_auth_state(self, account: str) -> tuple[bool, str | None]:
         """
@@ -715,22 +948,30 @@ class LoginFetcher:
         try:
             # Ensure we're on a GitHub page with full session
             logger.debug("Navigating to github.com to ensure full session")
-            await self._page.goto("https://github.com", wait_until="domcontentloaded")
-            await asyncio.sleep(0.5)
+            await self._page.goto("https://github.com", wait_until="commit")
+            self._loc_cache.clear()
+            try:
+                await self._page.wait_for_selector(
+                    USER_MENU_SELECTOR, state="attached", timeout=10000
+                )
+            except PlaywrightTimeoutError:
+                await self._page.wait_for_load_state("domcontentloaded")
+
+            # Save browser storage state
+            AUTH_STATE_DIR.mkdir(parents=True, exist_ok=True)
+            auth_path = get_auth_state_path(account)
+            logger.info("Saving storage state to: %s", auth_path)
+            storage_state = await self._context.storage_state(path=str(auth_path))
 
             # Extract username
             logger.debug("Extracting username from page")
-            username = await extract_username_async(self._page)
+            username = await _username_from_current_page(self._page)
+            if username is None:
+                username = await self._scrape_username(storage_state)
             logger.info("Extracted username: %s", username)
             if username:
                 save_username(account, username)
 
-            # Save browser storage state
-            AUTH_STATE_DIR.mkdir(parents=True, exist_ok=True)
-            auth_path = get_auth_state_path(account)
-            logger.info("Saving storage state to: %s", auth_path)
-            await self._context.storage_state(path=str(auth_path))
-
             logger.info("Auth state saved successfully")
             return True, username
 
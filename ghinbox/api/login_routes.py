@@ -4,35 +4,155 @@ FastAPI route handlers for GitHub authentication.
 Provides endpoints for headless GitHub login flow with web-served forms.
 """
 
+import asyncio
 import logging
-from typing import Literal
-
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-
+import os
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Literal
+
+import pydantic_core
+from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict
+
+from ghinbox.api._ratelimit import TokenBucket
+from ghinbox.api._runtime_config import RuntimeConfig
 from ghinbox.api.login_state import (
+    LoginSession,
     LoginState,
+    SessionLimitError,
     get_session_manager,
 )
-from ghinbox.api.login_fetcher import LoginFetcher, PageState
+from ghinbox.api.fetcher import (
+    NotificationsFetcherPool,
+    get_fetcher_pool,
+    set_fetcher_pool,
+)
+from ghinbox.api.login_fetcher import LoginFetcher, PageState, PageStateResult
+from ghinbox.auth import get_auth_state_path, has_valid_auth
+from ghinbox.token import has_token, provision_token
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/auth", tags=["authentication"])
+
+class _FastJSONResponse(JSONResponse):
+    """JSONResponse that encodes with pydantic-core's Rust serializer."""
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
+
+
+router = APIRouter(
+    prefix="/auth",
+    tags=["authentication"],
+    default_response_class=_FastJSONResponse,
+)
+
+# LoginSessionManager is a process-wide singleton, so look it up once
+_session_manager = get_session_manager()
+
+# The UI polls /needs-login, so briefly cache the on-disk auth/token checks.
+# Entries are dropped whenever a login completes or auth is reloaded.
+_AUTH_TTL = 10.0  # seconds
+_auth_cache: dict[str, tuple[float, bool]] = {}
+_token_cache: dict[str, tuple[float, bool]] = {}
+
+
+def _cached_check(
+    cache: dict[str, tuple[float, bool]],
+    check: Callable[[str], bool],
+    account: str,
+) -> bool:
+    """Return check(account), reusing a result younger than _AUTH_TTL."""
+    now = time.monotonic()
+    cached = cache.get(account)
+    if cached is not None and now - cached[0] < _AUTH_TTL:
+        return cached[1]
+    result = check(account)
+    cache[account] = (now, result)
+    return result
+
+
+# Token provisioning drives a browser for several seconds; keep it off the
+# default executor that FastAPI uses for sync endpoints and dependencies.
+_provision_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="ghinbox-provision"
+)
+
+
+def shutdown_provision_executor() -> None:
+    _provision_executor.shutdown(wait=False)
+
+
+# Every login session launches a browser context, so limit how often a single
+# account can start one: bursts of 3, then one more every 30 seconds.
+# Accounts are client-supplied, so the table is bounded: full buckets (no
+# different from fresh ones) are dropped first, then the least recently used.
+_LOGIN_BUCKETS: OrderedDict[str, TokenBucket] = OrderedDict()
+_MAX_LOGIN_BUCKETS = 1024
+
+
+def _login_bucket(account: str) -> TokenBucket:
+    """Get the account's login bucket, creating it and pruning if needed."""
+    bucket = _LOGIN_BUCKETS.get(account)
+    if bucket is not None:
+        _LOGIN_BUCKETS.move_to_end(account)
+        return bucket
+    if len(_LOGIN_BUCKETS) >= _MAX_LOGIN_BUCKETS:
+        for key in [k for k, b in _LOGIN_BUCKETS.items() if b.is_full()]:
+            del _LOGIN_BUCKETS[key]
+        while len(_LOGIN_BUCKETS) >= _MAX_LOGIN_BUCKETS:
+            _LOGIN_BUCKETS.popitem(last=False)
+    bucket = _LOGIN_BUCKETS[account] = TokenBucket(3, 1 / 30)
+    return bucket
+
+
+def _check_login_rate(account: str) -> None:
+    """Raise 429 if the account has exhausted its login attempts.
+
+    Charged once per login attempt, when its session starts.
+    """
+    if not _login_bucket(account).consume(1):
+        logger.warning("Login rate limit exceeded for account: %s", account)
+        raise HTTPException(status_code=429, detail="Too many login attempts")
+
+
+# Only used for messages; memoized here rather than in ghinbox.auth so the
+# CLI keeps resolving AUTH_STATE_DIR at call time
+_cached_auth_state_path = lru_cache(maxsize=32)(get_auth_state_path)
+
+
+def _invalidate_auth_cache(account: str) -> None:
+    """Forget cached auth/token checks for an account."""
+    _auth_cache.pop(account, None)
+    _token_cache.pop(account, None)
 
 
 # Request/Response Models
 
+# Request bodies are parsed once and only read afterwards
+_REQUEST_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
 
 class LoginStartRequest(BaseModel):
     """Request to start a new login session."""
 
+    model_config = _REQUEST_CONFIG
+
     account: str = "default"
 
 
 class LoginCredentialsRequest(BaseModel):
     """Request to submit credentials."""
 
+    model_config = _REQUEST_CONFIG
+
     session_id: str
     username: str
     password: str
@@ -41,6 +161,8 @@ class LoginCredentialsRequest(BaseModel):
 class Login2FARequest(BaseModel):
     """Request to submit 2FA code."""
 
+    model_config = _REQUEST_CONFIG
+
     session_id: str
     code: str
 
@@ -48,22 +170,29 @@ class Login2FARequest(BaseModel):
 class LoginCancelRequest(BaseModel):
     """Request to cancel a login session."""
 
+    model_config = _REQUEST_CONFIG
+
     session_id: str
 
 
+LoginStatus = Literal[
+    "initialized",
+    "submitting",
+    "waiting_2fa",
+    "waiting_mobile",
+    "success",
+    "error",
+    "captcha",
+]
+
+
 class LoginResponse(BaseModel):
     """Response from login endpoints."""
 
+    model_config = ConfigDict(frozen=True)
+
     session_id: str
-    status: Literal[
-        "initialized",
-        "submitting",
-        "waiting_2fa",
-        "waiting_mobile",
-        "success",
-        "error",
-        "captcha",
-    ]
+    status: LoginStatus
     message: str | None = None
     error: str | None = None
     username: str | None = None
@@ -71,6 +200,44 @@ class LoginResponse(BaseModel):
     verification_code: str | None = None  # Digits to confirm on mobile device
 
 
+# Response builders. These responses are assembled from trusted values, so
+# skip per-field validation with model_construct.
+
+
+def _resp_success(session_id: str, username: str | None) -> LoginResponse:
+    return LoginResponse.model_construct(
+        session_id=session_id,
+        status="success",
+        username=username,
+        message="Login successful",
+    )
+
+
+def _resp_error(session_id: str, error: str) -> LoginResponse:
+    return LoginResponse.model_construct(
+        session_id=session_id, status="error", error=error
+    )
+
+
+def _resp_waiting_2fa(session_id: str, method: str | None) -> LoginResponse:
+    return LoginResponse.model_construct(
+        session_id=session_id,
+        status="waiting_2fa",
+        twofa_method=method,
+        message="Enter your 2FA code",
+    )
+
+
+def _resp_waiting_mobile(session_id: str, code: str | None) -> LoginResponse:
+    return LoginResponse.model_construct(
+        session_id=session_id,
+        status="waiting_mobile",
+        twofa_method="mobile",
+        verification_code=code,
+        message="Approve the login request on your GitHub Mobile app",
+    )
+
+
 # Endpoints
 
 
@@ -80,7 +247,9 @@ class LoginResponse(BaseModel):
     summary="Start a login session",
     description="Create a new login session and prepare for credential input.",
 )
-async def start_login(request: LoginStartRequest) -> LoginResponse:
+async def start_login(
+    request: LoginStartRequest, background_tasks: BackgroundTasks
+) -> LoginResponse:
     """
     Start a new login session.
 
@@ -88,7 +257,20 @@ async def start_login(request: LoginStartRequest) -> LoginResponse:
     and returns a session ID for subsequent requests.
     """
     logger.info("Starting login session for account: %s", request.account)
-    manager = get_session_manager()
+    _check_login_rate(request.account)
+    manager = _session_manager
+
+    # Each session holds a browser context, so cap how many can exist
+    try:
+        evicted = manager.evict_if_full()
+    except SessionLimitError as e:
+        logger.warning("Refusing new login session: %s", e)
+        raise HTTPException(
+            status_code=503,
+            detail="Too many login sessions in progress, try again later",
+        )
+    for old_fetcher in evicted:
+        background_tasks.add_task(_safe_close, old_fetcher)
 
     # Create the session
     session = manager.create_session(request.account)
@@ -102,7 +284,7 @@ async def start_login(request: LoginStartRequest) -> LoginResponse:
         manager.set_fetcher(session.session_id, fetcher)
         logger.info("Login session ready: %s", session.session_id)
 
-        return LoginResponse(
+        return LoginResponse.model_construct(
             session_id=session.session_id,
             status="initialized",
             message="Ready for credentials",
@@ -116,11 +298,168 @@ async def start_login(request: LoginStartRequest) -> LoginResponse:
             LoginState.ERROR,
             error_message=str(e),
         )
-        return LoginResponse(
-            session_id=session.session_id,
-            status="error",
-            error=f"Failed to start login session: {e}",
+        return _resp_error(session.session_id, f"Failed to start login session: {e}")
+
+
+# Handlers for the page state reached after submitting credentials
+
+
+async def _complete_login(
+    session_id: str, session: LoginSession, fetcher: LoginFetcher
+) -> LoginResponse:
+    """Save auth state for a logged-in session and build the final response."""
+    logger.info("Login successful, saving auth state")
+    success, username = await fetcher.save_auth_state(session.account)
+    _invalidate_auth_cache(session.account)
+    if success:
+        _session_manager.update_state(
+            session_id,
+            LoginState.SUCCESS,
+            username=username,
         )
+        logger.info("Auth state saved, username: %s", username)
+        return _resp_success(session_id, username)
+    else:
+        logger.error("Failed to save auth state")
+        _session_manager.update_state(
+            session_id,
+            LoginState.ERROR,
+            error_message="Failed to save auth state",
+        )
+        return _resp_error(session_id, "Failed to save auth state")
+
+
+async def _credentials_logged_in(
+    session_id: str,
+    session: LoginSession,
+    fetcher: LoginFetcher,
+    result: PageStateResult,
+) -> LoginResponse:
+    return await _complete_login(session_id, session, fetcher)
+
+
+async def _credentials_mobile(
+    session_id: str,
+    session: LoginSession,
+    fetcher: LoginFetcher,
+    result: PageStateResult,
+) -> LoginResponse:
+    logger.info(
+        "Mobile 2FA required - waiting for approval on device, code: %s",
+        result.verification_code,
+    )
+    _session_manager.update_state(
+        session_id,
+        LoginState.WAITING_MOBILE,
+        requires_2fa=True,
+        twofa_method="mobile",
+    )
+    return _resp_waiting_mobile(session_id, result.verification_code)
+
+
+async def _credentials_code_2fa(
+    session_id: str,
+    session: LoginSession,
+    fetcher: LoginFetcher,
+    result: PageStateResult,
+) -> LoginResponse:
+    logger.info("2FA required, method: %s", result.twofa_method)
+    _session_manager.update_state(
+        session_id,
+        LoginState.WAITING_2FA,
+        requires_2fa=True,
+        twofa_method=result.twofa_method,
+    )
+    return _resp_waiting_2fa(session_id, result.twofa_method)
+
+
+async def _credentials_security_key(
+    session_id: str,
+    session: LoginSession,
+    fetcher: LoginFetcher,
+    result: PageStateResult,
+) -> LoginResponse:
+    logger.warning("Security key 2FA detected (not supported)")
+    _session_manager.update_state(
+        session_id,
+        LoginState.ERROR,
+        error_message=result.error_message,
+    )
+    return _resp_error(
+        session_id,
+        result.error_message
+        or "Security key 2FA not supported. Please configure authenticator app.",
+    )
+
+
+async def _credentials_captcha(
+    session_id: str,
+    session: LoginSession,
+    fetcher: LoginFetcher,
+    result: PageStateResult,
+) -> LoginResponse:
+    logger.warning("CAPTCHA detected")
+    _session_manager.update_state(
+        session_id,
+        LoginState.CAPTCHA,
+        error_message=result.error_message,
+    )
+    return LoginResponse.model_construct(
+        session_id=session_id,
+        status="captcha",
+        error=result.error_message or "CAPTCHA required. Use --headed-login flag.",
+    )
+
+
+async def _credentials_login_error(
+    session_id: str,
+    session: LoginSession,
+    fetcher: LoginFetcher,
+    result: PageStateResult,
+) -> LoginResponse:
+    logger.warning("Login error: %s", result.error_message)
+    _session_manager.update_state(
+        session_id,
+        LoginState.ERROR,
+        error_message=result.error_message,
+    )
+    return _resp_error(session_id, result.error_message or "Login failed")
+
+
+async def _credentials_unknown(
+    session_id: str,
+    session: LoginSession,
+    fetcher: LoginFetcher,
+    result: PageStateResult,
+) -> LoginResponse:
+    logger.error(
+        "Unknown page state after credentials: %s, error: %s",
+        result.state.value,
+        result.error_message,
+    )
+    _session_manager.update_state(
+        session_id,
+        LoginState.ERROR,
+        error_message=result.error_message or "Unknown page state",
+    )
+    return _resp_error(
+        session_id, result.error_message or "Unknown page state after credentials"
+    )
+
+
+_CredentialsHandler = Callable[
+    [str, LoginSession, LoginFetcher, PageStateResult], Awaitable[LoginResponse]
+]
+
+_CREDENTIALS_HANDLERS: dict[PageState, _CredentialsHandler] = {
+    PageState.LOGGED_IN: _credentials_logged_in,
+    PageState.TWOFA_MOBILE: _credentials_mobile,
+    PageState.TWOFA_APP: _credentials_code_2fa,
+    PageState.TWOFA_SMS: _credentials_code_2fa,
+    PageState.TWOFA_SECURITY_KEY: _credentials_security_key,
+    PageState.CAPTCHA: _credentials_captcha,
+    PageState.LOGIN_ERROR: _credentials_login_error,
+}
 
 
 @router.post(
@@ -140,7 +479,7 @@ async def submit_credentials(request: LoginCredentialsRequest) -> LoginResponse:
         request.session_id,
         request.username,
     )
-    manager = get_session_manager()
+    manager = _session_manager
     session = manager.get_session(request.session_id)
 
     if session is None:
@@ -181,128 +520,8 @@ async def submit_credentials(request: LoginCredentialsRequest) -> LoginResponse:
         )
 
         # Map result to response
-        if result.state == PageState.LOGGED_IN:
-            # Success! Save auth state
-            logger.info("Login successful, saving auth state")
-            success, username = await fetcher.save_auth_state(session.account)
-            if success:
-                manager.update_state(
-                    request.session_id,
-                    LoginState.SUCCESS,
-                    username=username,
-                )
-                logger.info("Auth state saved, username: %s", username)
-                return LoginResponse(
-                    session_id=request.session_id,
-                    status="success",
-                    username=username,
-                    message="Login successful",
-                )
-            else:
-                logger.error("Failed to save auth state")
-                manager.update_state(
-                    request.session_id,
-                    LoginState.ERROR,
-                    error_message="Failed to save auth state",
-                )
-                return LoginResponse(
-                    session_id=request.session_id,
-                    status="error",
-                    error="Failed to save auth state",
-                )
-
-        elif result.state == PageState.TWOFA_MOBILE:
-            logger.info(
-                "Mobile 2FA required - waiting for approval on device, code: %s",
-                result.verification_code,
-            )
-            manager.update_state(
-                request.session_id,
-                LoginState.WAITING_MOBILE,
-                requires_2fa=True,
-                twofa_method="mobile",
-            )
-            return LoginResponse(
-                session_id=request.session_id,
-                status="waiting_mobile",
-                twofa_method="mobile",
-                verification_code=result.verification_code,
-                message="Approve the login request on your GitHub Mobile app",
-            )
-
-        elif result.state in (PageState.TWOFA_APP, PageState.TWOFA_SMS):
-            logger.info("2FA required, method: %s", result.twofa_method)
-            manager.update_state(
-                request.session_id,
-                LoginState.WAITING_2FA,
-                requires_2fa=True,
-                twofa_method=result.twofa_method,
-            )
-            return LoginResponse(
-                session_id=request.session_id,
-                status="waiting_2fa",
-                twofa_method=result.twofa_method,
-                message="Enter your 2FA code",
-            )
-
-        elif result.state == PageState.TWOFA_SECURITY_KEY:
-            logger.warning("Security key 2FA detected (not supported)")
-            manager.update_state(
-                request.session_id,
-                LoginState.ERROR,
-                error_message=result.error_message,
-            )
-            return LoginResponse(
-                session_id=request.session_id,
-                status="error",
-                error=result.error_message
-                or "Security key 2FA not supported. Please configure authenticator app.",
-            )
-
-        elif result.state == PageState.CAPTCHA:
-            logger.warning("CAPTCHA detected")
-            manager.update_state(
-                request.session_id,
-                LoginState.CAPTCHA,
-                error_message=result.error_message,
-            )
-            return LoginResponse(
-                session_id=request.session_id,
-                status="captcha",
-                error=result.error_message
-                or "CAPTCHA required. Use --headed-login flag.",
-            )
-
-        elif result.state == PageState.LOGIN_ERROR:
-            logger.warning("Login error: %s", result.error_message)
-            manager.update_state(
-                request.session_id,
-                LoginState.ERROR,
-                error_message=result.error_message,
-            )
-            return LoginResponse(
-                session_id=request.session_id,
-                status="error",
-                error=result.error_message or "Login failed",
-            )
-
-        else:
-            # Unknown state
-            logger.error(
-                "Unknown page state after credentials: %s, error: %s",
-                result.state.value,
-                result.error_message,
-            )
-            manager.update_state(
-                request.session_id,
-                LoginState.ERROR,
-                error_message=result.error_message or "Unknown page state",
-            )
-            return LoginResponse(
-                session_id=request.session_id,
-                status="error",
-                error=result.error_message or "Unknown page state after credentials",
-            )
+        handler = _CREDENTIALS_HANDLERS.get(result.state, _credentials_unknown)
+        return await handler(request.session_id, session, fetcher, result)
 
     except Exception as e:
         logger.exception("Error during credential submission: %s", e)
@@ -311,11 +530,7 @@ async def submit_credentials(request: LoginCredentialsRequest) -> LoginResponse:
             LoginState.ERROR,
             error_message=str(e),
         )
-        return LoginResponse(
-            session_id=request.session_id,
-            status="error",
-            error=f"Error during login: {e}",
-        )
+        return _resp_error(request.session_id, f"Error during login: {e}")
 
 
 @router.post(
@@ -330,7 +545,7 @@ async def submit_2fa(request: Login2FARequest) -> LoginResponse:
 
     Returns success or error.
     """
-    manager = get_session_manager()
+    manager = _session_manager
     session = manager.get_session(request.session_id)
 
     if session is None:
@@ -360,36 +575,12 @@ async def submit_2fa(request: Login2FARequest) -> LoginResponse:
         result = await fetcher.submit_2fa_code(request.code)
 
         if result.state == PageState.LOGGED_IN:
-            # Success! Save auth state
-            success, username = await fetcher.save_auth_state(session.account)
-            if success:
-                manager.update_state(
-                    request.session_id,
-                    LoginState.SUCCESS,
-                    username=username,
-                )
-                return LoginResponse(
-                    session_id=request.session_id,
-                    status="success",
-                    username=username,
-                    message="Login successful",
-                )
-            else:
-                manager.update_state(
-                    request.session_id,
-                    LoginState.ERROR,
-                    error_message="Failed to save auth state",
-                )
-                return LoginResponse(
-                    session_id=request.session_id,
-                    status="error",
-                    error="Failed to save auth state",
-                )
+            return await _complete_login(request.session_id, session, fetcher)
 
         elif result.state == PageState.LOGIN_ERROR:
             # Wrong 2FA code - stay in WAITING_2FA state for retry
             manager.update_state(request.session_id, LoginState.WAITING_2FA)
-            return LoginResponse(
+            return LoginResponse.model_construct(
                 session_id=request.session_id,
                 status="waiting_2fa",
                 error=result.error_message or "Invalid 2FA code, please try again",
@@ -401,10 +592,9 @@ async def submit_2fa(request: Login2FARequest) -> LoginResponse:
                 LoginState.ERROR,
                 error_message=result.error_message or "Unknown state after 2FA",
             )
-            return LoginResponse(
-                session_id=request.session_id,
-                status="error",
-                error=result.error_message or "Unknown state after 2FA submission",
+            return _resp_error(
+                request.session_id,
+                result.error_message or "Unknown state after 2FA submission",
             )
 
     except Exception as e:
@@ -413,16 +603,19 @@ async def submit_2fa(request: Login2FARequest) -> LoginResponse:
             LoginState.ERROR,
             error_message=str(e),
         )
-        return LoginResponse(
-            session_id=request.session_id,
-            status="error",
-            error=f"Error during 2FA: {e}",
-        )
+        return _resp_error(request.session_id, f"Error during 2FA: {e}")
+
+
+# Backoff bounds (seconds) for polling mobile 2FA approval
+_MOBILE_POLL_INITIAL_DELAY = 0.5
+_MOBILE_POLL_MAX_DELAY = 4.0
 
 
 class LoginMobileWaitRequest(BaseModel):
     """Request to wait for mobile 2FA approval."""
 
+    model_config = _REQUEST_CONFIG
+
     session_id: str
     timeout_seconds: int = 120
 
@@ -440,7 +633,7 @@ async def wait_for_mobile_2fa(request: LoginMobileWaitRequest) -> LoginResponse:
     This endpoint polls until the user approves on their device or timeout.
     """
     logger.info("Waiting for mobile 2FA approval, session: %s", request.session_id)
-    manager = get_session_manager()
+    manager = _session_manager
     session = manager.get_session(request.session_id)
 
     if session is None:
@@ -463,41 +656,32 @@ async def wait_for_mobile_2fa(request: LoginMobileWaitRequest) -> LoginResponse:
         )
 
     try:
-        # Wait for mobile approval (async polling)
-        result = await fetcher.wait_for_mobile_approval(
-            timeout_seconds=request.timeout_seconds
-        )
+        # Poll with capped exponential backoff so the request yields between
+        # cheap checks instead of parking in one long browser-side wait
+        deadline = time.monotonic() + request.timeout_seconds
+        delay = _MOBILE_POLL_INITIAL_DELAY
+        while True:
+            result = await fetcher.poll_mobile_approval()
+            if result.state != PageState.TWOFA_MOBILE:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                result = PageStateResult(
+                    state=PageState.TWOFA_MOBILE,
+                    error_message=f"Mobile approval timed out after {request.timeout_seconds} seconds. Please try again.",
+                    twofa_method="mobile",
+                )
+                break
+            sleep_for = min(delay, _MOBILE_POLL_MAX_DELAY) + random.uniform(0, 0.25)
+            await asyncio.sleep(min(sleep_for, remaining))
+            delay *= 1.5
 
         if result.state == PageState.LOGGED_IN:
-            # Success! Save auth state
-            success, username = await fetcher.save_auth_state(session.account)
-            if success:
-                manager.update_state(
-                    request.session_id,
-                    LoginState.SUCCESS,
-                    username=username,
-                )
-                return LoginResponse(
-                    session_id=request.session_id,
-                    status="success",
-                    username=username,
-                    message="Login successful",
-                )
-            else:
-                manager.update_state(
-                    request.session_id,
-                    LoginState.ERROR,
-                    error_message="Failed to save auth state",
-                )
-                return LoginResponse(
-                    session_id=request.session_id,
-                    status="error",
-                    error="Failed to save auth state",
-                )
+            return await _complete_login(request.session_id, session, fetcher)
 
         elif result.state == PageState.TWOFA_MOBILE:
             # Still waiting (timeout)
-            return LoginResponse(
+            return LoginResponse.model_construct(
                 session_id=request.session_id,
                 status="waiting_mobile",
                 twofa_method="mobile",
@@ -511,10 +695,8 @@ async def wait_for_mobile_2fa(request: LoginMobileWaitRequest) -> LoginResponse:
                 LoginState.ERROR,
                 error_message=result.error_message,
             )
-            return LoginResponse(
-                session_id=request.session_id,
-                status="error",
-                error=result.error_message or "Mobile 2FA failed",
+            return _resp_error(
+                request.session_id, result.error_message or "Mobile 2FA failed"
             )
 
         else:
@@ -523,10 +705,9 @@ async def wait_for_mobile_2fa(request: LoginMobileWaitRequest) -> LoginResponse:
                 LoginState.ERROR,
                 error_message=result.error_message or "Unexpected state",
             )
-            return LoginResponse(
-                session_id=request.session_id,
-                status="error",
-                error=result.error_message or "Unexpected state during mobile wait",
+            return _resp_error(
+                request.session_id,
+                result.error_message or "Unexpected state during mobile wait",
             )
 
     except Exception as e:
@@ -536,11 +717,22 @@ async def wait_for_mobile_2fa(request: LoginMobileWaitRequest) -> LoginResponse:
             LoginState.ERROR,
             error_message=str(e),
         )
-        return LoginResponse(
-            session_id=request.session_id,
-            status="error",
-            error=f"Error during mobile 2FA: {e}",
-        )
+        return _resp_error(request.session_id, f"Error during mobile 2FA: {e}")
+
+
+# Map session state to response status
+_STATUS_MAP: Mapping[LoginState, LoginStatus] = MappingProxyType(
+    {
+        LoginState.INITIALIZED: "initialized",
+        LoginState.SUBMITTING_CREDENTIALS: "submitting",
+        LoginState.WAITING_2FA: "waiting_2fa",
+        LoginState.WAITING_MOBILE: "waiting_mobile",
+        LoginState.SUBMITTING_2FA: "submitting",
+        LoginState.SUCCESS: "success",
+        LoginState.ERROR: "error",
+        LoginState.CAPTCHA: "captcha",
+    }
+)
 
 
 @router.get(
@@ -549,9 +741,9 @@ async def wait_for_mobile_2fa(request: LoginMobileWaitRequest) -> LoginResponse:
     summary="Check login status",
     description="Get the current status of a login session.",
 )
-async def get_login_status(session_id: str) -> LoginResponse:
+def get_login_status(session_id: str) -> LoginResponse:
     """Get the current status of a login session."""
-    manager = get_session_manager()
+    manager = _session_manager
     session = manager.get_session(session_id)
 
     if session is None:
@@ -560,36 +752,34 @@ async def get_login_status(session_id: str) -> LoginResponse:
             detail="Session not found or expired",
         )
 
-    # Map session state to response status
-    status_map = {
-        LoginState.INITIALIZED: "initialized",
-        LoginState.SUBMITTING_CREDENTIALS: "submitting",
-        LoginState.WAITING_2FA: "waiting_2fa",
-        LoginState.WAITING_MOBILE: "waiting_mobile",
-        LoginState.SUBMITTING_2FA: "submitting",
-        LoginState.SUCCESS: "success",
-        LoginState.ERROR: "error",
-        LoginState.CAPTCHA: "captcha",
-    }
-
-    return LoginResponse(
+    return LoginResponse.model_construct(
         session_id=session.session_id,
-        status=status_map.get(session.state, "error"),
+        status=_STATUS_MAP.get(session.state, "error"),
         error=session.error_message,
         username=session.username,
         twofa_method=session.twofa_method if session.requires_2fa else None,
     )
 
 
+async def _safe_close(fetcher: LoginFetcher) -> None:
+    """Close a login fetcher, logging rather than raising on failure."""
+    try:
+        await fetcher.close()
+    except Exception as e:
+        logger.debug("Error closing cancelled login fetcher: %s", e)
+
+
 @router.post(
     "/login/cancel",
     response_model=LoginResponse,
     summary="Cancel login session",
     description="Cancel and clean up a login session.",
 )
-async def cancel_login(request: LoginCancelRequest) -> LoginResponse:
+async def cancel_login(
+    request: LoginCancelRequest, background_tasks: BackgroundTasks
+) -> LoginResponse:
     """Cancel and clean up a login session."""
-    manager = get_session_manager()
+    manager = _session_manager
     session = manager.get_session(request.session_id)
 
     if session is None:
@@ -598,18 +788,13 @@ async def cancel_login(request: LoginCancelRequest) -> LoginResponse:
             detail="Session not found or expired",
         )
 
-    # Get fetcher and close it asynchronously
+    # Remove the session now, but tear down its browser after responding
     fetcher = manager.get_fetcher(request.session_id)
-    if fetcher is not None:
-        try:
-            await fetcher.close()
-        except Exception:
-            pass
-
-    # Remove the session
     manager.remove_session(request.session_id)
+    if fetcher is not None:
+        background_tasks.add_task(_safe_close, fetcher)
 
-    return LoginResponse(
+    return LoginResponse.model_construct(
         session_id=request.session_id,
         status="error",
         message="Session cancelled",
@@ -621,40 +806,44 @@ async def cancel_login(request: LoginCancelRequest) -> LoginResponse:
     summary="Check if login is needed",
     description="Check if the server requires authentication.",
 )
-async def needs_login() -> dict:
+def needs_login() -> dict:
     """Check if the server requires authentication."""
-    import os
-
-    from ghinbox.auth import has_valid_auth, DEFAULT_ACCOUNT
+    config = RuntimeConfig
+    log = logger.isEnabledFor(logging.DEBUG)
 
     # In test mode, never require login (tests use mocked APIs)
-    if os.environ.get("GHINBOX_TEST_MODE") == "1":
-        logger.warning(
-            "needs_login check: test mode enabled, returning needs_login=False"
-        )
+    if config.test_mode:
+        if log:
+            logger.debug(
+                "needs_login check: test mode enabled, returning needs_login=False"
+            )
         return {"needs_login": False, "account": "test"}
 
-    account = os.environ.get("GHSIM_ACCOUNT", DEFAULT_ACCOUNT)
-    needs_auth = os.environ.get("GHINBOX_NEEDS_AUTH") == "1"
+    account = config.account
+    has_auth = _cached_check(_auth_cache, has_valid_auth, account)
 
-    logger.warning(
-        "needs_login check: account=%s, GHINBOX_NEEDS_AUTH=%s, has_valid_auth=%s",
-        account,
-        os.environ.get("GHINBOX_NEEDS_AUTH"),
-        has_valid_auth(account),
-    )
+    if log:
+        logger.debug(
+            "needs_login check: account=%s, GHINBOX_NEEDS_AUTH=%s, has_valid_auth=%s",
+            account,
+            config.needs_auth,
+            has_auth,
+        )
 
     # If explicitly marked as needing auth
-    if needs_auth:
-        logger.warning("Returning needs_login=True (GHINBOX_NEEDS_AUTH is set)")
+    if config.needs_auth:
+        if log:
+            logger.debug("Returning needs_login=True (GHINBOX_NEEDS_AUTH is set)")
         return {"needs_login": True, "account": account}
 
     # Check if we have valid auth
-    if not has_valid_auth(account):
-        logger.warning("Returning needs_login=True (no valid auth for account)")
+    if not has_auth:
+        if log:
+            logger.debug("Returning needs_login=True (no valid auth for account)")
         return {"needs_login": True, "account": account}
 
-    logger.warning("Returning needs_login=False")
+    if log:
+        logger.debug("Returning needs_login=False")
     return {"needs_login": False, "account": account}
 
 
@@ -667,35 +856,24 @@ async def _initialize_fetcher_after_login(account: str) -> bool:
     Returns:
         True if fetcher was initialized successfully
     """
-    import os
-
-    from ghinbox.api.fetcher import NotificationsFetcher, get_fetcher, set_fetcher
-
-    logger.warning("_initialize_fetcher_after_login called for account: %s", account)
+    logger.debug("_initialize_fetcher_after_login called for account: %s", account)
 
-    # Clear the needs-auth flag FIRST - always do this
-    old_needs_auth = os.environ.get("GHINBOX_NEEDS_AUTH")
-    if "GHINBOX_NEEDS_AUTH" in os.environ:
-        del os.environ["GHINBOX_NEEDS_AUTH"]
-        logger.warning("Cleared GHINBOX_NEEDS_AUTH (was: %s)", old_needs_auth)
-
-    # Set the account
-    os.environ["GHSIM_ACCOUNT"] = account
-    logger.warning("Set GHSIM_ACCOUNT=%s", account)
+    # Clear the needs-auth flag and record the account FIRST - always do this
+    RuntimeConfig.mark_authenticated(account)
+    logger.debug("Cleared needs-auth flag, account=%s", account)
 
     # Check if fetcher already exists
-    if get_fetcher() is not None:
-        logger.warning("Fetcher already exists, skipping initialization")
+    if get_fetcher_pool() is not None:
+        logger.debug("Fetcher already exists, skipping initialization")
         return True
 
     headless = os.environ.get("GHSIM_HEADLESS", "1") == "1"
-    logger.warning("headless=%s", headless)
+    logger.debug("headless=%s", headless)
 
     try:
-        logger.warning("Initializing NotificationsFetcher for account: %s", account)
-        fetcher = NotificationsFetcher(account=account, headless=headless)
-        set_fetcher(fetcher)
-        logger.warning("NotificationsFetcher initialized successfully")
+        logger.info("Initializing NotificationsFetcher for account: %s", account)
+        set_fetcher_pool(NotificationsFetcherPool(account=account, headless=headless))
+        logger.info("NotificationsFetcher initialized successfully")
         return True
     except Exception as e:
         logger.exception("Failed to initialize fetcher: %s", e)
@@ -713,17 +891,13 @@ async def reload_auth() -> dict:
     This endpoint should be called after login completes to initialize
     the notifications fetcher and provision the API token if needed.
     """
-    import asyncio
-    import os
-
-    from ghinbox.auth import has_valid_auth, DEFAULT_ACCOUNT, get_auth_state_path
-    from ghinbox.token import has_token, provision_token
-
-    account = os.environ.get("GHSIM_ACCOUNT", DEFAULT_ACCOUNT)
-    auth_path = get_auth_state_path(account)
-    has_auth = has_valid_auth(account)
+    account = RuntimeConfig.account
+    auth_path = _cached_auth_state_path(account)
+    # An explicit reload must see the files as they are now
+    _invalidate_auth_cache(account)
+    has_auth = _cached_check(_auth_cache, has_valid_auth, account)
 
-    logger.warning(
+    logger.debug(
         "reload_auth called: account=%s, auth_path=%s, exists=%s",
         account,
         auth_path,
@@ -740,17 +914,19 @@ async def reload_auth() -> dict:
 
     # Also provision token if needed
     token_status = "skipped"
-    if not has_token(account):
-        logger.warning("No token found for account %s, provisioning...", account)
+    if not _cached_check(_token_cache, has_token, account):
+        logger.info("No token found for account %s, provisioning...", account)
         try:
-            # Run sync provision_token in thread pool
-            loop = asyncio.get_event_loop()
+            # Run sync provision_token on its own pool so a slow browser
+            # session can't starve the default executor
+            loop = asyncio.get_running_loop()
             token = await loop.run_in_executor(
-                None,
-                lambda: provision_token(account, headless=True, prod=True),
+                _provision_executor,
+                partial(provision_token, account, headless=True, prod=True),
             )
+            _token_cache.pop(account, None)
             if token:
-                logger.warning("Token provisioned successfully")
+                logger.info("Token provisioned successfully")
                 token_status = "provisioned"
             else:
                 logger.warning("Token provisioning failed")
@@ -759,7 +935,7 @@ async def reload_auth() -> dict:
             logger.exception("Error provisioning token: %s", e)
             token_status = f"error: {e}"
     else:
-        logger.warning("Token already exists for account %s", account)
+        logger.debug("Token already exists for account %s", account)
         token_status = "exists"
 
     if success:
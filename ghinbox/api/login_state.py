@@ -43,6 +43,7 @@ class LoginSession:
     requires_2fa: bool = False
     twofa_method: str | None = None  # 'app', 'sms', or None
     username: str | None = None  # GitHub username on success
+    last_seen: float = 0.0  # Last lookup time, for LRU eviction
     # Internal: reference to LoginFetcher for this session (not serialized)
     _fetcher: LoginFetcher | None = field(default=None, repr=False)
 
@@ -79,14 +80,28 @@ class LoginSession:
         return time.time() > self.expires_at
 
 
+class SessionLimitError(Exception):
+    """Raised when no login session can be evicted to make room."""
+
+
+# States whose sessions can be evicted to make room: not yet in an
+# authentication exchange with GitHub, or already finished.
+_EVICTABLE_STATES = frozenset(
+    {LoginState.INITIALIZED, LoginState.SUCCESS, LoginState.ERROR, LoginState.CAPTCHA}
+)
+
+
 class LoginSessionManager:
     """
     Manages login sessions with expiry and cleanup.
 
     Thread-safe singleton for managing active login sessions.
-    Sessions expire after 5 minutes of inactivity.
+    Sessions expire after 5 minutes of inactivity, and at most
+    max_sessions are kept at once.
     """
 
+    max_sessions = 50
+
     _instance: "LoginSessionManager | None" = None
     _class_lock = Lock()
 
@@ -107,11 +122,13 @@ class LoginSessionManager:
     def create_session(self, account: str) -> LoginSession:
         """Create a new login session."""
         session_id = str(uuid.uuid4())
+        now = time.time()
         session = LoginSession(
             session_id=session_id,
             account=account,
             state=LoginState.INITIALIZED,
-            created_at=time.time(),
+            created_at=now,
+            last_seen=now,
         )
         with self._sessions_lock:
             # Cleanup expired sessions while we're at it
@@ -128,6 +145,7 @@ class LoginSessionManager:
             if session.is_expired:
                 self._remove_session_unlocked(session_id)
                 return None
+            session.last_seen = time.time()
             return session
 
     def update_state(
@@ -155,6 +173,45 @@ class LoginSessionManager:
                 session.twofa_method = twofa_method
             return session
 
+    def evict_if_full(self) -> list[LoginFetcher]:
+        """Make room for a new session by evicting least-recently-used ones.
+
+        Expired sessions are always removed. Beyond those, only sessions
+        that are idle or finished are evicted; sessions in the middle of
+        credential or 2FA exchange are kept.
+
+        Returns:
+            Fetchers of evicted sessions, which the caller must close
+
+        Raises:
+            SessionLimitError: If the manager is full and nothing is evictable
+        """
+        with self._sessions_lock:
+            # Pick every victim before removing any, so a refusal leaves the
+            # sessions (and their fetchers) in place rather than dropping them
+            now = time.time()
+            victims = [s for s in self._sessions.values() if s.expires_at < now]
+            needed = len(self._sessions) - self.max_sessions + 1 - len(victims)
+            if needed > 0:
+                candidates = sorted(
+                    (
+                        s
+                        for s in self._sessions.values()
+                        if s.expires_at >= now and s.state in _EVICTABLE_STATES
+                    ),
+                    key=lambda s: s.last_seen,
+                )
+                if len(candidates) < needed:
+                    raise SessionLimitError(
+                        f"{len(self._sessions)} login sessions are in progress"
+                    )
+                victims.extend(candidates[:needed])
+
+            fetchers = [s._fetcher for s in victims if s._fetcher is not None]
+            for session in victims:
+                self._remove_session_unlocked(session.session_id)
+        return fetchers
+
     def set_fetcher(self, session_id: str, fetcher: LoginFetcher) -> None:
         """Attach a fetcher to a session."""
         with self._sessions_lock:
@@ -10,7 +10,7 @@ from typing import Annotated, Literal
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
-from ghinbox.api.fetcher import get_fetcher, run_fetcher_call
+from ghinbox.api.fetcher import NotificationsFetcher, get_fetcher_pool
 from ghinbox.api.models import NotificationsResponse
 from ghinbox.parser.notifications import parse_notifications_html
 
@@ -91,11 +91,9 @@ async def get_repo_notifications(
         html = fixture_path.read_text()
 
     # Option 2: Fetch live from GitHub (run in thread pool to avoid blocking)
-    elif get_fetcher() is not None:
-        fetcher = get_fetcher()
-        assert fetcher is not None
-        result = await run_fetcher_call(
-            fetcher.fetch_repo_notifications,
+    elif (pool := get_fetcher_pool()) is not None:
+        result = await pool.run(
+            NotificationsFetcher.fetch_repo_notifications,
             owner=owner,
             repo=repo,
             before=before,
@@ -147,16 +145,16 @@ async def timing_profile(
     repo: str,
 ) -> dict:
     """Return timing breakdown for a fetch + parse cycle."""
-    fetcher = get_fetcher()
-    if fetcher is None:
+    pool = get_fetcher_pool()
+    if pool is None:
         return {"error": "No fetcher configured"}
 
     timing: dict[str, object] = {}
 
     # Measure fetch (in thread pool)
     t0 = time.perf_counter()
-    result = await run_fetcher_call(
-        fetcher.fetch_repo_notifications,
+    result = await pool.run(
+        NotificationsFetcher.fetch_repo_notifications,
         owner=owner,
         repo=repo,
     )
@@ -240,15 +238,15 @@ async def submit_action(
 
     Requires an active fetcher (server started with --account).
     """
-    fetcher = get_fetcher()
-    if fetcher is None:
+    pool = get_fetcher_pool()
+    if pool is None:
         raise HTTPException(
             status_code=503,
             detail="No fetcher configured. Start server with --account to enable actions.",
         )
 
-    result = await run_fetcher_call(
-        fetcher.submit_notification_action,
+    result = await pool.run(
+        NotificationsFetcher.submit_notification_action,
         action=request.action,
         notification_ids=request.notification_ids,
         authenticity_token=request.authenticity_token,
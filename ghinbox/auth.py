@@ -11,7 +11,7 @@ import argparse
 import sys
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright, Page, BrowserContext
+from playwright.sync_api import sync_playwright, Browser, Page, BrowserContext
 
 
 AUTH_STATE_DIR = Path("auth_state")
@@ -248,16 +248,13 @@ def login_interactive(
     return True
 
 
-def create_authenticated_context(
-    playwright, account: str, headless: bool = True
-) -> BrowserContext | None:
+def new_authenticated_context(browser: Browser, account: str) -> BrowserContext | None:
     """
-    Create a browser context with stored authentication.
+    Open a context with stored authentication on an existing browser.
 
     Args:
-        playwright: The Playwright instance
+        browser: The browser to open the context on
         account: The account identifier
-        headless: Whether to run in headless mode
 
     Returns:
         An authenticated BrowserContext or None if auth state doesn't exist
@@ -268,13 +265,36 @@ def create_authenticated_context(
         print(f"No auth state found for '{account}'. Run login first.")
         return None
 
-    browser = playwright.chromium.launch(headless=headless)
-    context = browser.new_context(
+    return browser.new_context(
         storage_state=str(auth_path),
         viewport={"width": 1280, "height": 800},
     )
 
-    return context
+
+def create_authenticated_context(
+    playwright,
+    account: str,
+    headless: bool = True,
+    launch_args: list[str] | None = None,
+) -> BrowserContext | None:
+    """
+    Launch a browser and create a context with stored authentication.
+
+    Args:
+        playwright: The Playwright instance
+        account: The account identifier
+        headless: Whether to run in headless mode
+        launch_args: Extra Chromium command-line switches
+
+    Returns:
+        An authenticated BrowserContext or None if auth state doesn't exist
+    """
+    if not has_valid_auth(account):
+        print(f"No auth state found for '{account}'. Run login first.")
+        return None
+
+    browser = playwright.chromium.launch(headless=headless, args=launch_args)
+    return new_authenticated_context(browser, account)
 
 
 def verify_auth(account: str) -> bool:
@@ -13,15 +13,17 @@ Usage:
 """
 
 import argparse
-import difflib
+import filecmp
+import heapq
+import itertools
 import json
+import os
 import re
 import shutil
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
-from ghinbox.parser.notifications import parse_notifications_html
-
 # Directories
 RESPONSES_DIR = Path("responses")
 FIXTURES_DIR = Path("tests/fixtures")
@@ -58,20 +60,53 @@ E2E_FIXTURE_MAPPING: dict[str, tuple[str, str, str]] = {
 }
 
 
-def find_latest_response(pattern: str) -> Path | None:
-    """Find the most recent response file matching the pattern."""
+# FIXTURE_MAPPING patterns in one alternation; group g<i> is pattern i, so a
+# file name is dispatched to its pattern with a single match
+_PATTERNS = list(FIXTURE_MAPPING)
+_COMBINED_PATTERN = re.compile(
+    "|".join(f"(?P<g{i}>{pattern})" for i, pattern in enumerate(_PATTERNS))
+)
+
+
+@dataclass(frozen=True)
+class ResponseFile:
+    """A file in the responses directory, with its stat taken once."""
+
+    path: Path
+    mtime: float
+
+
+def scan_responses() -> tuple[dict[str, list[ResponseFile]], list[ResponseFile]]:
+    """
+    Scan the responses directory once, grouping files by FIXTURE_MAPPING pattern.
+
+    Returns:
+        Matching files for each pattern, and HTML files matching no pattern
+    """
+    by_pattern: dict[str, list[ResponseFile]] = {p: [] for p in _PATTERNS}
+    unmatched: list[ResponseFile] = []
     if not RESPONSES_DIR.exists():
-        return None
+        return by_pattern, unmatched
 
-    regex = re.compile(pattern)
-    matches = [f for f in RESPONSES_DIR.iterdir() if regex.match(f.name)]
+    with os.scandir(RESPONSES_DIR) as entries:
+        for entry in entries:
+            match = _COMBINED_PATTERN.match(entry.name)
+            if match is None and not entry.name.endswith(".html"):
+                continue
+            if not entry.is_file():
+                continue
+            response = ResponseFile(Path(entry.path), entry.stat().st_mtime)
+            if match is None:
+                unmatched.append(response)
+            else:
+                assert match.lastgroup is not None
+                by_pattern[_PATTERNS[int(match.lastgroup[1:])]].append(response)
+    return by_pattern, unmatched
 
-    if not matches:
-        return None
 
-    # Sort by modification time, newest first
-    matches.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-    return matches[0]
+def find_latest_response(files: list[ResponseFile]) -> ResponseFile | None:
+    """Return the most recently modified of the scanned files."""
+    return max(files, key=lambda f: f.mtime, default=None)
 
 
 def list_responses() -> None:
@@ -83,17 +118,19 @@ def list_responses() -> None:
         print(f"  (responses directory not found: {RESPONSES_DIR})")
         return
 
+    by_pattern, unmatched = scan_responses()
+
     # Group files by fixture mapping
     for pattern, fixture_name in FIXTURE_MAPPING.items():
-        latest = find_latest_response(pattern)
+        latest = find_latest_response(by_pattern[pattern])
         fixture_path = FIXTURES_DIR / f"{fixture_name}.html"
 
         print(f"\n{fixture_name}.html:")
         print(f"  Pattern: {pattern}")
 
         if latest:
-            print(f"  Latest:  {latest.name}")
-            print(f"           (modified: {latest.stat().st_mtime})")
+            print(f"  Latest:  {latest.path.name}")
+            print(f"           (modified: {latest.mtime})")
         else:
             print("  Latest:  (no matching files)")
 
@@ -103,20 +140,11 @@ def list_responses() -> None:
             print("  Fixture: NOT YET CREATED")
 
     # Also list any unmatched HTML files
-    all_html = list(RESPONSES_DIR.glob("*.html"))
-    matched_files = set()
-
-    for pattern in FIXTURE_MAPPING:
-        regex = re.compile(pattern)
-        matched_files.update(f for f in all_html if regex.match(f.name))
-
-    unmatched = [f for f in all_html if f not in matched_files]
-
     if unmatched:
         print("\n" + "-" * 60)
         print("Other HTML files (no fixture mapping):")
-        for f in sorted(unmatched, key=lambda x: x.stat().st_mtime, reverse=True)[:10]:
-            print(f"  {f.name}")
+        for f in heapq.nlargest(10, unmatched, key=lambda x: x.mtime):
+            print(f"  {f.path.name}")
 
 
 def show_diff(old_path: Path, new_path: Path) -> bool:
@@ -125,18 +153,21 @@ def show_diff(old_path: Path, new_path: Path) -> bool:
         print(f"  (new file, {new_path.stat().st_size} bytes)")
         return True
 
-    old_content = old_path.read_text().splitlines(keepends=True)
-    new_content = new_path.read_text().splitlines(keepends=True)
-
-    if old_content == new_content:
+    # Compares sizes, then contents in blocks, without decoding either file
+    if filecmp.cmp(old_path, new_path, shallow=False):
         print("  (no changes)")
         return False
 
-    # Show abbreviated diff
+    import difflib
+
+    # Show abbreviated diff; only the lines it covers are read
+    with old_path.open() as old_file, new_path.open() as new_file:
+        old_head = list(itertools.islice(old_file, 50))
+        new_head = list(itertools.islice(new_file, 50))
     diff = list(
         difflib.unified_diff(
-            old_content[:50],
-            new_content[:50],
+            old_head,
+            new_head,
             fromfile=str(old_path),
             tofile=str(new_path),
             lineterm="",
@@ -162,9 +193,10 @@ def update_fixtures(force: bool = False) -> None:
     FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
 
     updates: list[tuple[Path, Path]] = []
+    by_pattern, _ = scan_responses()
 
     for pattern, fixture_name in FIXTURE_MAPPING.items():
-        latest = find_latest_response(pattern)
+        latest = find_latest_response(by_pattern[pattern])
         fixture_path = FIXTURES_DIR / f"{fixture_name}.html"
 
         print(f"\n{fixture_name}.html:")
@@ -173,12 +205,12 @@ def update_fixtures(force: bool = False) -> None:
             print("  SKIP: No source file found")
             continue
 
-        print(f"  From: {latest.name}")
+        print(f"  From: {latest.path.name}")
 
-        has_changes = show_diff(fixture_path, latest)
+        has_changes = show_diff(fixture_path, latest.path)
 
         if has_changes:
-            updates.append((latest, fixture_path))
+            updates.append((latest.path, fixture_path))
 
     if not updates:
         print("\n" + "-" * 60)
@@ -204,6 +236,10 @@ def update_fixtures(force: bool = False) -> None:
 
 def generate_e2e_fixtures(force: bool = False) -> None:
     """Generate E2E JSON fixtures from HTML fixtures."""
+    # Deferred: the parser pulls in bs4, lxml and pydantic, which the list
+    # and update commands don't need
+    from ghinbox.parser.notifications import parse_notifications_html
+
     print("Generating E2E JSON fixtures from HTML fixtures")
     print("=" * 60)
 
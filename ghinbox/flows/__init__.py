@@ -4,17 +4,45 @@ Test flows for GitHub notification behavior verification.
 Each flow tests a specific aspect of GitHub's notification system.
 """
 
-from ghinbox.flows.anchor_tracking import AnchorTrackingFlow
-from ghinbox.flows.basic_notification import BasicNotificationFlow
-from ghinbox.flows.comment_fetch_marks_read import CommentFetchMarksReadFlow
-from ghinbox.flows.comment_prefetch_validation import CommentPrefetchValidationFlow
-from ghinbox.flows.done_then_close import DoneThenCloseFlow
-from ghinbox.flows.notification_timestamps import NotificationTimestampsFlow
-from ghinbox.flows.pagination import PaginationFlow
-from ghinbox.flows.parser_validation import ParserValidationFlow
-from ghinbox.flows.prod_notifications_snapshot import ProdNotificationsSnapshotFlow
-from ghinbox.flows.prod_undo import ProdUndoFlow
-from ghinbox.flows.read_vs_done import ReadVsDoneFlow
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ghinbox.flows.anchor_tracking import AnchorTrackingFlow
+    from ghinbox.flows.basic_notification import BasicNotificationFlow
+    from ghinbox.flows.comment_fetch_marks_read import CommentFetchMarksReadFlow
+    from ghinbox.flows.comment_prefetch_validation import CommentPrefetchValidationFlow
+    from ghinbox.flows.done_then_close import DoneThenCloseFlow
+    from ghinbox.flows.notification_timestamps import NotificationTimestampsFlow
+    from ghinbox.flows.pagination import PaginationFlow
+    from ghinbox.flows.parser_validation import ParserValidationFlow
+    from ghinbox.flows.prod_notifications_snapshot import ProdNotificationsSnapshotFlow
+    from ghinbox.flows.prod_undo import ProdUndoFlow
+    from ghinbox.flows.read_vs_done import ReadVsDoneFlow
+
+# Flow class -> defining module. Flows are imported on first access
+# (PEP 562), so importing one flow doesn't load every other flow's deps.
+_FLOW_MODULES = {
+    "AnchorTrackingFlow": "anchor_tracking",
+    "BasicNotificationFlow": "basic_notification",
+    "CommentFetchMarksReadFlow": "comment_fetch_marks_read",
+    "CommentPrefetchValidationFlow": "comment_prefetch_validation",
+    "DoneThenCloseFlow": "done_then_close",
+    "NotificationTimestampsFlow": "notification_timestamps",
+    "PaginationFlow": "pagination",
+    "ParserValidationFlow": "parser_validation",
+    "ProdNotificationsSnapshotFlow": "prod_notifications_snapshot",
+    "ProdUndoFlow": "prod_undo",
+    "ReadVsDoneFlow": "read_vs_done",
+}
+
+
+def __getattr__(name: str) -> type:
+    module = _FLOW_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module}"), name)
+
 
 __all__ = [
     "AnchorTrackingFlow",
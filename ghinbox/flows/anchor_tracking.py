@@ -18,17 +18,63 @@ Revised test sequence (based on observation that anchors appear after partial re
 
 from __future__ import annotations
 
-import time
 import urllib.parse
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cached_property
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
+
+from playwright.sync_api import BrowserContext, Page
+
+from ghinbox.flows.base import DEBUG_SCREENSHOTS, BaseFlow
+from ghinbox.github_api import save_response
+
+
+# Mirrors parse_first_notification_url, evaluated in the page
+_FIRST_NOTIFICATION_JS = """
+() => {
+    const items = document.querySelectorAll(
+        "li.notifications-list-item[data-notification-id]"
+    );
+    if (items.length === 0) return null;
+    const link = items[0].querySelector("a.notification-list-item-link");
+    return {
+        href: link ? link.getAttribute("href") || "" : "",
+        unread: items[0].classList.contains("notification-unread"),
+        count: items.length,
+    };
+}
+"""
+
+
+def _is_read(notification: dict[str, Any] | None) -> bool:
+    return notification is not None and not notification.get("unread")
+
+
+def _is_unread(notification: dict[str, Any] | None) -> bool:
+    return notification is not None and bool(notification.get("unread"))
+
+
+def _is_gone(notification: dict[str, Any] | None) -> bool:
+    return notification is None
+
 
-from playwright.sync_api import sync_playwright, Page
+def _is_present(notification: dict[str, Any] | None) -> bool:
+    return notification is not None
 
-from ghinbox.flows.base import BaseFlow
-from ghinbox.github_api import save_response, RESPONSES_DIR
-from ghinbox.parser.notifications import parse_notifications_html
+
+@dataclass(frozen=True)
+class _Step:
+    """One step of the flow: act, wait for the API to reflect it, capture."""
+
+    title: str
+    action: Callable[[], None]
+    settled: Callable[[dict[str, Any] | None], bool]
+    capture_label: str
+    summary: str  # Label for this step's anchor in the analysis
+    settle_timeout: float = 3.0
 
 
 class AnchorTrackingFlow(BaseFlow):
@@ -46,208 +92,189 @@ class AnchorTrackingFlow(BaseFlow):
             if not self.setup_test_repo():
                 return False
 
-            # Step 1: B creates issue
-            print(f"\n{'=' * 60}")
-            print("Step 1: B creates issue")
-            print(f"{'=' * 60}")
-
-            issue = self.create_test_issue()
-            issue_number = issue.get("number")
-            if not isinstance(issue_number, int):
-                print("ERROR: Issue number missing")
-                return False
-
-            # Wait for notification
-            notification = self.wait_for_notification()
-            if not notification:
-                print("ERROR: Notification not found")
-                return False
-
-            # Capture initial state (no anchor expected)
-            anchor_1 = self._capture_notification_anchor("step1_initial")
-
-            # Step 2: A reads it (views issue page)
-            print(f"\n{'=' * 60}")
-            print("Step 2: A reads notification (visiting issue page)")
-            print(f"{'=' * 60}")
-
-            with sync_playwright() as p:
-                context = self.create_browser_context(p)
-                if context is None:
-                    print("Failed to create browser context")
-                    return False
-
-                page = context.new_page()
-                self._visit_issue_page(page, issue_number)
-
-                if context.browser:
-                    context.browser.close()
-
-            time.sleep(3)
-            anchor_2 = self._capture_notification_anchor("step2_after_read")
-
-            # Step 3: A marks notification as done
-            print(f"\n{'=' * 60}")
-            print("Step 3: A marks notification as DONE")
-            print(f"{'=' * 60}")
-
-            with sync_playwright() as p:
-                context = self.create_browser_context(p)
+            # One context for the whole flow; each step opens its own page
+            with self.browser_context() as context:
                 if context is None:
                     print("Failed to create browser context")
                     return False
+                return self._run_steps(context)
 
-                page = context.new_page()
-                self._mark_as_done(page)
-
-                if context.browser:
-                    context.browser.close()
-
-            time.sleep(3)
-            anchor_3 = self._capture_notification_anchor("step3_after_done")
-
-            # Step 4: B adds a comment - should trigger notification with anchor
-            print(f"\n{'=' * 60}")
-            print("Step 4: B adds first comment (after A marked done)")
-            print(f"{'=' * 60}")
+        finally:
+            self.cleanup_test_repo()
 
-            assert self.trigger_api is not None
-            comment1 = self.trigger_api.create_issue_comment(
-                self.owner_username,
-                self.repo_name,
-                issue_number,
-                f"First comment after done - {datetime.now(timezone.utc).isoformat()}",
-            )
-            print(f"Comment 1 ID: {comment1.get('id')}")
+    def _run_steps(self, context: BrowserContext) -> bool:
+        """Run the test steps using a shared browser context."""
+        # Step 1: B creates issue
+        self.print_banner("Step 1: B creates issue")
 
-            # Wait for notification to reappear via API
-            print("Waiting for notification to reappear...")
-            self._wait_for_notification_reappear()
+        issue = self.create_test_issue()
+        issue_number = issue.get("number")
+        if not isinstance(issue_number, int):
+            print("ERROR: Issue number missing")
+            return False
 
-            # This is the key capture - should have anchor!
-            anchor_4 = self._capture_notification_anchor("step4_after_comment1")
+        # Wait for notification
+        notification = self.wait_for_notification()
+        if not notification:
+            print("ERROR: Notification not found")
+            return False
 
-            # Step 5: A reads it again
-            print(f"\n{'=' * 60}")
-            print("Step 5: A reads notification again")
-            print(f"{'=' * 60}")
+        # Capture initial state (no anchor expected)
+        anchor_1 = self._capture_notification_anchor(context, "step1_initial")
 
-            with sync_playwright() as p:
-                context = self.create_browser_context(p)
-                if context is None:
-                    print("Failed to create browser context")
-                    return False
+        comment_ids: list[int | None] = []
 
-                page = context.new_page()
+        def read_issue() -> None:
+            page = context.new_page()
+            try:
                 self._visit_issue_page(page, issue_number)
+            finally:
+                page.close()
 
-                if context.browser:
-                    context.browser.close()
-
-            time.sleep(3)
-            anchor_5 = self._capture_notification_anchor("step5_after_read2")
-
-            # Step 6: B adds another comment
-            print(f"\n{'=' * 60}")
-            print("Step 6: B adds second comment")
-            print(f"{'=' * 60}")
-
-            comment2 = self.trigger_api.create_issue_comment(
-                self.owner_username,
-                self.repo_name,
-                issue_number,
-                f"Second comment - {datetime.now(timezone.utc).isoformat()}",
-            )
-            print(f"Comment 2 ID: {comment2.get('id')}")
-            time.sleep(5)
-
-            anchor_6 = self._capture_notification_anchor("step6_after_comment2")
-
-            # Analysis
-            print(f"\n{'=' * 60}")
-            print("ANALYSIS: Anchor Progression")
-            print(f"{'=' * 60}")
-
-            self._analyze_anchors(
-                [
-                    ("1. Initial (issue created)", anchor_1),
-                    ("2. After A reads", anchor_2),
-                    ("3. After A marks done", anchor_3),
-                    ("4. After B adds comment1 (KEY)", anchor_4),
-                    ("5. After A reads again", anchor_5),
-                    ("6. After B adds comment2", anchor_6),
-                ],
-                [comment1.get("id"), comment2.get("id")],
+        def mark_done() -> None:
+            page = context.new_page()
+            try:
+                self._mark_as_done(page)
+            finally:
+                page.close()
+
+        def add_comment(text: str) -> Callable[[], None]:
+            def action() -> None:
+                assert self.trigger_api is not None
+                comment = self.trigger_api.create_issue_comment(
+                    self.owner_username,
+                    self.repo_name,
+                    issue_number,
+                    f"{text} - {datetime.now(timezone.utc).isoformat()}",
+                )
+                comment_ids.append(comment.get("id"))
+                print(f"Comment {len(comment_ids)} ID: {comment.get('id')}")
+
+            return action
+
+        steps = [
+            _Step(
+                "Step 2: A reads notification (visiting issue page)",
+                read_issue,
+                _is_read,
+                "step2_after_read",
+                "2. After A reads",
+            ),
+            _Step(
+                "Step 3: A marks notification as DONE",
+                mark_done,
+                _is_gone,
+                "step3_after_done",
+                "3. After A marks done",
+            ),
+            # The key capture - the reappeared notification should have an anchor
+            _Step(
+                "Step 4: B adds first comment (after A marked done)",
+                add_comment("First comment after done"),
+                _is_present,
+                "step4_after_comment1",
+                "4. After B adds comment1 (KEY)",
+                settle_timeout=30.0,
+            ),
+            _Step(
+                "Step 5: A reads notification again",
+                read_issue,
+                _is_read,
+                "step5_after_read2",
+                "5. After A reads again",
+            ),
+            _Step(
+                "Step 6: B adds second comment",
+                add_comment("Second comment"),
+                _is_unread,
+                "step6_after_comment2",
+                "6. After B adds comment2",
+                settle_timeout=5.0,
+            ),
+        ]
+
+        anchors = [("1. Initial (issue created)", anchor_1)]
+        for step in steps:
+            self.print_banner(step.title)
+
+            step.action()
+            self.wait_for_notification_state(step.settled, timeout=step.settle_timeout)
+            anchors.append(
+                (
+                    step.summary,
+                    self._capture_notification_anchor(context, step.capture_label),
+                )
             )
 
-            return True
-
-        finally:
-            self.cleanup_test_repo()
+        # Analysis
+        self.print_banner("ANALYSIS: Anchor Progression")
 
-    def _capture_notification_anchor(self, label: str) -> dict[str, Any]:
-        """Capture the notification HTML and extract the anchor."""
-        with sync_playwright() as p:
-            context = self.create_browser_context(p)
-            if context is None:
-                return {"error": "Failed to create browser context"}
+        self._analyze_anchors(anchors, comment_ids)
 
-            page = context.new_page()
-            RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
+        return True
 
-            # Try multiple views to find the notification
-            views = [
-                ("inbox", f"repo:{self.owner_username}/{self.repo_name}"),
-                ("all", f"repo:{self.owner_username}/{self.repo_name} is:all"),
-                ("unread", f"repo:{self.owner_username}/{self.repo_name} is:unread"),
-            ]
+    @cached_property
+    def _view_urls(self) -> list[tuple[str, str]]:
+        """Notification views searched by each capture (after repo setup)."""
+        base = self.notifications_url
+        return [
+            ("inbox", base),
+            ("all", base + urllib.parse.quote(" is:all")),
+            ("unread", base + urllib.parse.quote(" is:unread")),
+        ]
 
+    def _capture_notification_anchor(
+        self, context: BrowserContext, label: str
+    ) -> dict[str, Any]:
+        """Capture the notification HTML and extract the anchor."""
+        page = self.new_scraping_page(context)
+        try:
             result: dict[str, Any] = {
                 "label": label,
                 "notification_count": 0,
                 "views_checked": [],
             }
 
-            for view_name, query in views:
-                url = f"https://github.com/notifications?query={urllib.parse.quote(query)}"
+            # Try multiple views to find the notification
+            for view_name, url in self._view_urls:
                 page.goto(url, wait_until="domcontentloaded")
                 page.locator(".notifications-list-item, .blankslate").first.wait_for(
                     state="attached", timeout=10000
                 )
-                time.sleep(1)
 
-                html_content = page.content()
-
-                # Parse HTML
-                parsed = parse_notifications_html(
-                    html=html_content,
-                    owner=self.owner_username,
-                    repo=self.repo_name,
-                    source_url=url,
-                )
+                # Only the top row matters: read it in one round-trip rather
+                # than serializing and re-parsing the whole page
+                first = self._read_first_notification(page)
 
                 result["views_checked"].append(
-                    {"view": view_name, "count": len(parsed.notifications)}
+                    {"view": view_name, "count": first[2] if first else 0}
                 )
 
-                if parsed.notifications:
-                    notif = parsed.notifications[0]
-                    full_url = notif.subject.url
+                if first:
+                    full_url, unread, count = first
                     parsed_url = urlparse(full_url)
 
-                    result["notification_count"] = len(parsed.notifications)
+                    result["notification_count"] = count
                     result["full_url"] = full_url
                     result["anchor"] = parsed_url.fragment or "(no anchor)"
-                    result["unread"] = notif.unread
+                    result["unread"] = unread
                     result["found_in_view"] = view_name
 
-                    save_response(f"anchor_{label}_html", html_content, "html")
-                    page.screenshot(path=str(RESPONSES_DIR / f"anchor_{label}.png"))
+                    if DEBUG_SCREENSHOTS:
+                        save_response(
+                            f"anchor_{label}_html",
+                            page.content(),
+                            "html",
+                            compress=True,
+                        )
+                    self.save_debug_screenshot(
+                        page, f"anchor_{label}", ".notifications-list-item"
+                    )
 
                     print(f"  [{label}] Found in '{view_name}' view")
                     print(f"  [{label}] URL: {full_url}")
                     print(f"  [{label}] Anchor: {result['anchor']}")
-                    print(f"  [{label}] Unread: {notif.unread}")
+                    print(f"  [{label}] Unread: {unread}")
                     break
             else:
                 # Not found in any view
@@ -255,11 +282,19 @@ class AnchorTrackingFlow(BaseFlow):
                 print(f"  [{label}] No notification found in any view")
                 print(f"  [{label}] Views checked: {result['views_checked']}")
 
-            if context.browser:
-                context.browser.close()
+        finally:
+            page.close()
+
+        save_response(f"anchor_{label}", result, "json")
+        return result
 
-            save_response(f"anchor_{label}", result, "json")
-            return result
+    def _read_first_notification(self, page: Page) -> tuple[str, bool, int] | None:
+        """Return (url, unread, item_count) for the first row on the page."""
+        first = page.evaluate(_FIRST_NOTIFICATION_JS)
+        if first is None:
+            return None
+        url = urljoin("https://github.com", first["href"]) if first["href"] else ""
+        return url, first["unread"], first["count"]
 
     def _visit_issue_page(self, page: Page, issue_number: int) -> None:
         """Visit the issue page to mark notification as read."""
@@ -274,34 +309,12 @@ class AnchorTrackingFlow(BaseFlow):
             state="attached", timeout=10000
         )
 
-        RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
-        page.screenshot(path=str(RESPONSES_DIR / "anchor_issue_page.png"))
+        self.save_debug_screenshot(page, "anchor_issue_page")
         print("Issue page loaded")
 
-    def _wait_for_notification_reappear(
-        self, max_attempts: int = 10, wait_seconds: int = 3
-    ) -> bool:
-        """Wait for the notification to reappear after new activity."""
-        assert self.owner_api is not None
-
-        for attempt in range(max_attempts):
-            if attempt > 0:
-                print(f"  Attempt {attempt + 1}/{max_attempts}...")
-                time.sleep(wait_seconds)
-
-            notifications = self.owner_api.get_notifications(all_notifications=True)
-            for notif in notifications:
-                if notif.get("repository", {}).get("name") == self.repo_name:
-                    print(f"  Notification found! Unread: {notif.get('unread')}")
-                    return True
-
-        print("  Notification did not reappear")
-        return False
-
     def _mark_as_done(self, page: Page) -> None:
         """Mark the notification as done."""
-        query = f"repo:{self.owner_username}/{self.repo_name}"
-        url = f"https://github.com/notifications?query={urllib.parse.quote(query)}"
+        url = self.notifications_url
 
         page.goto(url, wait_until="domcontentloaded")
         page.locator(".notifications-list-item, .blankslate").first.wait_for(
@@ -309,18 +322,16 @@ class AnchorTrackingFlow(BaseFlow):
         )
 
         # Find and click checkbox, then Done button
+        row_selector = f'.notifications-list-item:has(a[href*="{self.repo_name}"])'
         notification_checkbox = page.locator(
-            f'.notifications-list-item:has(a[href*="{self.repo_name}"]) input[type="checkbox"]'
+            f'{row_selector} input[type="checkbox"]'
         ).first
 
         if notification_checkbox.count() > 0:
             notification_checkbox.check()
-            done_button = page.locator('button:has-text("Done")').first
-            done_button.wait_for(state="visible", timeout=5000)
-            done_button.click()
-            page.locator(
-                f'.notifications-list-item:has(a[href*="{self.repo_name}"])'
-            ).wait_for(state="hidden", timeout=10000)
+            # click() itself waits for the button to be visible and enabled
+            page.locator('button:has-text("Done")').first.click(timeout=5000)
+            self.wait_for_element_gone(page, row_selector)
             print("Marked notification as done")
         else:
             print("WARNING: Could not find notification to mark as done")
@@ -349,9 +360,7 @@ class AnchorTrackingFlow(BaseFlow):
             print(f"  Comment {i}: issuecomment-{cid}")
 
         # Validation
-        print("\n" + "=" * 60)
-        print("VALIDATION RESULTS")
-        print("=" * 60)
+        self.print_banner("VALIDATION RESULTS")
 
         # Find the final anchor (step 6 - after second comment)
         final_data = anchors[-1][1]
@@ -2,17 +2,75 @@
 Base class for test flows.
 """
 
+import atexit
+import os
 import time
+import urllib.parse
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
-from playwright.sync_api import BrowserContext
-
-from ghinbox.auth import create_authenticated_context, has_valid_auth
-from ghinbox.github_api import GitHubAPI
+from playwright.sync_api import (
+    Browser,
+    BrowserContext,
+    Locator,
+    Page,
+    Playwright,
+    sync_playwright,
+)
+
+from ghinbox.api.fetcher import block_media_requests, block_non_essential_requests
+from ghinbox.auth import has_valid_auth, new_authenticated_context
+from ghinbox.github_api import RESPONSES_DIR, GitHubAPI
 from ghinbox.token import load_token
 
+# Step screenshots cost PNG/JPEG encoding and disk writes on every capture;
+# set GHINBOX_DEBUG_SCREENSHOTS=1 to save them
+DEBUG_SCREENSHOTS = os.environ.get("GHINBOX_DEBUG_SCREENSHOTS") == "1"
+
+# True once no element matches the selector or the first match isn't
+# rendered; evaluated in the page so waiting costs a single round-trip
+_ELEMENT_GONE_JS = """
+(selector) => {
+    const el = document.querySelector(selector);
+    return !el || el.getClientRects().length === 0;
+}
+"""
+
+# One Playwright driver, and one Chromium per headless setting, shared by
+# every flow in the process; flows open and close their own contexts on it.
+# Launching Chromium costs far more than opening a context.
+_playwright: Playwright | None = None
+_shared_browsers: dict[bool, Browser] = {}
+
+
+def _get_shared_browser(headless: bool) -> Browser:
+    """Return the shared browser, launching it on first use."""
+    global _playwright
+    browser = _shared_browsers.get(headless)
+    if browser is not None and browser.is_connected():
+        return browser
+    if _playwright is None:
+        _playwright = sync_playwright().start()
+        atexit.register(_stop_shared_browsers)
+    browser = _playwright.chromium.launch(headless=headless)
+    _shared_browsers[headless] = browser
+    return browser
+
+
+def _stop_shared_browsers() -> None:
+    global _playwright
+    for browser in _shared_browsers.values():
+        if browser.is_connected():
+            browser.close()
+    _shared_browsers.clear()
+    if _playwright is not None:
+        _playwright.stop()
+        _playwright = None
+
 
 class BaseFlow(ABC):
     """Base class for notification test flows."""
@@ -31,6 +89,12 @@ class BaseFlow(ABC):
         self.trigger_account = trigger_account
         self.headless = headless
         self.cleanup = cleanup
+        # Filename timestamp for files that belong together (e.g. the pages
+        # of one capture), so they sort and group as a set
+        self.run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # Created once here so capture helpers can write into it directly
+        RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
 
         # Will be set during setup
         self.owner_api: GitHubAPI | None = None
@@ -38,7 +102,14 @@ class BaseFlow(ABC):
         self.owner_username: str = ""
         self.trigger_username: str = ""
         self.repo_name: str = ""
+        self.notifications_url: str = ""  # Inbox filtered to the test repo
         self.created_repo: Any = None
+        # (notifications list, repo name -> first notification in it)
+        self._repo_index: tuple[list[Any], dict[str, Any]] | None = None
+
+    def print_banner(self, title: str) -> None:
+        """Print a section banner as a single write."""
+        print(f"\n{'=' * 60}\n{title}\n{'=' * 60}")
 
     def validate_prerequisites(self) -> bool:
         """Validate that required auth and tokens exist."""
@@ -78,10 +149,12 @@ class BaseFlow(ABC):
 
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
         self.repo_name = f"ghinbox-test-{timestamp}"
+        query = f"repo:{self.owner_username}/{self.repo_name}"
+        self.notifications_url = (
+            f"https://github.com/notifications?query={urllib.parse.quote(query)}"
+        )
 
-        print(f"\n{'=' * 60}")
-        print("Setup: Creating test repository")
-        print(f"{'=' * 60}")
+        self.print_banner("Setup: Creating test repository")
 
         self.created_repo = self.owner_api.create_repo(self.repo_name, private=False)
         print(f"Created repo: {self.created_repo['full_name']}")
@@ -135,9 +208,7 @@ class BaseFlow(ABC):
         """Create a test issue from the trigger account."""
         assert self.trigger_api is not None, "Must call validate_prerequisites first"
 
-        print(f"\n{'=' * 60}")
-        print("Creating test issue")
-        print(f"{'=' * 60}")
+        self.print_banner("Creating test issue")
 
         issue_title = f"Test issue from ghinbox - {datetime.now().isoformat()}"
         issue_body = (
@@ -151,15 +222,29 @@ class BaseFlow(ABC):
         print(f"Issue URL: {issue['html_url']}")
         return issue
 
+    def find_repo_notification(
+        self, notifications: list[dict[str, Any]]
+    ) -> dict[str, Any] | None:
+        """
+        Return the first notification for our test repo, or None.
+
+        The repo-name index is kept for the last list seen: an unchanged
+        poll (a 304) returns the very same list, so repeat lookups are O(1).
+        """
+        if self._repo_index is None or self._repo_index[0] is not notifications:
+            index: dict[str, dict[str, Any]] = {}
+            for n in notifications:
+                index.setdefault(n.get("repository", {}).get("name"), n)
+            self._repo_index = (notifications, index)
+        return self._repo_index[1].get(self.repo_name)
+
     def wait_for_notification(
         self, max_attempts: int = 6, wait_seconds: int = 5
     ) -> Any:
         """Wait for a notification to appear for our test repo."""
         assert self.owner_api is not None, "Must call validate_prerequisites first"
 
-        print(f"\n{'=' * 60}")
-        print("Waiting for notification via API")
-        print(f"{'=' * 60}")
+        self.print_banner("Waiting for notification via API")
 
         found_notification = None
 
@@ -171,29 +256,56 @@ class BaseFlow(ABC):
             api_notifications = self.owner_api.get_notifications(all_notifications=True)
             print(f"Found {len(api_notifications)} total notifications")
 
-            for notif in api_notifications:
-                notif_repo = notif.get("repository", {}).get("name", "unknown")
-                if notif_repo == self.repo_name:
-                    found_notification = notif
-                    print("Found notification for our repo!")
-                    print(f"  ID: {notif.get('id')}")
-                    print(f"  Type: {notif.get('subject', {}).get('type')}")
-                    print(f"  Title: {notif.get('subject', {}).get('title')}")
-                    print(f"  Reason: {notif.get('reason')}")
-                    print(f"  Unread: {notif.get('unread')}")
-                    break
-
-            if found_notification:
+            notif = self.find_repo_notification(api_notifications)
+            if notif is not None:
+                found_notification = notif
+                print(
+                    "Found notification for our repo!\n"
+                    f"  ID: {notif.get('id')}\n"
+                    f"  Type: {notif.get('subject', {}).get('type')}\n"
+                    f"  Title: {notif.get('subject', {}).get('title')}\n"
+                    f"  Reason: {notif.get('reason')}\n"
+                    f"  Unread: {notif.get('unread')}"
+                )
                 break
 
         return found_notification
 
+    def wait_for_notification_state(
+        self,
+        predicate: Callable[[dict[str, Any] | None], bool],
+        timeout: float = 3.0,
+        poll_interval: float = 0.5,
+    ) -> dict[str, Any] | None:
+        """
+        Poll the API until our repo's notification satisfies predicate.
+
+        Used after a UI action instead of a fixed sleep, so the flow moves on
+        as soon as GitHub reflects the change.  Gives up after timeout seconds.
+
+        Args:
+            predicate: Called with the notification for our repo, or None if
+                it isn't listed
+            timeout: Maximum time to wait, in seconds
+            poll_interval: Delay between API calls, in seconds
+
+        Returns:
+            The last notification seen for our repo, or None
+        """
+        assert self.owner_api is not None, "Must call validate_prerequisites first"
+
+        deadline = time.monotonic() + timeout
+        while True:
+            notifications = self.owner_api.get_notifications(all_notifications=True)
+            ours = self.find_repo_notification(notifications)
+            if predicate(ours) or time.monotonic() >= deadline:
+                return ours
+            time.sleep(poll_interval)
+
     def cleanup_test_repo(self) -> None:
         """Delete the test repository."""
         if self.cleanup and self.created_repo and self.owner_api is not None:
-            print(f"\n{'=' * 60}")
-            print("Cleanup: Deleting test repository")
-            print(f"{'=' * 60}")
+            self.print_banner("Cleanup: Deleting test repository")
             try:
                 self.owner_api.delete_repo(self.owner_username, self.repo_name)
                 print(f"Deleted repo: {self.owner_username}/{self.repo_name}")
@@ -204,11 +316,71 @@ class BaseFlow(ABC):
                 )
                 raise
 
-    def create_browser_context(self, playwright) -> BrowserContext | None:
-        """Create an authenticated browser context for the owner account."""
-        return create_authenticated_context(
-            playwright, self.owner_account, headless=self.headless
+    def save_debug_screenshot(
+        self, page: Page, name: str, selector: str | None = None
+    ) -> Path | None:
+        """
+        Save a JPEG screenshot to RESPONSES_DIR when debug screenshots are on.
+
+        Args:
+            page: The page to capture
+            name: File name, without extension
+            selector: If given and present, capture only its first match
+
+        Returns:
+            The screenshot path, or None if screenshots are disabled
+        """
+        if not DEBUG_SCREENSHOTS:
+            return None
+        path = RESPONSES_DIR / f"{name}.jpg"
+        target: Page | Locator = page
+        if selector is not None:
+            element = page.locator(selector).first
+            if element.count() > 0:
+                target = element
+        target.screenshot(path=str(path), type="jpeg", quality=60)
+        return path
+
+    def new_scraping_page(self, context: BrowserContext) -> Page:
+        """
+        Open a page for reading HTML, without images, media, fonts or CSS.
+
+        Pages that click through the UI need layout and should use
+        context.new_page() instead.  Nothing is blocked when debug
+        screenshots are on, so the screenshots still render properly.
+        """
+        page = context.new_page()
+        if not DEBUG_SCREENSHOTS:
+            page.route("**/*", block_non_essential_requests)
+        return page
+
+    def wait_for_element_gone(
+        self, page: Page, selector: str, timeout: float = 10000
+    ) -> None:
+        """Wait until the first element matching a CSS selector is removed or hidden."""
+        page.wait_for_function(_ELEMENT_GONE_JS, arg=selector, timeout=timeout)
+
+    @contextmanager
+    def browser_context(self) -> Iterator[BrowserContext | None]:
+        """
+        Open an authenticated context for the owner account, closed on exit.
+
+        The context lives on the process-wide shared browser, so opening
+        one costs a context rather than a Chromium launch.  Images, media,
+        fonts and analytics are blocked unless debug screenshots are on;
+        CSS still loads, since clicking through the UI needs layout.
+        Yields None if the account has no stored auth.
+        """
+        context = new_authenticated_context(
+            _get_shared_browser(self.headless), self.owner_account
         )
+        if context is not None and not DEBUG_SCREENSHOTS:
+            context.route("**/*", block_media_requests)
+        try:
+            yield context
+        finally:
+            if context is not None:
+                context.close()
 
     @abstractmethod
     def run(self) -> bool:
@@ -2,10 +2,6 @@
 Basic notification flow - verifies notifications are generated and visible.
 """
 
-import urllib.parse
-
-from playwright.sync_api import sync_playwright
-
 from ghinbox.flows.base import BaseFlow
 from ghinbox.github_api import save_response, RESPONSES_DIR
 from ghinbox.parser.notifications import parse_notifications_html
@@ -49,15 +45,13 @@ class BasicNotificationFlow(BaseFlow):
             print("Checking notifications via web UI")
             print(f"{'=' * 60}")
 
-            with sync_playwright() as p:
-                context = self.create_browser_context(p)
+            with self.browser_context() as context:
                 if context is None:
                     print("Failed to create browser context")
                     return False
 
                 page = context.new_page()
-                query = f"repo:{self.owner_username}/{self.repo_name}"
-                url = f"https://github.com/notifications?query={urllib.parse.quote(query)}"
+                url = self.notifications_url
 
                 page.goto(url, wait_until="domcontentloaded")
                 # Wait for notifications list or empty state
@@ -66,7 +60,6 @@ class BasicNotificationFlow(BaseFlow):
                 )
 
                 # Take screenshot
-                RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
                 screenshot_path = RESPONSES_DIR / "basic_notification_screenshot.png"
                 page.screenshot(path=str(screenshot_path), full_page=True)
                 print(f"Screenshot saved to: {screenshot_path}")
@@ -81,12 +74,7 @@ class BasicNotificationFlow(BaseFlow):
                     repo=self.repo_name,
                     source_url=url,
                 )
-                save_response(
-                    "basic_notification_json", parsed.model_dump(mode="json"), "json"
-                )
-
-                if context.browser:
-                    context.browser.close()
+                save_response("basic_notification_json", parsed, "json")
 
             # Summary
             print(f"\n{'=' * 60}")
@@ -88,14 +88,7 @@ class CommentFetchMarksReadFlow(BaseFlow):
         assert self.owner_api is not None, "Must call validate_prerequisites first"
 
         notifications_all = self.owner_api.get_notifications(all_notifications=True)
-        our_notification = next(
-            (
-                notif
-                for notif in notifications_all
-                if notif.get("repository", {}).get("name") == self.repo_name
-            ),
-            None,
-        )
+        our_notification = self.find_repo_notification(notifications_all)
         thread = self.owner_api.get_notification_thread(thread_id)
 
         snapshot = {
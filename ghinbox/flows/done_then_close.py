@@ -15,246 +15,284 @@ incorrectly pull all previous activity (including old comments)?
 from __future__ import annotations
 
 import time
-import urllib.parse
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
-from playwright.sync_api import sync_playwright, Page
+from playwright.sync_api import BrowserContext, Page
 
 from ghinbox.flows.base import BaseFlow
-from ghinbox.github_api import save_response, RESPONSES_DIR
+from ghinbox.github_api import save_response
 from ghinbox.parser.notifications import parse_notifications_html
 
 
+# How stale (seconds) the notifications list in a snapshot may be
+SNAPSHOT_NOTIFICATIONS_MAX_AGE = 5.0
+
+
 class DoneThenCloseFlow(BaseFlow):
     """Test timestamp behavior when a notification returns after being marked done."""
 
     name = "done_then_close"
     description = "Test timestamp behavior: done notification returns after issue close"
 
+    # Runs each snapshot's API reads concurrently; created per run()
+    _snapshot_executor: ThreadPoolExecutor
+
     def run(self) -> bool:
         """Run the done-then-close timestamp test."""
         if not self.validate_prerequisites():
             return False
 
+        self._snapshot_executor = ThreadPoolExecutor(
+            max_workers=5, thread_name_prefix="ghinbox-snapshot"
+        )
         try:
             if not self.setup_test_repo():
                 return False
 
-            # Step 1: Create issue and add a comment
-            print(f"\n{'=' * 60}")
-            print("Step 1: Creating issue and adding comment")
-            print(f"{'=' * 60}")
-
-            issue = self.create_test_issue()
-            issue_number = issue.get("number")
-            if not isinstance(issue_number, int):
-                print("ERROR: Issue number missing from API response")
-                return False
-
-            # Add a comment from trigger account
-            assert self.trigger_api is not None
-            comment_body = (
-                f"Initial comment at {datetime.now(timezone.utc).isoformat()}"
-            )
-            self.trigger_api.create_issue_comment(
-                self.owner_username, self.repo_name, issue_number, comment_body
-            )
-            print(f"Added comment to issue #{issue_number}")
+            # One context for the whole flow; each UI step opens its own page
+            with self.browser_context() as context:
+                if context is None:
+                    print("Failed to create browser context")
+                    return False
+                return self._run_steps(context)
 
-            # Wait for notification
-            notification = self.wait_for_notification()
-            if not notification:
-                print("ERROR: Notification not found via API")
-                return False
+        finally:
+            self._snapshot_executor.shutdown(wait=False)
+            self.cleanup_test_repo()
 
-            thread_id = notification.get("id")
-            if not isinstance(thread_id, str):
-                print("ERROR: Notification thread ID missing")
-                return False
+    def _run_steps(self, context: BrowserContext) -> bool:
+        """Run the test steps using a shared browser context."""
+        # Step 1: Create issue and add a comment
+        self.print_banner("Step 1: Creating issue and adding comment")
 
-            print(f"Notification thread ID: {thread_id}")
+        issue = self.create_test_issue()
+        issue_number = issue.get("number")
+        if not isinstance(issue_number, int):
+            print("ERROR: Issue number missing from API response")
+            return False
 
-            # Capture initial state (before read)
-            print(f"\n{'=' * 60}")
-            print("Snapshot 1: Before any action (unread)")
-            print(f"{'=' * 60}")
-            snapshot_before_read = self._capture_full_snapshot(
-                label="before_read",
-                thread_id=thread_id,
-                issue_number=issue_number,
-            )
+        # Add a comment from trigger account
+        assert self.trigger_api is not None
+        comment_body = f"Initial comment at {datetime.now(timezone.utc).isoformat()}"
+        self.trigger_api.create_issue_comment(
+            self.owner_username, self.repo_name, issue_number, comment_body
+        )
+        print(f"Added comment to issue #{issue_number}")
 
-            # Step 2: Explicitly READ by navigating to issue page
-            print(f"\n{'=' * 60}")
-            print("Step 2: Reading notification (navigating to issue page)")
-            print(f"{'=' * 60}")
+        # Wait for notification
+        notification = self.wait_for_notification()
+        if not notification:
+            print("ERROR: Notification not found via API")
+            return False
 
-            with sync_playwright() as p:
-                context = self.create_browser_context(p)
-                if context is None:
-                    print("Failed to create browser context")
-                    return False
+        thread_id = notification.get("id")
+        if not isinstance(thread_id, str):
+            print("ERROR: Notification thread ID missing")
+            return False
 
-                page = context.new_page()
-                self._read_notification_via_ui(page, issue_number)
+        print(f"Notification thread ID: {thread_id}")
 
-                if context.browser:
-                    context.browser.close()
+        # Capture initial state (before read)
+        self.print_banner("Snapshot 1: Before any action (unread)")
+        snapshot_before_read = self._capture_full_snapshot(
+            label="before_read",
+            thread_id=thread_id,
+            issue_number=issue_number,
+        )
 
-            time.sleep(3)  # Let GitHub process the read state
+        # Step 2: Explicitly READ by navigating to issue page
+        self.print_banner("Step 2: Reading notification (navigating to issue page)")
 
-            # Capture state after read
-            print(f"\n{'=' * 60}")
-            print("Snapshot 2: After reading (before done)")
-            print(f"{'=' * 60}")
-            snapshot_after_read = self._capture_full_snapshot(
-                label="after_read",
-                thread_id=thread_id,
-                issue_number=issue_number,
-            )
+        page = context.new_page()
+        self._read_notification_via_ui(page, issue_number)
+        page.close()
 
-            # Step 3: Mark as DONE via web UI
-            print(f"\n{'=' * 60}")
-            print("Step 3: Marking notification as DONE")
-            print(f"{'=' * 60}")
+        # Let GitHub process the read state
+        self.wait_for_notification_state(
+            lambda n: n is not None and not n.get("unread")
+        )
 
-            with sync_playwright() as p:
-                context = self.create_browser_context(p)
-                if context is None:
-                    print("Failed to create browser context")
-                    return False
+        # Capture state after read
+        self.print_banner("Snapshot 2: After reading (before done)")
+        snapshot_after_read = self._capture_full_snapshot(
+            label="after_read",
+            thread_id=thread_id,
+            issue_number=issue_number,
+        )
 
-                page = context.new_page()
-                self._mark_as_done_via_ui(page)
+        # Step 3: Mark as DONE via web UI
+        self.print_banner("Step 3: Marking notification as DONE")
 
-                if context.browser:
-                    context.browser.close()
+        page = context.new_page()
+        self._mark_as_done_via_ui(page)
+        page.close()
 
-            time.sleep(3)  # Let GitHub process the done state
+        # Let GitHub process the done state
+        self.wait_for_notification_state(lambda n: n is None)
 
-            # Capture state after done
-            print(f"\n{'=' * 60}")
-            print("Snapshot 3: After marking as done")
-            print(f"{'=' * 60}")
-            snapshot_after_done = self._capture_full_snapshot(
-                label="after_done",
-                thread_id=thread_id,
-                issue_number=issue_number,
-            )
+        # Capture state after done
+        self.print_banner("Snapshot 3: After marking as done")
+        snapshot_after_done = self._capture_full_snapshot(
+            label="after_done",
+            thread_id=thread_id,
+            issue_number=issue_number,
+        )
 
-            # Record the time just before closing
-            pre_close_time = datetime.now(timezone.utc).isoformat()
-            print(f"Pre-close time: {pre_close_time}")
+        # Record the time just before closing
+        pre_close_time = datetime.now(timezone.utc).isoformat()
+        print(f"Pre-close time: {pre_close_time}")
 
-            # Step 4: Close the issue from trigger account
-            print(f"\n{'=' * 60}")
-            print("Step 4: Closing the issue")
-            print(f"{'=' * 60}")
+        # Step 4: Close the issue from trigger account
+        self.print_banner("Step 4: Closing the issue")
 
-            self.trigger_api.close_issue(
-                self.owner_username, self.repo_name, issue_number
-            )
-            print(f"Closed issue #{issue_number}")
+        self.trigger_api.close_issue(self.owner_username, self.repo_name, issue_number)
+        print(f"Closed issue #{issue_number}")
 
-            # Wait for notification to reappear
-            print(f"\n{'=' * 60}")
-            print("Waiting for notification to reappear after close")
-            print(f"{'=' * 60}")
+        # Wait for notification to reappear
+        self.print_banner("Waiting for notification to reappear after close")
 
-            notification_after_close = self._wait_for_notification_update(
-                thread_id=thread_id,
-                previous_updated_at=snapshot_after_done.get("notification_updated_at"),
-            )
+        notification_after_close = self._wait_for_notification_update(
+            thread_id=thread_id,
+            previous_updated_at=snapshot_after_done.get("notification_updated_at"),
+        )
 
-            if not notification_after_close:
-                print("WARNING: Notification did not reappear or update after close")
-                # Still capture state even if notification didn't update
-            else:
-                print("Notification updated after issue close")
-
-            # Capture final state
-            print(f"\n{'=' * 60}")
-            print("Snapshot 4: After issue close")
-            print(f"{'=' * 60}")
-            snapshot_after_close = self._capture_full_snapshot(
-                label="after_close",
-                thread_id=thread_id,
-                issue_number=issue_number,
-            )
+        if not notification_after_close:
+            print("WARNING: Notification did not reappear or update after close")
+            # Still capture state even if notification didn't update
+        else:
+            print("Notification updated after issue close")
+
+        # Capture final state. The API snapshot and the HTML capture are
+        # independent, so the snapshot's reads run in the background while
+        # the browser (which must stay on this thread) loads the inbox.
+        finish_snapshot_after_close = self._start_full_snapshot(
+            label="after_close",
+            thread_id=thread_id,
+            issue_number=issue_number,
+            previous=snapshot_after_done,
+            since=pre_close_time,
+        )
 
-            # Also capture HTML state to see what the UI shows
-            print(f"\n{'=' * 60}")
-            print("Capturing HTML notification state")
-            print(f"{'=' * 60}")
+        # Also capture HTML state to see what the UI shows
+        self.print_banner("Capturing HTML notification state")
 
-            with sync_playwright() as p:
-                context = self.create_browser_context(p)
-                if context is None:
-                    print("Failed to create browser context")
-                    return False
+        page = self.new_scraping_page(context)
+        self._capture_html_state(page)
+        page.close()
 
-                page = context.new_page()
-                self._capture_html_state(page)
-
-                if context.browser:
-                    context.browser.close()
-
-            # Analysis
-            print(f"\n{'=' * 60}")
-            print("ANALYSIS: Timestamp Behavior")
-            print(f"{'=' * 60}")
-            self._analyze_timestamps(
-                snapshot_before_read,
-                snapshot_after_read,
-                snapshot_after_done,
-                snapshot_after_close,
-                pre_close_time,
-            )
+        self.print_banner("Snapshot 4: After issue close")
+        snapshot_after_close = finish_snapshot_after_close()
 
-            return True
+        # Analysis
+        self.print_banner("ANALYSIS: Timestamp Behavior")
+        self._analyze_timestamps(
+            snapshot_before_read,
+            snapshot_after_read,
+            snapshot_after_done,
+            snapshot_after_close,
+            pre_close_time,
+        )
 
-        finally:
-            self.cleanup_test_repo()
+        return True
 
     def _capture_full_snapshot(
         self,
         label: str,
         thread_id: str,
         issue_number: int,
+        previous: dict[str, Any] | None = None,
+        since: str | None = None,
     ) -> dict[str, Any]:
-        """Capture comprehensive snapshot of notification and issue state."""
-        assert self.owner_api is not None
+        """Capture comprehensive snapshot of notification and issue state.
 
-        # Get notification from API
-        notifications_all = self.owner_api.get_notifications(all_notifications=True)
-        our_notification = next(
-            (
-                n
-                for n in notifications_all
-                if n.get("repository", {}).get("name") == self.repo_name
-            ),
-            None,
-        )
+        If previous (an earlier snapshot) and since (an ISO timestamp taken
+        after it) are given, only comments updated since then are fetched
+        and merged into the previous snapshot's comments.
+        """
+        return self._start_full_snapshot(
+            label, thread_id, issue_number, previous=previous, since=since
+        )()
+
+    def _start_full_snapshot(
+        self,
+        label: str,
+        thread_id: str,
+        issue_number: int,
+        previous: dict[str, Any] | None = None,
+        since: str | None = None,
+    ) -> Callable[[], dict[str, Any]]:
+        """Start a snapshot's API reads; see _capture_full_snapshot().
+
+        Returns a function that waits for the reads, then prints, saves and
+        returns the snapshot.  Call it from the flow's own thread so the
+        summary lands in order with the rest of the output.
+        """
+        assert self.owner_api is not None
 
-        # Get thread details
-        thread = self.owner_api.get_notification_thread(thread_id)
+        api = self.owner_api
+        owner, repo = self.owner_username, self.repo_name
 
-        # Get issue details
-        issue = self.owner_api.get_issue(
-            self.owner_username, self.repo_name, issue_number
+        # The five reads are independent, so issue them concurrently
+        pool = self._snapshot_executor
+        # Snapshots directly follow a poll of the same list, so reuse that
+        notifications_future = pool.submit(
+            api.get_notifications,
+            all_notifications=True,
+            max_age=SNAPSHOT_NOTIFICATIONS_MAX_AGE,
         )
-
-        # Get comments
-        comments = self.owner_api.list_issue_comments(
-            self.owner_username, self.repo_name, issue_number
+        thread_future = pool.submit(api.get_notification_thread, thread_id)
+        issue_future = pool.submit(api.get_issue, owner, repo, issue_number)
+        comments_since = None
+        if previous is not None and since is not None:
+            # The API wants whole seconds in UTC; the merge below absorbs
+            # any comments re-sent because of the truncation
+            comments_since = (
+                datetime.fromisoformat(since)
+                .astimezone(timezone.utc)
+                .strftime("%Y-%m-%dT%H:%M:%SZ")
+            )
+        comments_future = pool.submit(
+            api.list_issue_comments, owner, repo, issue_number, since=comments_since
+        )
+        timeline_future = pool.submit(
+            api.list_issue_timeline, owner, repo, issue_number
         )
 
-        # Get timeline events
-        timeline = self.owner_api.list_issue_timeline(
-            self.owner_username, self.repo_name, issue_number
+        return lambda: self._finish_full_snapshot(
+            label,
+            previous,
+            comments_since,
+            notifications_future.result(),
+            thread_future.result(),
+            issue_future.result(),
+            comments_future.result(),
+            timeline_future.result(),
         )
 
+    def _finish_full_snapshot(
+        self,
+        label: str,
+        previous: dict[str, Any] | None,
+        comments_since: str | None,
+        notifications_all: list[Any],
+        thread: Any,
+        issue: Any,
+        comments: list[Any],
+        timeline: list[Any],
+    ) -> dict[str, Any]:
+        """Assemble, print and save a snapshot from its API reads."""
+        # Get notification from API
+        our_notification = self.find_repo_notification(notifications_all)
+
+        if previous is not None and comments_since is not None:
+            updated_ids = {c.get("id") for c in comments}
+            comments = [
+                c for c in previous["comments"] if c.get("id") not in updated_ids
+            ] + comments
+
         snapshot = {
             "label": label,
             "captured_at": datetime.now(timezone.utc).isoformat(),
@@ -273,6 +311,7 @@ class DoneThenCloseFlow(BaseFlow):
             "issue_updated_at": issue.get("updated_at") if issue else None,
             "comments": comments,
             "comments_count": len(comments),
+            "comments_fetched_since": comments_since,
             "timeline": timeline,
             "timeline_count": len(timeline),
         }
@@ -302,28 +341,36 @@ class DoneThenCloseFlow(BaseFlow):
         thread_id: str,
         previous_updated_at: str | None,
         max_attempts: int = 10,
-        wait_seconds: int = 3,
+        initial_wait: float = 0.5,
+        max_wait: float = 5.0,
     ) -> dict[str, Any] | None:
-        """Wait for the notification to update after closing the issue."""
+        """Wait for the notification to update after closing the issue.
+
+        Polls with exponential backoff (initial_wait growing by 1.6x per
+        attempt, capped at max_wait); repeated polls are conditional GETs,
+        so unchanged responses are cheap.
+        """
         assert self.owner_api is not None
 
         for attempt in range(max_attempts):
             if attempt > 0:
+                wait_seconds = min(initial_wait * (1.6 ** (attempt - 1)), max_wait)
                 print(
-                    f"  Attempt {attempt + 1}/{max_attempts}, waiting {wait_seconds}s..."
+                    f"  Attempt {attempt + 1}/{max_attempts}, "
+                    f"waiting {wait_seconds:.1f}s..."
                 )
                 time.sleep(wait_seconds)
 
             # Check both unread notifications and all notifications
             notifications = self.owner_api.get_notifications(all_notifications=True)
 
-            for notif in notifications:
-                if notif.get("repository", {}).get("name") == self.repo_name:
-                    current_updated_at = notif.get("updated_at")
-                    if previous_updated_at is None:
-                        return notif
-                    if current_updated_at and current_updated_at != previous_updated_at:
-                        return notif
+            notif = self.find_repo_notification(notifications)
+            if notif is not None:
+                current_updated_at = notif.get("updated_at")
+                if previous_updated_at is None:
+                    return notif
+                if current_updated_at and current_updated_at != previous_updated_at:
+                    return notif
 
         return None
 
@@ -338,72 +385,72 @@ class DoneThenCloseFlow(BaseFlow):
             '[data-testid="issue-title"], .markdown-body, .comment-body, .js-issue-title'
         ).first.wait_for(state="attached", timeout=10000)
 
-        RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
-        page.screenshot(path=str(RESPONSES_DIR / "done_then_close_issue_page.png"))
-        print("Screenshot saved: done_then_close_issue_page.png")
+        path = self.save_debug_screenshot(page, "done_then_close_issue_page")
+        if path:
+            print(f"Screenshot saved: {path.name}")
         print("Issue page loaded - notification should now be marked as read")
 
     def _mark_as_done_via_ui(self, page: Page) -> None:
         """Mark the notification as done using the Done button."""
-        query = f"repo:{self.owner_username}/{self.repo_name}"
-        url = f"https://github.com/notifications?query={urllib.parse.quote(query)}"
+        url = self.notifications_url
 
         page.goto(url, wait_until="domcontentloaded")
         page.locator(".notifications-list-item, .blankslate").first.wait_for(
             state="attached", timeout=10000
         )
 
-        RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
-        page.screenshot(path=str(RESPONSES_DIR / "done_then_close_before_done.png"))
-        print("Screenshot saved: done_then_close_before_done.png")
+        path = self.save_debug_screenshot(
+            page, "done_then_close_before_done", ".notifications-list-item"
+        )
+        if path:
+            print(f"Screenshot saved: {path.name}")
 
         # Find and click checkbox, then Done button
+        row_selector = f'.notifications-list-item:has(a[href*="{self.repo_name}"])'
         notification_checkbox = page.locator(
-            f'.notifications-list-item:has(a[href*="{self.repo_name}"]) input[type="checkbox"]'
+            f'{row_selector} input[type="checkbox"]'
         ).first
 
         if notification_checkbox.count() > 0:
             notification_checkbox.check()
-            done_button = page.locator('button:has-text("Done")').first
-            done_button.wait_for(state="visible", timeout=5000)
             print("Selected notification checkbox")
-            done_button.click()
-            page.locator(
-                f'.notifications-list-item:has(a[href*="{self.repo_name}"])'
-            ).wait_for(state="hidden", timeout=10000)
+            # click() itself waits for the button to be visible and enabled
+            page.locator('button:has-text("Done")').first.click(timeout=5000)
+            self.wait_for_element_gone(page, row_selector)
             print("Clicked Done button")
         else:
             # Try hover approach
-            notification_row = page.locator(
-                f'.notifications-list-item:has(a[href*="{self.repo_name}"])'
-            ).first
+            notification_row = page.locator(row_selector).first
             if notification_row.count() > 0:
                 notification_row.hover()
                 done_icon = notification_row.locator('button[aria-label*="Done"]').first
-                done_icon.wait_for(state="visible", timeout=5000)
-                done_icon.click()
-                notification_row.wait_for(state="hidden", timeout=10000)
+                done_icon.click(timeout=5000)
+                self.wait_for_element_gone(page, row_selector)
                 print("Clicked Done icon on row")
             else:
                 print("WARNING: Could not find notification to mark as done")
 
-        page.screenshot(path=str(RESPONSES_DIR / "done_then_close_after_done.png"))
-        print("Screenshot saved: done_then_close_after_done.png")
+        path = self.save_debug_screenshot(page, "done_then_close_after_done")
+        if path:
+            print(f"Screenshot saved: {path.name}")
 
     def _capture_html_state(self, page: Page) -> None:
         """Capture the HTML state of notifications after the close event."""
-        query = f"repo:{self.owner_username}/{self.repo_name}"
-        url = f"https://github.com/notifications?query={urllib.parse.quote(query)}"
+        url = self.notifications_url
 
         page.goto(url, wait_until="domcontentloaded")
-        time.sleep(2)  # Give time for notifications to load
+        page.locator(".notifications-list-item, .blankslate").first.wait_for(
+            state="attached", timeout=10000
+        )
 
-        RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
-        page.screenshot(path=str(RESPONSES_DIR / "done_then_close_final_state.png"))
-        print("Screenshot saved: done_then_close_final_state.png")
+        path = self.save_debug_screenshot(
+            page, "done_then_close_final_state", ".notifications-list-item"
+        )
+        if path:
+            print(f"Screenshot saved: {path.name}")
 
         html_content = page.content()
-        save_response("done_then_close_final_html", html_content, "html")
+        save_response("done_then_close_final_html", html_content, "html", compress=True)
 
         # Parse the HTML
         parsed = parse_notifications_html(
@@ -412,16 +459,18 @@ class DoneThenCloseFlow(BaseFlow):
             repo=self.repo_name,
             source_url=url,
         )
-        save_response(
-            "done_then_close_final_parsed", parsed.model_dump(mode="json"), "json"
-        )
+        save_response("done_then_close_final_parsed", parsed, "json")
 
         # Report what we found
-        print(f"Found {len(parsed.notifications)} notifications in HTML")
+        # One write for the whole report rather than three per notification
+        lines = [f"Found {len(parsed.notifications)} notifications in HTML"]
         for notif in parsed.notifications:
-            print(f"  - {notif.subject.title}")
-            print(f"    updated_at: {notif.updated_at}")
-            print(f"    state: {notif.subject.state}")
+            lines += [
+                f"  - {notif.subject.title}",
+                f"    updated_at: {notif.updated_at}",
+                f"    state: {notif.subject.state}",
+            ]
+        print("\n".join(lines))
 
     def _analyze_timestamps(
         self,
@@ -432,9 +481,7 @@ class DoneThenCloseFlow(BaseFlow):
         pre_close_time: str,
     ) -> None:
         """Analyze timestamp behavior across the four snapshots."""
-        print("\n" + "=" * 60)
-        print("TIMESTAMP COMPARISON")
-        print("=" * 60)
+        self.print_banner("TIMESTAMP COMPARISON")
 
         print("\n1. NOTIFICATION TIMESTAMPS:")
         print(f"   Before read:  {before_read.get('notification_updated_at')}")
@@ -463,9 +510,7 @@ class DoneThenCloseFlow(BaseFlow):
         print(f"\n5. PRE-CLOSE REFERENCE TIME: {pre_close_time}")
 
         # Key analysis
-        print("\n" + "=" * 60)
-        print("KEY FINDINGS")
-        print("=" * 60)
+        self.print_banner("KEY FINDINGS")
 
         # Check if reading sets last_read_at
         last_read_before = before_read.get("thread_last_read_at")
@@ -522,9 +567,7 @@ class DoneThenCloseFlow(BaseFlow):
         print(f"   Timeline before: {before_read.get('timeline_count')}")
         print(f"   Timeline after:  {after_close.get('timeline_count')}")
 
-        print("\n" + "=" * 60)
-        print("IMPLICATIONS FOR COMMENT FETCHING")
-        print("=" * 60)
+        self.print_banner("IMPLICATIONS FOR COMMENT FETCHING")
 
         if last_read_after_close is not None:
             print(f"\n✓ last_read_at is available: {last_read_after_close}")
@@ -540,8 +583,6 @@ class DoneThenCloseFlow(BaseFlow):
         if not ts:
             return None
         try:
-            if ts.endswith("Z"):
-                return datetime.fromisoformat(ts.replace("Z", "+00:00"))
             return datetime.fromisoformat(ts)
         except ValueError:
             return None
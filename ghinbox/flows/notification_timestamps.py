@@ -144,14 +144,7 @@ class NotificationTimestampsFlow(BaseFlow):
         assert self.owner_api is not None, "Must call validate_prerequisites first"
 
         notifications_all = self.owner_api.get_notifications(all_notifications=True)
-        our_notification = next(
-            (
-                notif
-                for notif in notifications_all
-                if notif.get("repository", {}).get("name") == self.repo_name
-            ),
-            None,
-        )
+        our_notification = self.find_repo_notification(notifications_all)
 
         thread = self.owner_api.get_notification_thread(thread_id)
         issue = self.owner_api.get_issue(
@@ -237,8 +230,6 @@ class NotificationTimestampsFlow(BaseFlow):
 
     def _parse_iso_datetime(self, value: str) -> datetime | None:
         try:
-            if value.endswith("Z"):
-                return datetime.fromisoformat(value.replace("Z", "+00:00"))
             return datetime.fromisoformat(value)
         except ValueError:
             return None
@@ -9,8 +9,6 @@ import time
 import urllib.parse
 from datetime import datetime
 
-from playwright.sync_api import sync_playwright
-
 from ghinbox.flows.base import BaseFlow
 from ghinbox.github_api import save_response, RESPONSES_DIR
 from ghinbox.parser.notifications import parse_notifications_html
@@ -77,8 +75,7 @@ class PaginationFlow(BaseFlow):
             print("Capturing HTML pages with pagination")
             print(f"{'=' * 60}")
 
-            with sync_playwright() as p:
-                context = self.create_browser_context(p)
+            with self.browser_context() as context:
                 if context is None:
                     print("Failed to create browser context")
                     return False
@@ -103,9 +100,6 @@ class PaginationFlow(BaseFlow):
                 if page1_data.get("prev_cursor"):
                     print("Page 1 has a previous cursor (unexpected)")
 
-                if context.browser:
-                    context.browser.close()
-
             # Summary
             print(f"\n{'=' * 60}")
             print("Test Summary")
@@ -170,8 +164,7 @@ class PaginationFlow(BaseFlow):
         cursor_param: str = "after",
     ) -> dict:
         """Capture a notifications page and extract pagination info."""
-        query = f"repo:{self.owner_username}/{self.repo_name}"
-        url = f"https://github.com/notifications?query={urllib.parse.quote(query)}"
+        url = self.notifications_url
 
         if cursor:
             url += f"&{cursor_param}={urllib.parse.quote(cursor)}"
@@ -184,14 +177,18 @@ class PaginationFlow(BaseFlow):
         )
 
         # Save screenshot
-        RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
         screenshot_path = RESPONSES_DIR / f"pagination_page{page_num}.png"
         page.screenshot(path=str(screenshot_path), full_page=True)
         print(f"  Screenshot: {screenshot_path}")
 
         # Save HTML
         html_content = page.content()
-        html_path = save_response(f"pagination_page{page_num}", html_content, "html")
+        html_path = save_response(
+            f"pagination_page{page_num}",
+            html_content,
+            "html",
+            timestamp=self.run_timestamp,
+        )
         print(f"  HTML: {html_path}")
 
         # Parse HTML and save JSON
@@ -203,8 +200,9 @@ class PaginationFlow(BaseFlow):
         )
         json_path = save_response(
             f"pagination_page{page_num}",
-            parsed.model_dump(mode="json"),
+            parsed,
             "json",
+            timestamp=self.run_timestamp,
         )
         print(f"  JSON: {json_path}")
 
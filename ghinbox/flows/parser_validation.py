@@ -6,13 +6,10 @@ from __future__ import annotations
 
 import base64
 import time
-import urllib.parse
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
-from playwright.sync_api import sync_playwright
-
 from ghinbox.flows.base import BaseFlow
 from ghinbox.github_api import RESPONSES_DIR, GitHubAPI, save_response
 from ghinbox.parser.notifications import parse_notifications_html
@@ -67,7 +64,7 @@ class ParserValidationFlow(BaseFlow):
             )
             save_response(
                 "parser_validation_json",
-                parsed.model_dump(mode="json"),
+                parsed,
                 "json",
             )
 
@@ -405,11 +402,9 @@ class ParserValidationFlow(BaseFlow):
 
     def _fetch_notifications_html(self) -> tuple[str, str]:
         """Fetch notifications HTML for the test repository."""
-        query = f"repo:{self.owner_username}/{self.repo_name}"
-        url = f"https://github.com/notifications?query={urllib.parse.quote(query)}"
+        url = self.notifications_url
 
-        with sync_playwright() as p:
-            context = self.create_browser_context(p)
+        with self.browser_context() as context:
             if context is None:
                 raise RuntimeError("Failed to create browser context")
 
@@ -419,16 +414,12 @@ class ParserValidationFlow(BaseFlow):
                 state="attached", timeout=15000
             )
 
-            RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
             screenshot_path = RESPONSES_DIR / "parser_validation.png"
             page.screenshot(path=str(screenshot_path), full_page=True)
             print(f"Screenshot saved to: {screenshot_path}")
 
             html_content = page.content()
 
-            if context.browser:
-                context.browser.close()
-
         return html_content, url
 
     def _validate_parsed_notifications(
@@ -9,13 +9,15 @@ This flow:
 
 from __future__ import annotations
 
-from ghinbox.api.fetcher import NotificationsFetcher
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from ghinbox.api.fetcher import FetchResult, NotificationsFetcher
 from ghinbox.flows.base import BaseFlow
 from ghinbox.github_api import save_response, RESPONSES_DIR
-from ghinbox.parser.notifications import (
-    parse_notifications_html,
-    extract_authenticity_token,
-)
+from ghinbox.parser.notifications import parse_next_cursor, parse_notifications_html
 
 
 class ProdNotificationsSnapshotFlow(BaseFlow):
@@ -32,10 +34,14 @@ class ProdNotificationsSnapshotFlow(BaseFlow):
         cleanup: bool = True,
         repo: str | None = None,
         pages: int = 1,
+        if_changed: bool = False,
     ):
         super().__init__(owner_account, trigger_account, headless, cleanup)
         self.repo = repo or ""
         self.pages = max(pages, 1)
+        # Skip the browser when the notifications API reports no change
+        # since the last capture of this repo
+        self.if_changed = if_changed
 
     def run(self) -> bool:
         if not self.validate_prerequisites():
@@ -55,13 +61,31 @@ class ProdNotificationsSnapshotFlow(BaseFlow):
         print(f"Repo: {owner}/{repo_name}")
         print(f"Pages: {self.pages}")
 
+        state_path = RESPONSES_DIR / ".cursors" / f"{repo_slug}.json"
+        poll_state: dict[str, Any] = {}
+        if self.if_changed:
+            poll_state = self._load_poll_state(state_path)
+            current = self._last_capture_current(owner, repo_name, poll_state)
+            self._save_poll_state(state_path, poll_state)
+            if current:
+                print("Notifications unchanged since the last capture:")
+                for path in poll_state["captures"]:
+                    print(f"  {path}")
+                return True
+
         after_cursor = None
-        captured = 0
         tokens: list[tuple[int, str]] = []  # (page_num, token)
-
-        with NotificationsFetcher(
-            account=self.owner_account, headless=self.headless
-        ) as fetcher:
+        saved_paths: list[Path] = []
+        pending: list[Future[tuple[Path, Path, str | None]]] = []
+
+        # Saving and fully parsing each page runs on a worker while the
+        # browser fetches the next one; only the Next cursor is read inline
+        with (
+            NotificationsFetcher(
+                account=self.owner_account, headless=self.headless, full_page=True
+            ) as fetcher,
+            ThreadPoolExecutor(max_workers=1) as pool,
+        ):
             for page_num in range(1, self.pages + 1):
                 result = fetcher.fetch_repo_notifications(
                     owner=owner,
@@ -72,40 +96,39 @@ class ProdNotificationsSnapshotFlow(BaseFlow):
                     print(f"ERROR: Failed to fetch notifications: {result.error}")
                     return False
 
-                html_path = save_response(
-                    f"prod_notifications_{repo_slug}_page{page_num}",
-                    result.html,
-                    "html",
-                )
-                parsed = parse_notifications_html(
-                    html=result.html,
-                    owner=owner,
-                    repo=repo_name,
-                    source_url=result.url,
-                )
-                json_path = save_response(
-                    f"prod_notifications_{repo_slug}_page{page_num}",
-                    parsed.model_dump(mode="json"),
-                    "json",
+                pending.append(
+                    pool.submit(
+                        self._save_page,
+                        result,
+                        owner,
+                        repo_name,
+                        f"prod_notifications_{repo_slug}_page{page_num}",
+                    )
                 )
 
-                # Extract authenticity_token for verification
-                token = extract_authenticity_token(result.html)
-                if token:
-                    tokens.append((page_num, token))
-                    print(f"  Page {page_num} token: {token[:20]}...")
-                else:
-                    print(f"  Page {page_num} token: NOT FOUND")
+                after_cursor = parse_next_cursor(result.html)
+                if not after_cursor:
+                    break
 
-                print(f"  Page {page_num} HTML: {html_path}")
-                print(f"  Page {page_num} JSON: {json_path}")
-                captured += 1
+        for page_num, future in enumerate(pending, start=1):
+            html_path, json_path, token = future.result()
 
-                if not parsed.pagination.has_next or not parsed.pagination.after_cursor:
-                    break
-                after_cursor = parsed.pagination.after_cursor
+            # Report authenticity_token for verification
+            if token:
+                tokens.append((page_num, token))
+                print(f"  Page {page_num} token: {token[:20]}...")
+            else:
+                print(f"  Page {page_num} token: NOT FOUND")
+
+            print(f"  Page {page_num} HTML: {html_path}")
+            print(f"  Page {page_num} JSON: {json_path}")
+            saved_paths += [html_path, json_path]
+        captured = len(pending)
 
         print(f"\nSaved {captured} page(s) to: {RESPONSES_DIR}")
+        if self.if_changed:
+            poll_state["captures"] = [str(path) for path in saved_paths]
+            self._save_poll_state(state_path, poll_state)
 
         # Report on token stability across pages
         if len(tokens) > 1:
@@ -123,6 +146,53 @@ class ProdNotificationsSnapshotFlow(BaseFlow):
             print(f"  Token: {tokens[0][1][:40]}...")
         return True
 
+    def _save_page(
+        self, result: FetchResult, owner: str, repo: str, name: str
+    ) -> tuple[Path, Path, str | None]:
+        """
+        Save a fetched page's HTML and parsed JSON.
+
+        Returns:
+            (HTML path, JSON path, authenticity_token or None)
+        """
+        html_path = save_response(
+            name, result.html, "html", timestamp=self.run_timestamp
+        )
+        parsed = parse_notifications_html(
+            html=result.html,
+            owner=owner,
+            repo=repo,
+            source_url=result.url,
+        )
+        json_path = save_response(name, parsed, "json", timestamp=self.run_timestamp)
+        # The parse already extracted the token; don't build a second soup
+        return html_path, json_path, parsed.authenticity_token
+
+    def _last_capture_current(
+        self, owner: str, repo: str, poll_state: dict[str, Any]
+    ) -> bool:
+        """
+        Poll the notifications API, updating poll_state with its validators.
+
+        Returns:
+            True if a previous capture exists and nothing changed since
+        """
+        assert self.owner_api is not None
+        changed = self.owner_api.poll_notifications(poll_state, owner, repo)
+        return bool(poll_state.get("captures")) and changed is None
+
+    def _load_poll_state(self, path: Path) -> dict[str, Any]:
+        if not path.exists():
+            return {}
+        try:
+            return json.loads(path.read_text())
+        except json.JSONDecodeError:
+            return {}
+
+    def _save_poll_state(self, path: Path, poll_state: dict[str, Any]) -> None:
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(json.dumps(poll_state, indent=2))
+
     def _parse_repo(self, value: str) -> tuple[str, str] | None:
         trimmed = value.strip()
         if not trimmed:
@@ -17,7 +17,7 @@ from typing import Any
 
 from ghinbox.api.fetcher import NotificationsFetcher
 from ghinbox.flows.base import BaseFlow
-from ghinbox.github_api import RESPONSES_DIR, save_response
+from ghinbox.github_api import save_response
 from ghinbox.parser.notifications import parse_notifications_html
 
 
@@ -219,7 +219,6 @@ class ProdUndoFlow(BaseFlow):
             source_url=result.url,
         )
         if label:
-            RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
             save_response(f"prod_undo_{label}", result.html, "html")
             save_response(
                 f"prod_undo_{label}",
@@ -11,11 +11,9 @@ This flow:
 """
 
 import json
-import time
-import urllib.parse
 from typing import Any
 
-from playwright.sync_api import sync_playwright, Page
+from playwright.sync_api import Page
 
 from ghinbox.flows.base import BaseFlow
 from ghinbox.github_api import save_response, RESPONSES_DIR
@@ -66,8 +64,7 @@ class ReadVsDoneFlow(BaseFlow):
             print("Marking notification as READ (clicking into it)")
             print(f"{'=' * 60}")
 
-            with sync_playwright() as p:
-                context = self.create_browser_context(p)
+            with self.browser_context() as context:
                 if context is None:
                     print("Failed to create browser context")
                     return False
@@ -75,10 +72,10 @@ class ReadVsDoneFlow(BaseFlow):
                 page = context.new_page()
                 self._mark_as_read_via_ui(page)
 
-                if context.browser:
-                    context.browser.close()
-
-            time.sleep(2)  # Let GitHub process the read state
+            # Let GitHub process the read state, moving on once the API shows it
+            self.wait_for_notification_state(
+                lambda n: n is not None and not n.get("unread")
+            )
 
             # Capture READ state
             print(f"\n{'=' * 60}")
@@ -91,8 +88,7 @@ class ReadVsDoneFlow(BaseFlow):
             print("Marking notification as DONE (clicking Done button)")
             print(f"{'=' * 60}")
 
-            with sync_playwright() as p:
-                context = self.create_browser_context(p)
+            with self.browser_context() as context:
                 if context is None:
                     print("Failed to create browser context")
                     return False
@@ -100,10 +96,8 @@ class ReadVsDoneFlow(BaseFlow):
                 page = context.new_page()
                 self._mark_as_done_via_ui(page)
 
-                if context.browser:
-                    context.browser.close()
-
-            time.sleep(2)  # Let GitHub process the done state
+            # Let GitHub process the done state, moving on once the API shows it
+            self.wait_for_notification_state(lambda n: n is None)
 
             # Capture DONE state
             print(f"\n{'=' * 60}")
@@ -163,11 +157,7 @@ class ReadVsDoneFlow(BaseFlow):
                 print(f"    Our notification present: {found}")
 
         # Find our specific notification and capture its details
-        our_notif = None
-        for notif in state["notifications_all"]:
-            if notif.get("repository", {}).get("name") == self.repo_name:
-                our_notif = notif
-                break
+        our_notif = self.find_repo_notification(state["notifications_all"])
 
         state["our_notification"] = our_notif
         if our_notif:
@@ -184,8 +174,7 @@ class ReadVsDoneFlow(BaseFlow):
 
     def _mark_as_read_via_ui(self, page: Page) -> None:
         """Mark the notification as read by clicking into it."""
-        query = f"repo:{self.owner_username}/{self.repo_name}"
-        url = f"https://github.com/notifications?query={urllib.parse.quote(query)}"
+        url = self.notifications_url
 
         page.goto(url, wait_until="domcontentloaded")
         # Wait for notifications list or empty state
@@ -194,7 +183,6 @@ class ReadVsDoneFlow(BaseFlow):
         )
 
         # Screenshot before
-        RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
         page.screenshot(path=str(RESPONSES_DIR / "before_read.png"))
         print("Screenshot saved: before_read.png")
 
@@ -219,8 +207,7 @@ class ReadVsDoneFlow(BaseFlow):
 
     def _mark_as_done_via_ui(self, page: Page) -> None:
         """Mark the notification as done using the Done button."""
-        query = f"repo:{self.owner_username}/{self.repo_name}"
-        url = f"https://github.com/notifications?query={urllib.parse.quote(query)}"
+        url = self.notifications_url
 
         page.goto(url, wait_until="domcontentloaded")
         # Wait for notifications list or empty state
@@ -229,7 +216,6 @@ class ReadVsDoneFlow(BaseFlow):
         )
 
         # Screenshot before
-        RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
         page.screenshot(path=str(RESPONSES_DIR / "before_done.png"))
         print("Screenshot saved: before_done.png")
         html_content = page.content()
@@ -241,7 +227,7 @@ class ReadVsDoneFlow(BaseFlow):
             repo=self.repo_name,
             source_url=url,
         )
-        save_response("json_before_done", parsed.model_dump(mode="json"), "json")
+        save_response("json_before_done", parsed, "json")
 
         # Find the notification row and select it, then click Done
         # The notification has a checkbox we need to click first
@@ -299,7 +285,7 @@ class ReadVsDoneFlow(BaseFlow):
             repo=self.repo_name,
             source_url=url,
         )
-        save_response("json_after_done", parsed_after.model_dump(mode="json"), "json")
+        save_response("json_after_done", parsed_after, "json")
 
     def _check_graphql_notifications(self) -> dict[str, Any]:
         """Try to query notifications via GraphQL."""
@@ -2,26 +2,121 @@
 GitHub API client and common utilities.
 """
 
-import json
-import urllib.error
+import gzip
+import hashlib
+import threading
+import time
 import urllib.parse
-import urllib.request
+from dataclasses import dataclass
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any
 
+import httpx
+import pydantic_core
 
 RESPONSES_DIR = Path("responses")
 
+# Gateway errors worth retrying for idempotent requests
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.2  # seconds, doubled per retry
+
+# Longest rate-limit wait honoured before giving up, in seconds
+_MAX_RATE_LIMIT_WAIT = 60.0
+
+
+def _rate_limit_wait(response: httpx.Response) -> float | None:
+    """
+    Seconds to wait before retrying a rate-limited response, or None.
+
+    GitHub answers 429, or 403 for secondary limits, with Retry-After; an
+    exhausted primary limit has X-RateLimit-Remaining: 0 and a reset time.
+    Waits longer than _MAX_RATE_LIMIT_WAIT are not worth blocking a flow on.
+    Retry-After may be either delay-seconds or an HTTP date; an unparseable
+    value is treated as no hint.
+    """
+    if response.status_code not in (403, 429):
+        return None
+    headers = response.headers
+    try:
+        if "Retry-After" in headers:
+            retry_after = headers["Retry-After"]
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                wait = parsedate_to_datetime(retry_after).timestamp() - time.time()
+        elif headers.get("X-RateLimit-Remaining") == "0":
+            wait = float(headers.get("X-RateLimit-Reset", 0)) - time.time()
+        else:
+            return None
+    except (TypeError, ValueError):
+        return None
+    return max(wait, 1.0) if wait <= _MAX_RATE_LIMIT_WAIT else None
+
+
+# Logins keyed by SHA-256 of the token.  A token only ever belongs to one
+# user, so these are kept across runs and save each flow its /user calls.
+_LOGINS_PATH = RESPONSES_DIR / ".logins.json"
+_logins: dict[str, str] | None = None
+
+# Shared keep-alive client for every GitHubAPI instance (created lazily),
+# so owner and trigger accounts reuse TLS connections to api.github.com
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> httpx.Client:
+    """Get or create the shared httpx client."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    timeout=30.0,
+                    follow_redirects=True,
+                    limits=httpx.Limits(
+                        max_connections=16, max_keepalive_connections=16
+                    ),
+                    transport=httpx.HTTPTransport(retries=_MAX_RETRIES),
+                )
+    return _client
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """The latest GET response for an endpoint, with its validators."""
+
+    fetched_at: float
+    body: Any
+    etag: str | None
+    last_modified: str | None
+
 
 class GitHubAPI:
-    """Simple GitHub API client using urllib (no external deps)."""
+    """Simple GitHub API client over a shared keep-alive httpx client."""
 
     BASE_URL = "https://api.github.com"
 
     def __init__(self, token: str):
         self.token = token
+        # Shared by every request; callers needing more headers merge into a copy
+        self._base_headers_get = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        self._base_headers_json = {
+            **self._base_headers_get,
+            "Content-Type": "application/json",
+        }
+        self._graphql_headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
         self._user_cache: Any = None
+        self._get_cache: dict[str, _CachedResponse] = {}
 
     def _request(
         self,
@@ -29,48 +124,102 @@ class GitHubAPI:
         endpoint: str,
         data: dict | None = None,
     ) -> dict | list | None:
-        """Make an API request."""
-        url = f"{self.BASE_URL}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28",
-        }
-
-        body = None
-        if data is not None:
-            body = json.dumps(data).encode("utf-8")
-            headers["Content-Type"] = "application/json"
-
-        request = urllib.request.Request(
-            url,
-            data=body,
-            headers=headers,
-            method=method,
-        )
+        """Make a write request."""
+        response = self._send_raw(method, endpoint, data)
+        # A write may change anything we've read, so cached GETs must be
+        # revalidated before reuse (their validators are kept)
+        for cached in self._get_cache.values():
+            cached.fetched_at = float("-inf")
+        return self._decode(response)
+
+    def _send_raw(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Make an API request, returning the response for any non-error status.
 
-        try:
-            with urllib.request.urlopen(request) as response:
-                if response.status == 204:  # No content
-                    return None
-                body = response.read()
-                if not body:
-                    return None
-                return json.loads(body.decode("utf-8"))
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode("utf-8") if e.fp else ""
-            print(f"API Error {e.code}: {e.reason}")
+        Raises:
+            httpx.HTTPStatusError: On an error status
+        """
+        url = f"{self.BASE_URL}{endpoint}"
+        if data is None:
+            body = None
+            headers = self._base_headers_get
+        else:
+            body = pydantic_core.to_json(data)
+            headers = self._base_headers_json
+        if extra_headers:
+            headers = {**headers, **extra_headers}
+
+        retries = _MAX_RETRIES if method in ("GET", "PUT", "DELETE") else 0
+        rate_limit_retried = False
+        attempt = 0
+        while True:
+            response = get_client().request(method, url, content=body, headers=headers)
+            rate_limit_wait = _rate_limit_wait(response)
+            if rate_limit_wait is not None and not rate_limit_retried:
+                # GitHub rejected the request unprocessed, so retrying is
+                # safe for any method; wait as long as it asks, once
+                print(f"Rate limited, retrying in {rate_limit_wait:.0f}s")
+                time.sleep(rate_limit_wait)
+                rate_limit_retried = True
+                continue
+            if response.status_code not in _RETRY_STATUSES or attempt == retries:
+                break
+            time.sleep(_RETRY_BACKOFF * (2**attempt))
+            attempt += 1
+
+        if response.is_error:
+            print(f"API Error {response.status_code}: {response.reason_phrase}")
             print(f"  URL: {url}")
-            print(f"  Body: {error_body}")
-            raise
+            print(f"  Body: {response.text}")
+            response.raise_for_status()
+        return response
+
+    def _decode(self, response: httpx.Response) -> dict | list | None:
+        if response.status_code == 204 or not response.content:  # No content
+            return None
+        # Parses the body bytes directly, faster than json.loads
+        return pydantic_core.from_json(response.content)
 
     def _with_params(self, endpoint: str, params: dict[str, str]) -> str:
         if not params:
             return endpoint
         return f"{endpoint}?{urllib.parse.urlencode(params)}"
 
-    def get(self, endpoint: str) -> dict | list | None:
-        return self._request("GET", endpoint)
+    def get(self, endpoint: str, max_age: float = 0.0) -> dict | list | None:
+        """GET an endpoint, reusing a response fetched within max_age seconds.
+
+        Otherwise the request is made conditional on the previous response's
+        ETag and Last-Modified; GitHub answers an unchanged resource with an
+        empty 304, which doesn't count against the rate limit, and the
+        already-decoded body is reused.
+        """
+        now = time.monotonic()
+        cached = self._get_cache.get(endpoint)
+        if cached is not None and now - cached.fetched_at < max_age:
+            return cached.body
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        response = self._send_raw("GET", endpoint, extra_headers=headers)
+        if response.status_code == 304 and cached is not None:
+            cached.fetched_at = now
+            return cached.body
+        result = self._decode(response)
+        self._get_cache[endpoint] = _CachedResponse(
+            fetched_at=now,
+            body=result,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return result
 
     def post(self, endpoint: str, data: dict) -> Any:
         return self._request("POST", endpoint, data)
@@ -91,8 +240,21 @@ class GitHubAPI:
         return self._user_cache
 
     def get_username(self) -> str:
-        """Get the authenticated user's username."""
-        return self.get_user()["login"]
+        """Get the authenticated user's username, cached across runs."""
+        global _logins
+        if _logins is None:
+            try:
+                _logins = pydantic_core.from_json(_LOGINS_PATH.read_bytes())
+            except (OSError, ValueError):
+                _logins = {}
+        key = hashlib.sha256(self.token.encode()).hexdigest()
+        login = _logins.get(key)
+        if login is None:
+            login = self.get_user()["login"]
+            _logins[key] = login
+            RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
+            _LOGINS_PATH.write_bytes(pydantic_core.to_json(_logins, indent=2))
+        return login
 
     def create_repo(self, name: str, private: bool = True) -> Any:
         """Create a new repository."""
@@ -153,8 +315,13 @@ class GitHubAPI:
         all_notifications: bool = False,
         participating: bool = False,
         since: str | None = None,
+        max_age: float = 0.0,
     ) -> list[Any]:
-        """Get notifications via API."""
+        """Get notifications via API.
+
+        Pass max_age to reuse a list fetched within that many seconds (e.g.
+        by a poll that just confirmed the state the caller is waiting for).
+        """
         params: dict[str, str] = {}
         if all_notifications:
             params["all"] = "true"
@@ -165,7 +332,49 @@ class GitHubAPI:
 
         endpoint = self._with_params("/notifications", params)
 
-        result = self.get(endpoint)
+        result = self.get(endpoint, max_age=max_age)
+        return result if isinstance(result, list) else []
+
+    def poll_notifications(
+        self,
+        state: dict[str, Any],
+        owner: str | None = None,
+        repo: str | None = None,
+    ) -> list[Any] | None:
+        """Poll notifications, following GitHub's polling protocol.
+
+        state holds the validators from the previous poll and the earliest
+        time the next one may be sent (per X-Poll-Interval); it is updated in
+        place and is plain JSON, so callers can persist it between runs.
+        Pass owner and repo to poll a single repository's notifications.
+
+        Returns:
+            The notifications if they changed since the previous poll, or
+            None if they didn't or the poll interval hasn't elapsed yet
+        """
+        # Wall-clock time, since the state may outlive this process
+        if time.time() < state.get("next_poll_at", 0):
+            return None
+
+        headers: dict[str, str] = {}
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+        base = f"/repos/{owner}/{repo}/notifications" if owner else "/notifications"
+        endpoint = self._with_params(base, {"all": "true"})
+        response = self._send_raw("GET", endpoint, extra_headers=headers)
+
+        state["etag"] = response.headers.get("ETag", state.get("etag"))
+        state["last_modified"] = response.headers.get(
+            "Last-Modified", state.get("last_modified")
+        )
+        state["next_poll_at"] = time.time() + int(
+            response.headers.get("X-Poll-Interval", "60")
+        )
+        if response.status_code == 304:
+            return None
+        result = self._decode(response)
         return result if isinstance(result, list) else []
 
     def get_notification_thread(self, thread_id: str) -> Any:
@@ -246,55 +455,79 @@ class GitHubAPI:
     def graphql(self, query: str, variables: dict | None = None) -> Any:
         """Execute a GraphQL query."""
         url = "https://api.github.com/graphql"
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
 
         payload: dict[str, Any] = {"query": query}
         if variables:
             payload["variables"] = variables
 
-        body = json.dumps(payload).encode("utf-8")
-
-        request = urllib.request.Request(
+        response = get_client().post(
             url,
-            data=body,
-            headers=headers,
-            method="POST",
+            content=pydantic_core.to_json(payload),
+            headers=self._graphql_headers,
         )
+        if response.is_error:
+            print(f"GraphQL Error {response.status_code}: {response.reason_phrase}")
+            print(f"  Body: {response.text}")
+            response.raise_for_status()
+        return response.json()
 
-        try:
-            with urllib.request.urlopen(request) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode("utf-8") if e.fp else ""
-            print(f"GraphQL Error {e.code}: {e.reason}")
-            print(f"  Body: {error_body}")
-            raise
 
+# Digest -> file for content already written by compressed save_response calls
+_saved_digests: dict[bytes, Path] = {}
 
-def save_response(name: str, data: Any, fmt: str = "json") -> Path:
+
+def save_response(
+    name: str,
+    data: Any,
+    fmt: str = "json",
+    compress: bool = False,
+    timestamp: str | None = None,
+) -> Path:
     """
     Save a response to the responses directory.
 
     Args:
         name: Base name for the file
-        data: Data to save (dict/list for json, str for html)
+        data: Data to save (dict/list or Pydantic model for json, str for html)
         fmt: 'json' or 'html'
+        compress: Write a fast gzip (.gz) file, and if the same content was
+            already saved this way, only write a small .ref file naming it
+        timestamp: Filename timestamp (YYYYmmdd_HHMMSS), so files saved
+            together share one; defaults to now
 
     Returns:
-        Path to the saved file
+        Path to the saved file (for a deduplicated save, the earlier file)
     """
     RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"{name}_{timestamp}.{fmt}"
     filepath = RESPONSES_DIR / filename
 
     if fmt == "json":
-        filepath.write_text(json.dumps(data, indent=2))
+        # Serializes straight to bytes, much faster than json.dumps for the
+        # multi-MB snapshot payloads; models are serialized directly, with
+        # no intermediate model_dump() dict
+        raw = pydantic_core.to_json(data, indent=2)
     else:
-        filepath.write_text(data if isinstance(data, str) else str(data))
-
+        raw = (data if isinstance(data, str) else str(data)).encode("utf-8")
+
+    if not compress:
+        filepath.write_bytes(raw)
+        print(f"Saved response to: {filepath}")
+        return filepath
+
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    existing = _saved_digests.get(digest)
+    if existing is not None and existing.exists():
+        ref_path = filepath.with_name(f"{filename}.ref")
+        ref_path.write_text(f"{existing.name}\n")
+        print(f"Response unchanged from {existing}, saved reference: {ref_path}")
+        return existing
+
+    filepath = filepath.with_name(f"{filename}.gz")
+    with gzip.open(filepath, "wb", compresslevel=1) as f:
+        f.write(raw)
+    _saved_digests[digest] = filepath
     print(f"Saved response to: {filepath}")
     return filepath
@@ -9,6 +9,8 @@ import re
 from datetime import datetime
 from urllib.parse import parse_qs, urljoin, urlparse
 
+import lxml.etree
+import lxml.html
 from bs4 import BeautifulSoup, Tag
 
 from ghinbox.api.models import (
@@ -78,6 +80,63 @@ def parse_notifications_html(
     )
 
 
+# XPath equivalents of the selectors used by _parse_notification_items and
+# _extract_subject, for the lightweight lxml path below
+_ITEMS_XPATH = lxml.etree.XPath(
+    "//li[contains(concat(' ', normalize-space(@class), ' '),"
+    " ' notifications-list-item ') and @data-notification-id]"
+)
+_ITEM_LINK_XPATH = lxml.etree.XPath(
+    ".//a[contains(concat(' ', normalize-space(@class), ' '),"
+    " ' notification-list-item-link ')]/@href"
+)
+
+
+def parse_first_notification_url(html: str) -> tuple[str, bool, int] | None:
+    """
+    Return the subject URL and unread flag of the first notification.
+
+    A cheap alternative to parse_notifications_html for callers that only
+    look at the top row: it queries the lxml tree directly instead of
+    building BeautifulSoup and Pydantic objects for every item.
+
+    Args:
+        html: The raw HTML content of the notifications page
+
+    Returns:
+        (url, unread, item_count), or None if the page has no notifications
+    """
+    if not html.strip():
+        return None
+    items = _ITEMS_XPATH(lxml.html.fromstring(html))
+    if not items:
+        return None
+    first = items[0]
+    hrefs = _ITEM_LINK_XPATH(first)
+    url = urljoin("https://github.com", hrefs[0]) if hrefs and hrefs[0] else ""
+    unread = "notification-unread" in (first.get("class") or "").split()
+    return url, unread, len(items)
+
+
+_NEXT_HREF_XPATH = lxml.etree.XPath('//a[@aria-label="Next"]/@href')
+
+
+def parse_next_cursor(html: str) -> str | None:
+    """
+    Return the "after" cursor of the page's Next link, if any.
+
+    Matches parse_notifications_html(...).pagination.after_cursor, but only
+    looks up the one link, so a caller paginating can request the next
+    page before fully parsing this one.
+    """
+    if not html.strip():
+        return None
+    hrefs = _NEXT_HREF_XPATH(lxml.html.fromstring(html))
+    if not hrefs:
+        return None
+    return _extract_cursor_from_href(hrefs[0], "after")
+
+
 def _parse_notification_items(soup: BeautifulSoup) -> list[Notification]:
     """Parse all notification list items from the page."""
     notifications: list[Notification] = []
@@ -154,8 +213,8 @@ def _extract_updated_at(item: Tag) -> datetime:
     if relative_time:
         dt_str = relative_time.get("datetime")
         if dt_str and isinstance(dt_str, str):
-            # Parse ISO format datetime
-            return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+            # Parse ISO format datetime ("Z" suffix is accepted natively)
+            return datetime.fromisoformat(dt_str)
 
     # Fallback to now if not found
     return datetime.now()
@@ -223,10 +282,13 @@ def _extract_markdown_title(title_elem: Tag) -> str:
     return " ".join(raw_title.split())
 
 
+_NUMBER_RE = re.compile(r"/(?:issues|pull|discussions)/(\d+)")
+
+
 def _extract_number_from_url(path: str) -> int | None:
     """Extract issue/PR number from URL path."""
     # Pattern: /owner/repo/issues/123 or /owner/repo/pull/123
-    match = re.search(r"/(?:issues|pull|discussions)/(\d+)", path)
+    match = _NUMBER_RE.search(path)
     if match:
         return int(match.group(1))
     return None
@@ -20,33 +20,21 @@ Available flows:
 import argparse
 import sys
 
-from ghinbox.flows import (
-    AnchorTrackingFlow,
-    BasicNotificationFlow,
-    CommentFetchMarksReadFlow,
-    CommentPrefetchValidationFlow,
-    DoneThenCloseFlow,
-    NotificationTimestampsFlow,
-    PaginationFlow,
-    ParserValidationFlow,
-    ProdNotificationsSnapshotFlow,
-    ProdUndoFlow,
-    ReadVsDoneFlow,
-)
-
+from ghinbox import flows
 
+# Flow name -> class name in ghinbox.flows; only the chosen flow is imported
 FLOWS = {
-    "anchor_tracking": AnchorTrackingFlow,
-    "basic": BasicNotificationFlow,
-    "comment_fetch_marks_read": CommentFetchMarksReadFlow,
-    "comment_prefetch_validation": CommentPrefetchValidationFlow,
-    "done_then_close": DoneThenCloseFlow,
-    "notification_timestamps": NotificationTimestampsFlow,
-    "pagination": PaginationFlow,
-    "read_vs_done": ReadVsDoneFlow,
-    "parser_validation": ParserValidationFlow,
-    "prod_notifications_snapshot": ProdNotificationsSnapshotFlow,
-    "prod_undo": ProdUndoFlow,
+    "anchor_tracking": "AnchorTrackingFlow",
+    "basic": "BasicNotificationFlow",
+    "comment_fetch_marks_read": "CommentFetchMarksReadFlow",
+    "comment_prefetch_validation": "CommentPrefetchValidationFlow",
+    "done_then_close": "DoneThenCloseFlow",
+    "notification_timestamps": "NotificationTimestampsFlow",
+    "pagination": "PaginationFlow",
+    "read_vs_done": "ReadVsDoneFlow",
+    "parser_validation": "ParserValidationFlow",
+    "prod_notifications_snapshot": "ProdNotificationsSnapshotFlow",
+    "prod_undo": "ProdUndoFlow",
 }
 
 
@@ -107,10 +95,18 @@ Available flows:
         default=1,
         help="Pages of notifications to capture (prod_notifications_snapshot only)",
     )
+    parser.add_argument(
+        "--if-changed",
+        action="store_true",
+        help=(
+            "Skip the capture if the notifications API reports no change since "
+            "the last one (prod_notifications_snapshot only)"
+        ),
+    )
 
     args = parser.parse_args()
 
-    flow_class = FLOWS[args.flow]
+    flow_class = getattr(flows, FLOWS[args.flow])
 
     # Build kwargs based on flow type
     kwargs = {
@@ -126,6 +122,7 @@ Available flows:
     if args.flow == "prod_notifications_snapshot":
         kwargs["repo"] = args.repo
         kwargs["pages"] = args.pages
+        kwargs["if_changed"] = args.if_changed
 
     flow = flow_class(**kwargs)
 
@@ -18,6 +18,7 @@ from ghinbox.auth import (
     has_valid_auth,
     create_authenticated_context,
 )
+from ghinbox.github_api import get_client
 
 
 TOKEN_DIR = Path("auth_state")
@@ -62,7 +63,7 @@ def verify_token(account: str) -> tuple[bool, str | None]:
         return False, None
 
     try:
-        response = httpx.get(
+        response = get_client().get(
             "https://api.github.com/user",
             headers={
                 "Authorization": f"Bearer {token}",
@@ -309,10 +310,9 @@ def _create_classic_token(page: Page, token_name: str, scopes: list[str]) -> str
 
     # Method 4: Check code elements
     if not token:
-        code_elements = page.locator("code")
-        for i in range(code_elements.count()):
-            text = code_elements.nth(i).text_content()
-            if text and text.startswith("ghp_"):
+        # One round-trip for every element's text, not two per element
+        for text in page.locator("code").all_text_contents():
+            if text.startswith("ghp_"):
                 token = text
                 break
 
@@ -312,3 +312,124 @@ class TestResponseSchema:
             ui = notif["ui"]
             assert "saved" in ui
             assert "done" in ui
+
+
+class TestLoginRateLimit:
+    """Tests for per-account login rate limiting."""
+
+    def test_start_login_returns_429_when_exhausted(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that starting a login fails once the account's bucket is empty."""
+        from collections import OrderedDict
+
+        from ghinbox.api import login_routes
+
+        monkeypatch.setattr(login_routes, "_LOGIN_BUCKETS", OrderedDict())
+
+        account = "rate-limit-test"
+        bucket = login_routes._login_bucket(account)
+        while bucket.consume(1):
+            pass
+
+        response = client.post("/auth/login/start", json={"account": account})
+        assert response.status_code == 429
+
+    def test_bucket_table_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that full buckets go first, then the least recently used."""
+        from collections import OrderedDict
+
+        from ghinbox.api import login_routes
+
+        buckets: OrderedDict = OrderedDict()
+        monkeypatch.setattr(login_routes, "_LOGIN_BUCKETS", buckets)
+        monkeypatch.setattr(login_routes, "_MAX_LOGIN_BUCKETS", 2)
+
+        login_routes._login_bucket("used").consume(1)
+        login_routes._login_bucket("full")
+        login_routes._login_bucket("new")
+        assert list(buckets) == ["used", "new"]
+
+        login_routes._login_bucket("new").consume(1)
+        login_routes._login_bucket("used")
+        login_routes._login_bucket("newer")
+        assert list(buckets) == ["used", "newer"]
+
+
+class TestLoginSessionLimit:
+    """Tests for the login session cap."""
+
+    def test_evicts_idle_sessions_then_refuses(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that idle sessions are evicted and active ones are kept."""
+        from ghinbox.api.login_state import (
+            LoginState,
+            SessionLimitError,
+            get_session_manager,
+        )
+
+        manager = get_session_manager()
+        monkeypatch.setattr(manager, "_sessions", {})
+        monkeypatch.setattr(manager, "max_sessions", 2)
+
+        idle = manager.create_session("a")
+        active = manager.create_session("b")
+        manager.update_state(active.session_id, LoginState.WAITING_2FA)
+
+        assert manager.evict_if_full() == []
+        assert manager.get_session(idle.session_id) is None
+        assert manager.get_session(active.session_id) is not None
+
+        other = manager.create_session("c")
+        manager.update_state(other.session_id, LoginState.WAITING_MOBILE)
+        with pytest.raises(SessionLimitError):
+            manager.evict_if_full()
+
+    def test_returns_fetchers_of_evicted_sessions(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that evicted and expired sessions hand back their fetchers."""
+        from ghinbox.api.login_state import LoginState, get_session_manager
+
+        manager = get_session_manager()
+        monkeypatch.setattr(manager, "_sessions", {})
+        monkeypatch.setattr(manager, "max_sessions", 2)
+
+        expired = manager.create_session("a")
+        idle = manager.create_session("b")
+        active = manager.create_session("c")
+        manager.update_state(active.session_id, LoginState.WAITING_2FA)
+        expired_fetcher, idle_fetcher = object(), object()
+        manager.set_fetcher(expired.session_id, expired_fetcher)  # type: ignore[arg-type]
+        manager.set_fetcher(idle.session_id, idle_fetcher)  # type: ignore[arg-type]
+        expired.created_at -= 600
+
+        fetchers = manager.evict_if_full()
+
+        assert fetchers == [expired_fetcher, idle_fetcher]
+        assert manager.session_count() == 1
+
+
+class TestMobileApprovalPoll:
+    """Tests for polling GitHub Mobile 2FA approval."""
+
+    def test_navigation_during_check_counts_as_pending(self) -> None:
+        """Test that a check interrupted by navigation reports still pending."""
+        import asyncio
+
+        from playwright.async_api import Error
+
+        from ghinbox.api.login_fetcher import LoginFetcher, PageState
+
+        class NavigatingLocator:
+            async def count(self) -> int:
+                raise Error("Execution context was destroyed")
+
+        fetcher = LoginFetcher()
+        fetcher._page = object()  # type: ignore[assignment]
+        fetcher._loc = lambda selector: NavigatingLocator()  # type: ignore[method-assign]
+
+        result = asyncio.run(fetcher.poll_mobile_approval())
+
+        assert result.state == PageState.TWOFA_MOBILE
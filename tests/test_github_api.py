@@ -0,0 +1,277 @@
+"""
+Tests for the GitHub API client, against a mock HTTP transport.
+"""
+
+import gzip
+import json
+import time
+from collections.abc import Callable
+from email.utils import formatdate
+from pathlib import Path
+
+import httpx
+import pytest
+
+from ghinbox import github_api
+from ghinbox.github_api import GitHubAPI, save_response
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture
+def sent() -> list[httpx.Request]:
+    """Requests sent by the API client, answered by the test's handler."""
+    return []
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Seconds passed to time.sleep, which returns immediately."""
+    calls: list[float] = []
+    monkeypatch.setattr(github_api.time, "sleep", calls.append)
+    return calls
+
+
+def make_api(
+    monkeypatch: pytest.MonkeyPatch, sent: list[httpx.Request], handler: Handler
+) -> GitHubAPI:
+    """Create a GitHubAPI whose shared client answers with handler."""
+
+    def record(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return handler(request)
+
+    client = httpx.Client(transport=httpx.MockTransport(record))
+    monkeypatch.setattr(github_api, "_client", client)
+    return GitHubAPI("test-token")
+
+
+def rate_limited_once(status: int, headers: dict[str, str]) -> Handler:
+    """Handler that rejects the first request, then answers {"ok": true}."""
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(status, headers=headers)
+        return httpx.Response(200, json={"ok": True})
+
+    return handler
+
+
+class TestRateLimitRetry:
+    """Tests for waiting out GitHub rate limits."""
+
+    def test_retry_after_seconds(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        sent: list[httpx.Request],
+        sleeps: list[float],
+    ) -> None:
+        """Test that a 429 with Retry-After seconds is slept and retried."""
+        api = make_api(monkeypatch, sent, rate_limited_once(429, {"Retry-After": "7"}))
+
+        assert api.get("/user") == {"ok": True}
+        assert sleeps == [7.0]
+        assert len(sent) == 2
+
+    def test_retry_after_http_date(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        sent: list[httpx.Request],
+        sleeps: list[float],
+    ) -> None:
+        """Test that a 403 with an HTTP-date Retry-After is slept and retried."""
+        retry_at = formatdate(time.time() + 30, usegmt=True)
+        api = make_api(
+            monkeypatch, sent, rate_limited_once(403, {"Retry-After": retry_at})
+        )
+
+        assert api.get("/user") == {"ok": True}
+        assert len(sleeps) == 1
+        assert 28 <= sleeps[0] <= 30
+        assert len(sent) == 2
+
+    def test_exhausted_primary_limit(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        sent: list[httpx.Request],
+        sleeps: list[float],
+    ) -> None:
+        """Test that a 403 with no remaining quota waits for the reset."""
+        headers = {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 20),
+        }
+        api = make_api(monkeypatch, sent, rate_limited_once(403, headers))
+
+        assert api.get("/user") == {"ok": True}
+        assert len(sleeps) == 1
+        assert 18 <= sleeps[0] <= 20
+
+    def test_long_wait_raises(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        sent: list[httpx.Request],
+        sleeps: list[float],
+    ) -> None:
+        """Test that a wait over the limit raises instead of sleeping."""
+        api = make_api(
+            monkeypatch, sent, rate_limited_once(429, {"Retry-After": "120"})
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            api.get("/user")
+        assert sleeps == []
+        assert len(sent) == 1
+
+    def test_unparseable_header_raises(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        sent: list[httpx.Request],
+        sleeps: list[float],
+    ) -> None:
+        """Test that an unparseable Retry-After is treated as no hint."""
+        api = make_api(
+            monkeypatch, sent, rate_limited_once(429, {"Retry-After": "soon"})
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            api.get("/user")
+        assert sleeps == []
+        assert len(sent) == 1
+
+    def test_retries_only_once(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        sent: list[httpx.Request],
+        sleeps: list[float],
+    ) -> None:
+        """Test that a request still rate limited after one wait raises."""
+        api = make_api(
+            monkeypatch,
+            sent,
+            lambda request: httpx.Response(429, headers={"Retry-After": "1"}),
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            api.get("/user")
+        assert sleeps == [1.0]
+        assert len(sent) == 2
+
+
+def conditional(etag: str, last_modified: str) -> Handler:
+    """Handler that serves {"n": <request count>} with validators.
+
+    A request carrying the current ETag gets an empty 304.
+    """
+    count = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal count
+        count += 1
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            json={"n": count},
+            headers={"ETag": etag, "Last-Modified": last_modified},
+        )
+
+    return handler
+
+
+class TestConditionalGet:
+    """Tests for the ETag / Last-Modified GET cache."""
+
+    def test_revalidates_with_stored_validators(
+        self, monkeypatch: pytest.MonkeyPatch, sent: list[httpx.Request]
+    ) -> None:
+        """Test that a repeat GET is conditional and a 304 reuses the body."""
+        last_modified = "Wed, 14 Oct 2026 12:00:00 GMT"
+        api = make_api(monkeypatch, sent, conditional('"v1"', last_modified))
+
+        first = api.get("/notifications")
+        second = api.get("/notifications")
+
+        assert first == {"n": 1}
+        assert second is first
+        assert len(sent) == 2
+        assert "If-None-Match" not in sent[0].headers
+        assert sent[1].headers["If-None-Match"] == '"v1"'
+        assert sent[1].headers["If-Modified-Since"] == last_modified
+
+    def test_max_age_skips_request(
+        self, monkeypatch: pytest.MonkeyPatch, sent: list[httpx.Request]
+    ) -> None:
+        """Test that a response younger than max_age is reused unsent."""
+        api = make_api(monkeypatch, sent, conditional('"v1"', ""))
+
+        first = api.get("/notifications")
+
+        assert api.get("/notifications", max_age=60) is first
+        assert len(sent) == 1
+
+    def test_write_forces_revalidation(
+        self, monkeypatch: pytest.MonkeyPatch, sent: list[httpx.Request]
+    ) -> None:
+        """Test that a write makes the next GET go out despite max_age."""
+        api = make_api(monkeypatch, sent, conditional('"v1"', ""))
+
+        first = api.get("/notifications")
+        for write in (
+            lambda: api.put("/notifications"),
+            lambda: api.patch("/notifications/threads/1"),
+            lambda: api.delete("/notifications/threads/1/subscription"),
+        ):
+            write()
+            assert api.get("/notifications", max_age=60) is first
+            assert sent[-1].method == "GET"
+            assert sent[-1].headers["If-None-Match"] == '"v1"'
+        assert len(sent) == 7
+
+
+@pytest.fixture
+def responses_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Point save_response at a temporary directory with no saved digests."""
+    monkeypatch.setattr(github_api, "RESPONSES_DIR", tmp_path)
+    monkeypatch.setattr(github_api, "_saved_digests", {})
+    return tmp_path
+
+
+class TestSaveResponse:
+    """Tests for saving responses to disk."""
+
+    def test_uncompressed_json(self, responses_dir: Path) -> None:
+        """Test that a plain save writes the JSON as-is."""
+        path = save_response("snap", {"a": 1}, timestamp="20260101_000000")
+
+        assert path == responses_dir / "snap_20260101_000000.json"
+        assert json.loads(path.read_bytes()) == {"a": 1}
+
+    def test_compressed_round_trip(self, responses_dir: Path) -> None:
+        """Test that a compressed save writes a readable .gz file."""
+        path = save_response(
+            "snap", {"a": 1}, compress=True, timestamp="20260101_000000"
+        )
+
+        assert path == responses_dir / "snap_20260101_000000.json.gz"
+        assert json.loads(gzip.decompress(path.read_bytes())) == {"a": 1}
+
+    def test_identical_save_writes_ref(self, responses_dir: Path) -> None:
+        """Test that saving the same content again only writes a reference."""
+        first = save_response(
+            "snap", {"a": 1}, compress=True, timestamp="20260101_000000"
+        )
+        second = save_response(
+            "snap", {"a": 1}, compress=True, timestamp="20260101_000001"
+        )
+
+        assert second == first
+        ref = responses_dir / "snap_20260101_000001.json.ref"
+        assert ref.read_text() == f"{first.name}\n"
+        assert sorted(p.name for p in responses_dir.iterdir()) == [
+            first.name,
+            ref.name,
+        ]
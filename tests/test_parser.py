@@ -5,9 +5,12 @@ Unit tests for the HTML notifications parser.
 from pathlib import Path
 
 import pytest
+from bs4 import BeautifulSoup
 
 from ghinbox.parser.notifications import (
     extract_authenticity_token,
+    parse_first_notification_url,
+    parse_next_cursor,
     parse_notifications_html,
 )
 
@@ -223,6 +226,45 @@ class TestParseNotificationsHtml:
         assert result.generated_at >= now - timedelta(minutes=1)
 
 
+class TestParseFirstNotificationUrl:
+    """Tests for the lightweight first-row parser."""
+
+    def test_matches_full_parser(self, pagination_page1_html: str) -> None:
+        """Test that the first row agrees with parse_notifications_html."""
+        full = parse_notifications_html(pagination_page1_html, "owner", "repo")
+        first = full.notifications[0]
+
+        assert parse_first_notification_url(pagination_page1_html) == (
+            first.subject.url,
+            first.unread,
+            len(full.notifications),
+        )
+
+    def test_returns_none_without_notifications(self) -> None:
+        """Test that pages without notification rows return None."""
+        assert parse_first_notification_url("") is None
+        assert parse_first_notification_url("<html><body></body></html>") is None
+
+
+class TestParseNextCursor:
+    """Tests for the lightweight next-page cursor lookup."""
+
+    def test_matches_full_parser(
+        self, pagination_page1_html: str, pagination_page2_html: str
+    ) -> None:
+        """Test that the cursor agrees with parse_notifications_html."""
+        for html in (pagination_page1_html, pagination_page2_html):
+            full = parse_notifications_html(html, "owner", "repo")
+            assert parse_next_cursor(html) == full.pagination.after_cursor
+
+        assert parse_next_cursor(pagination_page1_html) is not None
+
+    def test_returns_none_without_next_link(self) -> None:
+        """Test that pages without a Next link return None."""
+        assert parse_next_cursor("") is None
+        assert parse_next_cursor("<html><body></body></html>") is None
+
+
 class TestIconStateMapping:
     """Tests for icon class to state mapping."""
 
@@ -346,3 +388,39 @@ class TestExtractAuthenticityToken:
         """
         token = extract_authenticity_token(html)
         assert token is None
+
+
+class TestMainFragment:
+    """The live fetcher returns only <main> (see MAIN_HTML_JS in fetcher.py)."""
+
+    @staticmethod
+    def main_outer_html(html: str) -> str:
+        """Mirror MAIN_HTML_JS: <main>'s outerHTML, else the <html> element's."""
+        soup = BeautifulSoup(html, "lxml")
+        main = soup.find("main")
+        return str(main if main is not None else soup.html)
+
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            "notification_after_done.html",
+            "notification_before_done.html",
+            "notifications_inbox.html",
+            "pagination_page2.html",
+            # No <main>: exercises the documentElement fallback
+            "pagination_page1.html",
+        ],
+    )
+    def test_main_parses_like_full_page(self, fixture: str) -> None:
+        """Test that parsing the fragment gives the same result as the page."""
+        html = (FIXTURES_DIR / fixture).read_text()
+
+        full = parse_notifications_html(html=html, owner="o", repo="r")
+        fragment = parse_notifications_html(
+            html=self.main_outer_html(html), owner="o", repo="r"
+        )
+
+        assert full.notifications
+        assert fragment.model_dump(exclude={"generated_at"}) == full.model_dump(
+            exclude={"generated_at"}
+        )